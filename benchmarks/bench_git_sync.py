@@ -0,0 +1,101 @@
+"""Journal git sync cost: always pull/add/commit/push vs change-aware git_sync.
+
+Run from the repo root: python benchmarks/bench_git_sync.py
+Uses a bare repository in a temporary directory as the remote. Over a network
+remote, each skipped pull/push also saves a round trip.
+"""
+import os
+import sys
+import subprocess
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.git_sync_service import git_sync
+
+ROUNDS = 10
+
+
+def git(*args, cwd=None):
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=False)
+
+
+def make_clone(remote, name):
+    path = os.path.join(TMP_DIR, name)
+    git("clone", remote, path)
+    git("config", "user.email", "bench@evove", cwd=path)
+    git("config", "user.name", "bench", cwd=path)
+    return path
+
+
+def setup():
+    remote = os.path.join(TMP_DIR, "remote.git")
+    git("init", "--bare", "-b", "main", remote)
+    journal = make_clone(remote, "journal")
+    git("checkout", "-b", "main", cwd=journal)
+    with open(os.path.join(journal, "evove26"), "w", encoding="utf-8") as f:
+        f.write("\n[01/01/2026]\n50 PUSHUPS\n")
+    git("add", ".", cwd=journal)
+    git("commit", "-m", "init", cwd=journal)
+    git("push", "-u", "origin", "main", cwd=journal)
+    return remote, journal
+
+
+def full_sync(repo_dir):
+    """The previous behaviour: every step, every time."""
+    git("pull", "--no-rebase", cwd=repo_dir)
+    git("add", ".", cwd=repo_dir)
+    git("commit", "-m", "sync", cwd=repo_dir)
+    git("push", cwd=repo_dir)
+
+
+def median_ms(fn):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def append_line(journal):
+    with open(os.path.join(journal, "evove26"), "a", encoding="utf-8") as f:
+        f.write("10 SQUATS\n")
+
+
+def main():
+    remote, journal = setup()
+    other = make_clone(remote, "other-device")
+
+    old = median_ms(lambda: full_sync(journal))
+    new = median_ms(lambda: git_sync(journal))
+    print(f"no changes      | full {old:7.1f}ms | change-aware {new:7.1f}ms")
+
+    old = median_ms(lambda: (append_line(journal), full_sync(journal)))
+    new = median_ms(lambda: (append_line(journal), git_sync(journal)))
+    print(f"one new line    | full {old:7.1f}ms | change-aware {new:7.1f}ms")
+
+    def remote_moved():
+        git("pull", cwd=other)
+        append_line(other)
+        git("commit", "-am", "other", cwd=other)
+        git("push", cwd=other)
+
+    timings = {}
+    remote_moved()
+    assert git_sync(journal, timings=timings) is True
+    assert git("rev-parse", "HEAD", cwd=journal).stdout == git("rev-parse", "HEAD", cwd=other).stdout
+    timings = {}
+    git_sync(journal, timings=timings)
+    print("no-op phases    | " + ", ".join(
+        f"{phase} {value}" if isinstance(value, str) else f"{phase} {value * 1000:.1f}ms"
+        for phase, value in timings.items()
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Per-operation cost of log id allocation and id lookups with 1k to 1M logs.
+
+Run from the repo root: python benchmarks/bench_journal_ids.py
+Logs, journal file and backups go to a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR  # keeps ~/journal and backups out of the real mirror
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.storage_service import JsonStorage
+from src.components.services.journal_service import JournalService
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+ROUNDS = 2000
+
+
+def build_journal(size):
+    storage = JsonStorage(os.path.join(TMP_DIR, f"data-{size}"))
+    first = 730001
+    storage.replace_rows("logs", [
+        {"id": first + i, "timestamp": "01 01 2026 : 00:00:00", "content": f"{i} PUSHUPS", "status": "[PROCESSED]"}
+        for i in range(size)
+    ])
+    start = time.perf_counter()
+    journal = JournalService(storage)
+    load_ms = (time.perf_counter() - start) * 1000
+    return journal, first, load_ms
+
+
+def check_legacy_rows():
+    """Id-less rows from an old logs.json get numbered once and aggregate once."""
+    storage = JsonStorage(os.path.join(TMP_DIR, "data-legacy"))
+    storage.replace_rows("logs", [
+        {"timestamp": "01 01 2026 : 00:00:00", "content": content, "status": "[TO PROCESS]"}
+        for content in ("10 PUSHUPS", "5 PUSHUPS")
+    ])
+    journal = JournalService(storage)
+    assert journal._status_index == {"[TO PROCESS]": [0, 1]}, journal._status_index
+    assert journal.process_daily_logs() == "Processed 2 entries."
+    assert [log["content"] for log in journal.logs if log["status"] == "[IN WAIT]"] == ["15 PUSHUPS"]
+    assert not journal._status_index["[TO PROCESS]"]
+
+
+def per_op_us(fn):
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        fn(i)
+    return (time.perf_counter() - start) / ROUNDS * 1_000_000
+
+
+def main():
+    check_legacy_rows()
+    print(f"{'logs':>9} | {'load':>9} | {'next id':>8} | {'find id':>8} | {'add_log':>8} | {'delete':>8}")
+    for size in SIZES:
+        journal, first, load_ms = build_journal(size)
+        next_id = per_op_us(lambda i: journal._next_log_id())
+        find = per_op_us(lambda i: journal._find_log(first + (i * 7919) % size))
+        add = per_op_us(lambda i: journal.add_log(f"{i} SQUATS", custom_status="[TO PROCESS]"))
+        # Soft deletes the freshly added entries (no evove26 rewrite for [TO PROCESS] logs)
+        delete = per_op_us(lambda i: journal.delete_log_by_id(first + size + i))
+        print(
+            f"{size:>9} | {load_ms:>7.0f}ms | {next_id:>6.2f}us | {find:>6.2f}us | "
+            f"{add:>6.1f}us | {delete:>6.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Last-header lookup and drop-last-entry on a generated 50 MB evove26.
+
+Run from the repo root: python benchmarks/bench_journal_tail.py
+The journal, logs and backups go to a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR  # ~/journal/evove26 is the generated file
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.storage_service import JsonStorage
+from src.components.services.journal_service import JournalService
+
+TARGET_BYTES = 50 * 1024 * 1024
+ROUNDS = 20
+
+
+def generate_journal(path):
+    day = datetime(2000, 1, 1)
+    size = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while size < TARGET_BYTES:
+            chunk = [f"\n{day.strftime('[%d/%m/%Y]')}\n"]
+            chunk.extend(f"{n * 5} PUSHUPS session {n} of the day, felt fine\n" for n in range(40))
+            text = "".join(chunk)
+            f.write(text)
+            size += len(text)
+            day += timedelta(days=1)
+    return size
+
+
+def full_read_last_header(path):
+    """The previous implementation: readlines() and walk back."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    for line in reversed(lines):
+        line = line.strip()
+        if line.startswith("[") and line.endswith("]") and len(line) == 12:
+            try:
+                datetime.strptime(line, "[%d/%m/%Y]")
+                return line
+            except ValueError:
+                continue
+    return None
+
+
+def full_rewrite_drop(path, content):
+    """The previous implementation: readlines(), pop the last match, rewrite everything."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    for i in range(len(lines) - 1, -1, -1):
+        if lines[i].strip() == content:
+            lines.pop(i)
+            break
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def median_ms(fn, rounds=ROUNDS):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    journal = JournalService(JsonStorage(os.path.join(TMP_DIR, "data")))
+    os.makedirs(journal.journal_dir, exist_ok=True)
+    size = generate_journal(journal.journal_file)
+    print(f"journal: {size / 1024 / 1024:.1f} MB")
+
+    old_header = median_ms(lambda: full_read_last_header(journal.journal_file), rounds=5)
+    new_header = median_ms(journal._get_last_file_date_header)
+    print(f"last header   | full read {old_header:9.2f}ms | tail seek {new_header:7.3f}ms")
+
+    def append_then(drop):
+        with open(journal.journal_file, "a", encoding="utf-8") as f:
+            f.write("BENCH ENTRY\n")
+        drop()
+
+    def new_drop():
+        found = journal._tail_seek(lambda line: line == "BENCH ENTRY")
+        journal._remove_journal_line(found[0])
+
+    old_drop = median_ms(lambda: append_then(lambda: full_rewrite_drop(journal.journal_file, "BENCH ENTRY")), rounds=5)
+    new_drop_ms = median_ms(lambda: append_then(new_drop))
+    print(f"drop last     | full rewrite {old_drop:6.2f}ms | tail cut {new_drop_ms:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""/api/log_suggestions cost: old full reverse scan vs the ranked prefix trie.
+
+Run from the repo root: python benchmarks/bench_log_suggestions.py
+Logs go to a temporary directory.
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.storage_service import JsonStorage
+from src.components.services.journal_service import JournalService
+from src.components.services.suggestion_service import SuggestionIndex, log_time
+
+LOGS = 100_000
+ROUNDS = 2000
+WORDS = ["PUSHUPS", "SQUATS", "RUN", "READ", "MEDITATE", "WATER", "STUDY", "WALK", "CODE", "SLEEP"]
+
+
+def make_logs():
+    rng = random.Random(7)
+    start = datetime.now() - timedelta(days=365)
+    logs = []
+    for i in range(LOGS):
+        when = start + timedelta(minutes=i * 5)
+        content = f"{rng.randint(1, 40) * 5} {rng.choice(WORDS)}"
+        logs.append({
+            "id": 730001 + i,
+            "timestamp": when.strftime("%d %m %Y : %H:%M:%S"),
+            "content": content,
+            "status": "[PROCESSED]",
+        })
+    return logs
+
+
+def full_scan(logs):
+    """The previous endpoint body (minus the disk reload)."""
+    suggestions = []
+    for entry in reversed(logs):
+        content = str(entry.get("content") or "").strip()
+        if content and content not in suggestions:
+            suggestions.append(content)
+        if len(suggestions) >= 60:
+            break
+    return suggestions
+
+
+def brute_scores(logs, prefix, half_life):
+    scores = {}
+    now = max(log_time(log["timestamp"]) for log in logs)
+    for log in logs:
+        key = log["content"].lower()
+        if key.startswith(prefix.lower()):
+            scores[key] = scores.get(key, 0.0) + 2 ** (-(now - log_time(log["timestamp"])) / half_life)
+    return scores
+
+
+def per_call_us(fn):
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        fn(i)
+    return (time.perf_counter() - start) / ROUNDS * 1_000_000
+
+
+def main():
+    storage = JsonStorage(os.path.join(TMP_DIR, "data"))
+    logs = make_logs()
+    storage.replace_rows("logs", logs)
+    start = time.perf_counter()
+    journal = JournalService(storage)
+    print(f"{LOGS} logs, load + index build {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    for prefix in ("", "5", "50 S", "100 RUN"):
+        scores = brute_scores(logs, prefix, journal._suggestions.half_life)
+        expected = sorted(scores.values(), reverse=True)[:SuggestionIndex.TOP_K]
+        got = [scores[text.lower()] for text in journal.log_suggestions(prefix)["suggestions"]]
+        # Ties may come back in any order: compare the ranked scores
+        assert all(abs(a - b) <= 1e-9 * max(a, 1) for a, b in zip(got, expected)) and len(got) == len(expected), prefix
+
+    old = per_call_us(lambda i: full_scan(journal.logs))
+    prefixes = ["", "5", "50 S", "100 RUN", "2", "35 MED"]
+    new = per_call_us(lambda i: journal.log_suggestions(prefixes[i % len(prefixes)]))
+    add = per_call_us(lambda i: journal._suggestions.add(f"{(i % 40) * 5} {WORDS[i % len(WORDS)]}"))
+    print(f"suggestions | full scan {old:8.1f}us | trie {new:6.1f}us | index add {add:5.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Whole-tree score math: per-object Python loops vs the columnar ScoreEngine.
+
+Run from the repo root: python benchmarks/bench_score_engine.py
+Runs the NumPy path when NumPy is installed, and the pure-Python fallback either way.
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.user.actions.action import Action
+from src.components.user.attributes.attribute import Attribute
+from src.components.services import score_engine_service
+from src.components.services.score_engine_service import ScoreEngine
+
+ACTIONS = 2000
+LEAVES = 150
+PARENTS = 30
+ROUNDS = 50
+
+
+def make_tree():
+    rng = random.Random(7)
+    actions = {}
+    for i in range(ACTIONS):
+        action = Action(f"5{i:04d}", f"a{i}", rng.randint(0, 6), rng.randint(0, 5), rng.randint(0, 5000))
+        actions[action.id] = action
+    pool = list(actions.values())
+    attributes = {}
+    leaves = []
+    for i in range(LEAVES):
+        attr = Attribute(f"8{i:03d}", f"leaf{i}")
+        for action in rng.sample(pool, 20):
+            attr.add_related_action(action)
+        attributes[attr._id] = attr
+        leaves.append(attr)
+    for i in range(PARENTS):
+        attr = Attribute(f"8{LEAVES + i:03d}", f"parent{i}")
+        for child in rng.sample(leaves, 5):
+            attr._children.append(child)
+        attributes[attr._id] = attr
+    return actions, attributes
+
+
+def loop_totals(actions, attributes):
+    """Per-object sums with nothing cached (what User.score/total_points did)."""
+    def score(a):
+        return a._value * a._TYPE_MAP[a._tipo]["factor"] * a._diff_multiplier
+
+    def power(attr):
+        return sum(score(a) for a in attr._related_actions)
+
+    totals = {
+        aid: sum(power(c) for c in attr._children) if attr._children else power(attr)
+        for aid, attr in attributes.items()
+    }
+    return {
+        "score": sum(totals.values()) / len(totals),
+        "total_points": sum(score(a) for a in actions.values()),
+        "attributes": totals,
+    }
+
+
+def per_call_ms(fn):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def close(a, b):
+    return abs(a - b) <= 1e-9 * max(abs(a), abs(b), 1)
+
+
+def check(expected, got):
+    assert close(expected["score"], got["score"])
+    assert close(expected["total_points"], got["total_points"])
+    assert all(close(expected["attributes"][k], v) for k, v in got["attributes"].items())
+
+
+def main():
+    actions, attributes = make_tree()
+    expected = loop_totals(actions, attributes)
+    bump = {aid: 10 for aid in list(actions)[::7]}
+
+    def loop_projection():
+        saved = {aid: actions[aid]._value for aid in bump}
+        for aid, amount in bump.items():
+            actions[aid]._value += amount
+        result = loop_totals(actions, attributes)
+        for aid, value in saved.items():
+            actions[aid]._value = value
+        return result
+
+    projected = loop_projection()
+    loop = per_call_ms(lambda: loop_totals(actions, attributes))
+    loop_what_if = per_call_ms(loop_projection)
+    print(f"{ACTIONS} actions, {LEAVES + PARENTS} attributes")
+    print(f"python loops   | totals {loop:7.2f}ms | what-if {loop_what_if:7.2f}ms")
+
+    numpy = score_engine_service.np
+    for label, module_np in (("numpy engine", numpy), ("list fallback", None)):
+        if label == "numpy engine" and numpy is None:
+            print("numpy engine   | NumPy not installed")
+            continue
+        score_engine_service.np = module_np
+        build = per_call_ms(lambda: ScoreEngine.build(actions, attributes))
+        engine = ScoreEngine.build(actions, attributes)
+        check(expected, engine.totals())
+        check(projected, engine.project(bump))
+        refresh = per_call_ms(lambda: engine.refresh(actions))
+        totals = per_call_ms(engine.totals)
+        what_if = per_call_ms(lambda: engine.project(bump))
+        print(f"{label:<14} | totals {totals:7.2f}ms | what-if {what_if:7.2f}ms | "
+              f"refresh {refresh:5.2f}ms | build {build:5.2f}ms")
+    score_engine_service.np = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Cost of one act's tag effects: full params x links scan vs the precomputed influence table.
+
+Run from the repo root: python benchmarks/bench_tag_effects.py
+User data goes to a temporary directory; saving is left out of the timings.
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.UI.interface import ui
+ui.web_mode = True
+
+from src.components.user.user import User
+from src.components.user.actions.action import Action
+from src.components.user.parameters.parameter import Parameter
+
+PARAMS = 500
+TAGS = 50
+ACTIONS = 100
+ROUNDS = 2000
+
+
+def scan_apply(user, action, value_difference):
+    """The previous _apply_tag_effects body (minus save_user)."""
+    action_tags = user._action_tags.get(action.id, [])
+    if not action_tags:
+        return
+    unit_factor = {0: 3.0, 1: 1.0, 2: 0.1, 3: 0.5, 4: 3.0, 5: 1.0, 6: 1.0}.get(action.type, 1.0)
+    action_tag_map = {}
+    for t in action_tags:
+        tid = t.get("tag_id")
+        try:
+            w = int(t.get("weight"))
+        except Exception:
+            w = 0
+        if tid:
+            action_tag_map[tid] = action_tag_map.get(tid, 0) + w
+    for param_id, param in user._parameters.items():
+        param_tags = user._param_tags.get(param_id, [])
+        if not param_tags:
+            continue
+        delta_total = 0.0
+        for pt in param_tags:
+            tid = pt.get("tag_id")
+            if tid not in action_tag_map:
+                continue
+            try:
+                pw = int(pt.get("weight"))
+            except Exception:
+                pw = 0
+            aw = action_tag_map.get(tid, 0)
+            if aw == 0 or pw == 0:
+                continue
+            base_value = 1.5 if param._value_type == 1 else 3.0
+            delta_total += value_difference * unit_factor * aw * pw * base_value
+        if delta_total != 0:
+            param.set_value(param._value + delta_total)
+            user._update_statuses_for_param(param)
+
+
+def make_user():
+    rng = random.Random(7)
+    user = User()
+    user.save_user = lambda: None
+    tags = [f"1{i:02d}" for i in range(TAGS)]
+    for i in range(PARAMS):
+        pid = f"6{i:03d}"
+        user._parameters[pid] = Parameter(pid, f"p{i}", rng.choice([1, 2]), rng.choice([1, 2, 3]), value=50)
+        user._param_tags[pid] = [
+            {"tag_id": tid, "weight": rng.choice([-3, -2, -1, 1, 2, 3])} for tid in rng.sample(tags, 3)
+        ]
+    for i in range(ACTIONS):
+        action = Action(f"5{i:02d}", f"a{i}", rng.randint(0, 6), rng.randint(0, 5), 0)
+        user._actions[action.id] = action
+        user._action_tags[action.id] = [
+            {"tag_id": tid, "weight": rng.choice([-3, -2, -1, 1, 2, 3])} for tid in rng.sample(tags, 2)
+        ]
+    user._tag_influence = None
+    return user
+
+
+def snapshot(user):
+    return {pid: p._value for pid, p in user._parameters.items()}
+
+
+def per_call_us(fn):
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        fn(i)
+    return (time.perf_counter() - start) / ROUNDS * 1_000_000
+
+
+def main():
+    user = make_user()
+    actions = list(user._actions.values())
+    baseline = snapshot(user)
+
+    for i, action in enumerate(actions):
+        scan_apply(user, action, i % 5 - 2)
+    expected = snapshot(user)
+    for pid, value in baseline.items():
+        user._parameters[pid]._value = value
+    for i, action in enumerate(actions):
+        user._apply_tag_effects(action, i % 5 - 2)
+    got = snapshot(user)
+    assert all(abs(expected[pid] - got[pid]) <= 1e-9 * max(abs(got[pid]), 1) for pid in got)
+
+    start = time.perf_counter()
+    user._tag_influence = None
+    table = user._tag_influence_table()
+    build = (time.perf_counter() - start) * 1000
+    reached = sum(len(v) for v in table.values()) / len(table)
+
+    old = per_call_us(lambda i: scan_apply(user, actions[i % ACTIONS], 1))
+    new = per_call_us(lambda i: user._apply_tag_effects(actions[i % ACTIONS], 1))
+    print(f"{PARAMS} params x {TAGS} tags, {ACTIONS} tagged actions (~{reached:.0f} params reached per act)")
+    print(f"per act | full scan {old:8.1f}us | influence table {new:6.1f}us | table build {build:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
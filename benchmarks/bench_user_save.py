@@ -0,0 +1,82 @@
+"""Save latency for User profiles with 10, 100 and 1000 entities.
+
+Run from the repo root: python benchmarks/bench_user_save.py
+Data, journal and backups go to a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import time
+
+TMP_DIR = tempfile.mkdtemp(prefix="evove-bench-")
+os.environ["HOME"] = TMP_DIR  # keeps ~/journal backups out of the real mirror
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.components.services.UI.interface import ui
+from src.components.services.storage_service import JsonStorage
+from src.components.user.user import User
+from src.components.user.actions.action import Action
+from src.components.user.attributes.attribute import Attribute
+from src.components.user.parameters.parameter import Parameter
+from src.components.user.statuses.status import Status
+from src.components.user.tags.tag import Tag
+
+ui.web_mode = True
+SIZES = (10, 100, 1000)
+ROUNDS = 50
+
+
+def build_profile(size):
+    u = User(JsonStorage(os.path.join(TMP_DIR, f"data-{size}")))
+    n_actions = max(1, size * 4 // 10)
+    n_attrs = max(1, size * 2 // 10)
+    n_params = max(1, size * 2 // 10)
+    n_small = max(1, size // 10)
+    for i in range(n_actions):
+        aid = f"5{i:04d}"
+        u._actions[aid] = Action(aid, f"action {i}", 1, 1 + i % 5, i)
+    actions = list(u._actions.values())
+    for i in range(n_attrs):
+        attr = Attribute(f"8{i:04d}", f"attr {i}")
+        for action in actions[i::n_attrs]:
+            attr.add_related_action(action)
+        u._attributes[attr._id] = attr
+    for i in range(n_params):
+        pid = f"6{i:04d}"
+        u._parameters[pid] = Parameter(pid, f"param {i}", 1 + i % 2, 1, 0)
+    for i in range(n_small):
+        sid = f"4{i:04d}"
+        u._statuses[sid] = Status(sid, f"status {i}", i % 4)
+        tid = f"1{i:04d}"
+        u._tags[tid] = Tag(tid, f"tag {i}")
+    u.save_user()
+    return u, actions[0]
+
+
+def median_ms(fn):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    print(f"{'entities':>9} | {'no-op save':>11} | {'1 change':>9} | {'full snapshot':>13}")
+    for size in SIZES:
+        u, action = build_profile(size)
+
+        def one_change():
+            action._value += 1
+            u.save_user()
+
+        noop = median_ms(u.save_user)
+        change = median_ms(one_change)
+        snapshot = median_ms(lambda: u._storage.write_document("user", u._snapshot_data()))
+        print(f"{size:>9} | {noop:>9.3f}ms | {change:>7.3f}ms | {snapshot:>11.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
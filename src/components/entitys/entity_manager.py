@@ -88,6 +88,27 @@ class EntityManager:
         
         return False
     
+    def register_jobs(self, scheduler):
+        """Spawn checks run when due instead of on every keystroke.
+
+        With an entity around nothing is time-driven (abandonment follows satisfaction),
+        so the job idles until woken after a command; without one it waits for the
+        next 12h spawn window.
+        """
+        from datetime import datetime
+        scheduler.register("entity_spawn", self._spawn_job, due=datetime.now())
+
+    def _spawn_job(self, now):
+        from src.components.data.constants import user
+        from datetime import datetime, timedelta
+        self.check_and_spawn()
+        if self.current_entity or not user.metadata.get("virtual_agent_active", True):
+            return None
+        last_check_str = user.metadata.get("last_spawn_check")
+        if not last_check_str:
+            return now
+        return datetime.fromisoformat(last_check_str) + timedelta(hours=12, seconds=1)
+
     def get_entity(self):
         """Returns the current entity"""
         return self.current_entity
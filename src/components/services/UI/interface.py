@@ -203,7 +203,7 @@ class UI:
                 print(msg)
         if wait:
             print(f"\n{self.GREEN}[ Press any key to continue ]{self.CLR}")
-            readchar.readkey()
+            self.read_key()
 
     def show_list(self, items, title, limit=20):
         if self.web_mode:
@@ -217,7 +217,7 @@ class UI:
             print(f"{self.CYAN}{self.BOLD}{' ' * 8}{title}{self.CLR}\n")
             print(f"{self.WHITE}No items to display.{self.CLR}")
             print(f"\n{self.GREEN}[ Press any key to continue ]{self.CLR}")
-            readchar.readkey()
+            self.read_key()
             return
 
         # Split items into pages
@@ -263,18 +263,19 @@ class UI:
                     print(f"\n{self.YELLOW}>>> Cycling pages every 1s... Press any key to stop <<<{self.CLR}")
                 else:
                     print(f"\n{self.GREEN}[ Press any key to continue ]{self.CLR}")
-                    readchar.readkey()
+                    self.read_key()
                     return
 
                 if stop_event and stop_event.is_set():
                     return
 
-                time.sleep(1)
+                with self._idle():
+                    time.sleep(1)
                 page_idx = (page_idx + 1) % num_pages
         except Exception as e:
             # Fallback if cycling fails (e.g. terminal issues)
             print(f"\nError: {e}")
-            readchar.readkey()
+            self.read_key()
 
     def ask_confirmation(self, message):
         """Asks for a 3-digit random code confirmation"""
@@ -293,7 +294,7 @@ class UI:
         
         user_input = ""
         for _ in range(3):
-            char = readchar.readkey()
+            char = self.read_key()
             if char.isdigit():
                 user_input += char
                 print(char, end="", flush=True)
@@ -313,6 +314,16 @@ class UI:
             time.sleep(1.0)
             return False
 
+    def _idle(self):
+        # Background jobs (refills, expiries, spawns) keep running while the terminal waits on the user
+        from src.components.services.scheduler_service import scheduler
+        return scheduler.idle()
+
+    def read_key(self):
+        """Blocking key read that lets scheduler jobs run meanwhile."""
+        with self._idle():
+            return readchar.readkey()
+
     def clear_screen(self):
         os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -322,7 +333,7 @@ class UI:
         print(f"{self.CYAN}{self.BOLD}{' ' * 4}{title}{self.CLR}\n")
         self.print_tree(nodes)
         print(f"\n{self.WHITE}[ Press any key to return ]{self.CLR}")
-        readchar.readkey()
+        self.read_key()
 
     def print_tree(self, nodes):
         """Prints tree without clearing or waiting"""
@@ -355,7 +366,7 @@ class UI:
             print(f"\n{footer}")
             
         print(f"\n{self.CYAN}Selection: {self.CLR}", end="", flush=True)
-        return readchar.readkey()
+        return self.read_key()
 
     def render(self, buffer, skip_clear=False, show_animated=False):
         if self.web_mode:
@@ -1,31 +1,22 @@
-import os
-import json
 from datetime import datetime, time
+from src.components.services.storage_service import storage, CorruptDocument
 
 
 class AgendaService:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_path = os.path.join(base_dir, "data", "agenda.json")
         self.agenda = self._load_data()
 
     def _load_data(self):
-        if os.path.exists(self.data_path):
-            try:
-                with open(self.data_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {"agenda": []}
-        return {"agenda": []}
+        try:
+            data = storage.read_document("agenda")
+        except CorruptDocument:
+            data = None
+        return data or {"agenda": []}
 
     def _save_data(self):
         try:
-            os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(self.agenda, f, indent=4)
-            from src.components.services.backup_service import backup_json
-            backup_json(self.data_path)
-        except IOError as exc:
+            storage.write_document("agenda", self.agenda)
+        except Exception as exc:
             print(f"Error saving agenda: {exc}")
 
     def _format_time(self, value):
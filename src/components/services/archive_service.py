@@ -0,0 +1,144 @@
+import os
+import gzip
+import json
+from datetime import datetime
+
+
+class LogArchive:
+    """Cold log rows moved out of the hot logs table, one gzip JSONL file per month.
+
+    Layout: <archive_dir>/logs-YYYY-MM.jsonl.gz plus logs-archive.json, which maps each
+    month to its file and id range so a lookup by id opens only the candidate months.
+    Both caches are checked against the files' size/mtime, since the other process
+    (CLI/web) may archive too. Unreadable files raise (OSError, EOFError, ValueError).
+    """
+
+    INDEX_FILE = "logs-archive.json"
+
+    def __init__(self, archive_dir):
+        self.archive_dir = archive_dir
+        self._index = None
+        self._index_stat = None
+        self._cached = (None, None, None)  # (month, file stat, rows) of the last file read
+
+    # ---------- queries ----------
+    def months(self):
+        return dict(self._load_index())
+
+    def max_id(self):
+        return max((entry["max_id"] for entry in self._load_index().values()), default=0)
+
+    def find(self, log_id):
+        """(month, row) of an archived log, or None."""
+        try:
+            log_id = int(log_id)
+        except (TypeError, ValueError):
+            return None
+        for month, entry in sorted(self._load_index().items(), reverse=True):
+            if entry["min_id"] <= log_id <= entry["max_id"]:
+                for row in self._read(month):
+                    if row.get("id") == log_id:
+                        return month, row
+        return None
+
+    # ---------- writes ----------
+    def archive(self, rows):
+        """Merges `rows` into their month files (a row already archived is replaced by id)."""
+        by_month = {}
+        for row in rows:
+            by_month.setdefault(self.month_of(row), []).append(row)
+        index = self._load_index()
+        for month, new_rows in by_month.items():
+            merged = {row.get("id"): row for row in self._read(month)} if month in index else {}
+            for row in new_rows:
+                merged[row.get("id")] = row
+            self._write(month, sorted(merged.values(), key=lambda row: row.get("id") or 0))
+        return sum(len(new_rows) for new_rows in by_month.values())
+
+    def update(self, log_id, fields):
+        """Overwrites fields of an archived row; False if the id is not archived."""
+        found = self.find(log_id)
+        if not found:
+            return False
+        month, row = found
+        rows = self._read(month)
+        row.update(fields)
+        self._write(month, rows)
+        return True
+
+    @staticmethod
+    def month_of(row):
+        try:
+            return datetime.strptime(row.get("timestamp", ""), "%d %m %Y : %H:%M:%S").strftime("%Y-%m")
+        except (TypeError, ValueError):
+            return "undated"
+
+    # ---------- files ----------
+    def _path(self, month):
+        return os.path.join(self.archive_dir, f"logs-{month}.jsonl.gz")
+
+    def _read(self, month):
+        path = self._path(month)
+        stat = self._file_stat(path)
+        if self._cached[0] == month and self._cached[1] == stat:
+            return self._cached[2]
+        rows = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    rows.append(json.loads(line))
+        self._cached = (month, stat, rows)
+        return rows
+
+    def _write(self, month, rows):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = self._path(month)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write("".join(json.dumps(row) + "\n" for row in rows))
+        os.replace(tmp_path, path)
+        self._cached = (month, self._file_stat(path), rows)
+
+        ids = [row.get("id") for row in rows if isinstance(row.get("id"), int)]
+        index = self._load_index()
+        index[month] = {
+            "file": os.path.basename(path),
+            "min_id": min(ids, default=0),
+            "max_id": max(ids, default=0),
+            "count": len(rows),
+        }
+        self._save_index()
+        self._backup(path)
+
+    def _load_index(self):
+        path = os.path.join(self.archive_dir, self.INDEX_FILE)
+        stat = self._file_stat(path)
+        if self._index is None or stat != self._index_stat:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._index = {}
+            self._index_stat = stat
+        return self._index
+
+    def _save_index(self):
+        path = os.path.join(self.archive_dir, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=4, sort_keys=True)
+        os.replace(tmp_path, path)
+        self._index_stat = self._file_stat(path)
+        self._backup(path)
+
+    @staticmethod
+    def _file_stat(path):
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+
+    def _backup(self, path):
+        from src.components.services.backup_service import backup_json
+        backup_json(path)
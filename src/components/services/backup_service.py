@@ -1,18 +1,464 @@
 import os
+import sys
+import json
+import time
+import zlib
+import atexit
 import shutil
+import difflib
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+
+BACKUP_DIR = "~/journal/evove"
+# Versions and restores stay out of the git-synced journal tree
+HISTORY_DIR = "~/.cache/evove/history"
+RESTORE_DIR = "~/.cache/evove/restored"
+LEGACY_HISTORY_DIR = "~/journal/evove/history"
+
+
+class BackupHistory:
+    """Time-bucketed versions of each mirrored file: hourly for a day, daily for a month.
+
+    Versions are zlib-compressed line deltas against the previous version, with a full
+    keyframe every KEYFRAME_EVERY versions so a restore reads at most one chain segment.
+    Layout: history/<file name>/index.json + <seq>.z
+    """
+
+    HOURLY_SPAN = timedelta(hours=24)
+    DAILY_SPAN = timedelta(days=30)
+    KEYFRAME_EVERY = 8
+
+    def __init__(self, history_dir=HISTORY_DIR):
+        self.history_dir = history_dir
+        self._lock = threading.RLock()
+        self._cache = {}  # name -> {seq: content} for the last versions touched
+        self._root = None
+
+    # ---------- public ----------
+    def record(self, name, content, when=None):
+        """Adds `content` (bytes) as the newest version; the newest version of an hour replaces older ones."""
+        when = when or datetime.now()
+        with self._lock:
+            index = self._load_index(name)
+            versions = index["versions"]
+            digest = hashlib.sha256(content).hexdigest()
+            if versions and versions[-1]["sha"] == digest:
+                return False
+            stale = []
+            if versions and self._hour(versions[-1]["ts"]) == when.strftime("%Y%m%d%H"):
+                stale.append(versions.pop())
+            self._append(name, index, content, when, digest)
+            stale.extend(self._prune(name, index, when))
+            self._save_index(name, index)
+            for version in stale:
+                self._remove_blob(name, version)
+            return True
+
+    def versions(self, name):
+        with self._lock:
+            return list(self._load_index(name)["versions"])
+
+    def names(self):
+        root = self._history_root()
+        if not os.path.isdir(root):
+            return []
+        return sorted(os.listdir(root))
+
+    def restore(self, name, when=None):
+        """Content of `name` as of `when` (latest version at or before it), or None."""
+        with self._lock:
+            versions = self._load_index(name)["versions"]
+            if when is not None:
+                cutoff = when.isoformat()
+                versions = [v for v in versions if v["ts"] <= cutoff]
+            if not versions:
+                return None
+            return self._materialize(name, versions, len(versions) - 1)
+
+    # ---------- chain ----------
+    def _append(self, name, index, content, when, digest):
+        version = {"ts": when.isoformat(), "sha": digest}
+        index["versions"].append(self._encode(name, index, index["versions"], content, version))
+
+    def _encode(self, name, index, chain, content, version):
+        """Stores `content` as a delta on top of `chain` (or a keyframe) and returns the version entry."""
+        since_key = 0
+        for previous in reversed(chain):
+            if previous["kind"] == "key":
+                break
+            since_key += 1
+        kind, blob = "key", zlib.compress(content)
+        if chain and since_key + 1 < self.KEYFRAME_EVERY:
+            base = self._materialize(name, chain, len(chain) - 1)
+            delta = zlib.compress(json.dumps(self._diff(base, content)).encode("utf-8"))
+            # A delta bigger than the full copy is not worth chaining
+            if len(delta) < len(blob):
+                kind, blob = "delta", delta
+        seq = index["next"]
+        index["next"] = seq + 1
+        path = self._blob_path(name, seq)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(blob)
+        self._remember(name, seq, content)
+        return {"seq": seq, "ts": version["ts"], "kind": kind, "sha": version["sha"]}
+
+    def _prune(self, name, index, now):
+        """Thins versions past the hourly span to one per day and drops those past the daily span."""
+        versions = index["versions"]
+        hourly_from = (now - self.HOURLY_SPAN).isoformat()
+        daily_from = (now - self.DAILY_SPAN).isoformat()
+        keep = set()
+        last_of_day = {}
+        for i, version in enumerate(versions):
+            if version["ts"] >= hourly_from:
+                keep.add(i)
+            elif version["ts"] >= daily_from:
+                last_of_day[version["ts"][:10]] = i
+        keep |= set(last_of_day.values())
+        if len(keep) == len(versions):
+            return []
+
+        # Only a delta whose predecessor disappears has to be re-encoded
+        stale = []
+        kept = []
+        gap = False
+        for i, version in enumerate(versions):
+            if i not in keep:
+                stale.append(version)
+                gap = True
+                continue
+            if gap and version["kind"] == "delta":
+                content = self._materialize(name, versions, i)
+                stale.append(version)
+                version = self._encode(name, index, kept, content, version)
+            kept.append(version)
+            gap = False
+        index["versions"] = kept
+        return stale
+
+    def _materialize(self, name, versions, position):
+        cached = self._cache.get(name, {}).get(versions[position]["seq"])
+        if cached is not None:
+            return cached
+        start = position
+        while start > 0 and versions[start]["kind"] != "key":
+            start -= 1
+        content = None
+        for version in versions[start:position + 1]:
+            with open(self._blob_path(name, version["seq"]), "rb") as f:
+                blob = zlib.decompress(f.read())
+            if version["kind"] == "key":
+                content = blob
+            else:
+                content = self._patch(content, json.loads(blob))
+        return content
+
+    def _diff(self, previous, content):
+        """Line ops against `previous`: [0, i1, i2] copies previous lines, [1, lines] inserts."""
+        old = self._lines(previous)
+        if (not previous or previous.endswith(b"\n")) and content.startswith(previous):
+            # Append-only files (logs.jsonl): only the new tail needs diffing
+            tail = self._lines(content[len(previous):])
+            return ([[0, 0, len(old)]] if old else []) + ([[1, tail]] if tail else [])
+        new = self._lines(content)
+        ops = []
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append([0, i1, i2])
+            elif j2 > j1:
+                ops.append([1, new[j1:j2]])
+        return ops
+
+    def _patch(self, previous, ops):
+        old = self._lines(previous)
+        out = []
+        for op in ops:
+            if op[0] == 0:
+                out.extend(old[op[1]:op[2]])
+            else:
+                out.extend(op[1])
+        return "".join(out).encode("utf-8", "surrogateescape")
+
+    # ---------- files ----------
+    def _lines(self, content):
+        return content.decode("utf-8", "surrogateescape").splitlines(keepends=True)
+
+    def _hour(self, ts):
+        return datetime.fromisoformat(ts).strftime("%Y%m%d%H")
+
+    def _remember(self, name, seq, content):
+        cache = self._cache.setdefault(name, {})
+        cache[seq] = content
+        for old in sorted(cache)[:-2]:
+            del cache[old]
+
+    def _history_root(self):
+        if self._root is None:
+            root = os.path.expanduser(self.history_dir)
+            legacy = os.path.expanduser(LEGACY_HISTORY_DIR)
+            # Earlier versions kept history inside ~/journal; move it out once.
+            # On failure the error reaches the caller and the move is retried next time,
+            # instead of starting an empty history beside the old one.
+            if self.history_dir == HISTORY_DIR and os.path.isdir(legacy) and not os.path.exists(root):
+                os.makedirs(os.path.dirname(root), exist_ok=True)
+                shutil.move(legacy, root)
+            self._root = root
+        return self._root
+
+    def _dir(self, name):
+        return os.path.join(self._history_root(), name)
+
+    def _blob_path(self, name, seq):
+        return os.path.join(self._dir(name), f"{seq:06d}.z")
+
+    def _remove_blob(self, name, version):
+        self._cache.get(name, {}).pop(version["seq"], None)
+        try:
+            os.remove(self._blob_path(name, version["seq"]))
+        except OSError:
+            pass
+
+    def _load_index(self, name):
+        path = os.path.join(self._dir(name), "index.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {"next": 1, "versions": []}
+
+    def _save_index(self, name, index):
+        path = os.path.join(self._dir(name), "index.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+class BackupWorker:
+    """Copies saved files into ~/journal/evove/ off the request path.
+
+    Repeated saves of the same file inside the debounce window collapse into one copy,
+    and a copy is skipped when the content hash matches the last one mirrored.
+    """
+
+    DEBOUNCE_SECONDS = 2.0
+
+    def __init__(self, backup_dir=BACKUP_DIR, debounce=None, history=None):
+        self.backup_dir = backup_dir
+        self.history = history
+        self.debounce = self.DEBOUNCE_SECONDS if debounce is None else debounce
+        self._cond = threading.Condition()
+        self._pending = {}  # src_path -> (first_requested, due)
+        self._hashes = {}   # src_path -> sha256 of the last mirrored content
+        self._busy = 0
+        self._thread = None
+        self._stopping = False
+        self.copied = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_error = None
+        self.last_lag = 0.0
+
+    def submit(self, src_path):
+        if not src_path:
+            return
+        now = time.monotonic()
+        with self._cond:
+            if src_path in self._pending:
+                first, _ = self._pending[src_path]
+                self.coalesced += 1
+            else:
+                first = now
+            # Debounce: wait for the file to settle, but never hold a copy longer than 5 windows
+            due = min(now + self.debounce, first + self.debounce * 5)
+            self._pending[src_path] = (first, due)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def flush(self, timeout=10.0):
+        """Copies everything pending now. Returns False if it did not finish in time."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            for path, (first, _) in list(self._pending.items()):
+                self._pending[path] = (first, 0)
+            self._cond.notify()
+            while self._pending or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._thread is None:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, timeout=10.0):
+        done = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        return done
+
+    def stats(self):
+        now = time.monotonic()
+        with self._cond:
+            oldest = min((first for first, _ in self._pending.values()), default=None)
+            return {
+                "queue_depth": len(self._pending),
+                "lag_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                "last_lag_seconds": round(self.last_lag, 3),
+                "copied": self.copied,
+                "skipped": self.skipped,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="evove-backup", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping and not self._pending:
+                        self._thread = None
+                        self._cond.notify_all()
+                        return
+                    now = time.monotonic()
+                    ready = [p for p, (_, due) in self._pending.items() if due <= now]
+                    if ready:
+                        break
+                    wait = min((due for _, due in self._pending.values()), default=now + 60) - now
+                    self._cond.wait(max(wait, 0.01))
+                batch = [(p, self._pending.pop(p)[0]) for p in ready]
+                self._busy += 1
+            try:
+                for path, first in batch:
+                    self._copy(path)
+                    self.last_lag = time.monotonic() - first
+            finally:
+                with self._cond:
+                    self._busy -= 1
+                    self._cond.notify_all()
+
+    def _copy(self, src_path):
+        try:
+            if not os.path.exists(src_path):
+                return
+            with open(src_path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            backup_dir = os.path.expanduser(self.backup_dir)
+            dest_path = os.path.join(backup_dir, os.path.basename(src_path))
+            if self._hashes.get(src_path) == digest and os.path.exists(dest_path):
+                self.skipped += 1
+                return
+            os.makedirs(backup_dir, exist_ok=True)
+            tmp_path = f"{dest_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            shutil.copystat(src_path, tmp_path)
+            os.replace(tmp_path, dest_path)
+            self._hashes[src_path] = digest
+            self.copied += 1
+            # Compressed archives are append-mostly cold data: the mirror copy is enough
+            if self.history is not None and not src_path.endswith(".gz"):
+                self._record_history(src_path, content)
+        except Exception as e:
+            # Backup failures should not break normal saves; they show up in stats()
+            self.errors += 1
+            self.last_error = str(e)
+
+
+    def _record_history(self, src_path, content):
+        snapshot_path = src_path[:-len(".wal")] if src_path.endswith(".wal") else src_path
+        if os.path.exists(f"{snapshot_path}.wal"):
+            # A snapshot with a delta log is versioned with the log folded in
+            from src.components.services.wal_service import WriteAheadLog
+            try:
+                with open(snapshot_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return
+            WriteAheadLog(snapshot_path).replay(data)
+            content = json.dumps(data, indent=4).encode("utf-8")
+        self.history.record(os.path.basename(snapshot_path), content)
+
+
+backup_history = BackupHistory()
+backup_worker = BackupWorker(history=backup_history)
+atexit.register(backup_worker.shutdown)
 
 
 def backup_json(src_path: str):
-    """Mirror JSON saves from data/ into ~/journal/evove/."""
-    if not src_path:
-        return
+    """Queue a mirror of a JSON save from data/ into ~/journal/evove/."""
+    backup_worker.submit(src_path)
+
+
+def backup_sqlite(conn, name: str = "evove.db"):
+    """Consistent copy of a live SQLite database into ~/journal/evove/."""
     try:
-        if not os.path.exists(src_path):
-            return
-        backup_dir = os.path.expanduser("~/journal/evove")
+        import sqlite3
+        backup_dir = os.path.expanduser(BACKUP_DIR)
         os.makedirs(backup_dir, exist_ok=True)
-        dest_path = os.path.join(backup_dir, os.path.basename(src_path))
-        shutil.copy2(src_path, dest_path)
+        dest = sqlite3.connect(os.path.join(backup_dir, name))
+        try:
+            conn.backup(dest)
+        finally:
+            dest.close()
     except Exception:
         # Backup failures should not break normal saves
         return
+
+
+def _data_dir():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, "data")
+
+
+def restore_backup(name, when=None, apply=False):
+    """Rebuilds `name` as of `when` into ~/.cache/evove/restored/ (or over data/ with apply)."""
+    content = backup_history.restore(name, when)
+    if content is None:
+        return f"No version of {name} at or before {when or 'now'}."
+    if apply:
+        dest_path = os.path.join(_data_dir(), name)
+        # Any delta log belongs to the state being replaced
+        wal_path = f"{dest_path}.wal"
+        if os.path.exists(wal_path):
+            os.remove(wal_path)
+    else:
+        dest_path = os.path.join(os.path.expanduser(RESTORE_DIR), name)
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    tmp_path = f"{dest_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, dest_path)
+    return f"Restored {name} ({len(content)} bytes) to {dest_path}."
+
+
+if __name__ == "__main__":
+    # python -m src.components.services.backup_service list [name]
+    # python -m src.components.services.backup_service restore <name> [YYYY-MM-DDTHH:MM] [--apply]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if args and args[0] == "list":
+        for name in ([args[1]] if len(args) > 1 else backup_history.names()):
+            for version in backup_history.versions(name):
+                print(f"{name} {version['ts']} {version['kind']}")
+    elif len(args) >= 2 and args[0] == "restore":
+        try:
+            when = datetime.fromisoformat(args[2]) if len(args) > 2 else None
+        except ValueError:
+            print(f"Invalid time: {args[2]}")
+        else:
+            print(restore_backup(args[1], when, apply="--apply" in sys.argv))
+    else:
+        print("usage: python -m src.components.services.backup_service list [name]")
+        print("       python -m src.components.services.backup_service restore <name> [YYYY-MM-DDTHH:MM] [--apply]")
@@ -18,14 +18,18 @@ class ChallengeManager:
         self.active_challenge = None
         self.deadline = None
         self.challenge_duration = 30 # seconds
+        self._scheduler = None
         self._initialized = True
 
-    def update(self):
-        """Checks if a new challenge should start or if an active one expired"""
-        self._check_daily_refill()
+    def register_jobs(self, scheduler):
+        """Deadlines are scheduled when a challenge starts (daily refill is a user job)."""
+        self._scheduler = scheduler
+        scheduler.register("challenge_deadline", self._deadline_job)
 
+    def update(self):
+        """Chance to start a challenge (rolled per keystroke); without a scheduler also checks the deadline"""
         if self.active_challenge:
-            if time.time() > self.deadline:
+            if self._scheduler is None and time.time() > self.deadline:
                 self._fail_challenge("TIMEOUT")
             return
         
@@ -36,12 +40,13 @@ class ChallengeManager:
             if random.random() < 0.0005: 
                 self._generate_challenge(entity)
 
-    def _check_daily_refill(self):
-        """Refill once per day when date changes"""
-        if not self.user: 
-            return
-
-        self.user.refill_daily_tokens()
+    def _deadline_job(self, now):
+        if not self.active_challenge:
+            return None
+        if now.timestamp() >= self.deadline:
+            self._fail_challenge("TIMEOUT")
+            return None
+        return datetime.fromtimestamp(self.deadline)
 
     def _generate_challenge(self, entity):
         if not self.user or not self.user._actions:
@@ -60,6 +65,8 @@ class ChallengeManager:
             "entity_name": entity.__class__.__name__
         }
         self.deadline = time.time() + self.challenge_duration
+        if self._scheduler is not None:
+            self._scheduler.schedule("challenge_deadline", datetime.fromtimestamp(self.deadline))
         entity.add_message(f"!!! CHALLENGE !!!")
         entity.add_message(f"{entity.__class__.__name__.upper()}: DO 30 {action.name.upper()}S IN 30 SECONDS!")
 
@@ -0,0 +1,93 @@
+import os
+import json
+import bisect
+
+
+class CompletionUsage:
+    """How often each name was picked at a prompt; persisted as a small cache file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._counts = None
+
+    @property
+    def counts(self):
+        if self._counts is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._counts = {k: int(v) for k, v in data.items()} if isinstance(data, dict) else {}
+            except (OSError, ValueError, TypeError, AttributeError):
+                self._counts = {}
+        return self._counts
+
+    def record(self, name):
+        counts = self.counts
+        counts[name] = counts.get(name, 0) + 1
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(counts, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Only ranking is lost
+            pass
+
+
+class NameCompleter:
+    """readline completer over a fixed set of names, built once per prompt.
+
+    Names are kept sorted case-folded, so prefix matches are one bisect range. When no
+    name starts with the text, names containing its letters in order (fuzzy
+    subsequence) are offered instead. Both are ranked by usage count.
+    """
+
+    def __init__(self, names, usage=None):
+        self._usage = usage if usage is not None else {}
+        pairs = sorted({(name.casefold(), name) for name in names if name})
+        self._folded = [folded for folded, _ in pairs]
+        self._names = [name for _, name in pairs]
+        self._known = set(self._names)
+        self._last = (None, [])
+
+    def __contains__(self, name):
+        return name in self._known
+
+    def matches(self, text):
+        folded = text.casefold()
+        lo = bisect.bisect_left(self._folded, folded)
+        hi = bisect.bisect_left(self._folded, folded + "\U0010ffff", lo)
+        if lo < hi:
+            found = self._names[lo:hi]
+            # Stable sort: equal usage keeps alphabetical order
+            return sorted(found, key=lambda name: -self._usage.get(name, 0))
+        return self._fuzzy(folded)
+
+    def complete(self, text, state):
+        if state == 0 or self._last[0] != text:
+            self._last = (text, self.matches(text))
+        options = self._last[1]
+        return options[state] if state < len(options) else None
+
+    def _fuzzy(self, folded):
+        if not folded:
+            return []
+        scored = []
+        for i, candidate in enumerate(self._folded):
+            # Subsequence check; span = how spread out the letters are (tighter is better)
+            position = start = -1
+            for char in folded:
+                position = candidate.find(char, position + 1)
+                if position < 0:
+                    break
+                if start < 0:
+                    start = position
+            else:
+                name = self._names[i]
+                scored.append((-self._usage.get(name, 0), position - start, start, i))
+        scored.sort()
+        return [self._names[i] for *_, i in scored]
+
+
+completion_usage = CompletionUsage(os.path.expanduser("~/.cache/evove/completion-usage.json"))
@@ -0,0 +1,388 @@
+import os
+import json
+import time
+import subprocess
+import threading
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: the state file is shared without a lock
+    fcntl = None
+
+
+def git_sync(repo_dir, timeout=120, timings=None):
+    """Pull, add, commit and push `repo_dir`, skipping the steps with nothing to do.
+
+    Returns True or an error message. `timings`, if given, receives seconds per phase
+    (phases that were skipped are recorded as "skipped").
+    """
+    if timings is None:
+        timings = {}
+    if not os.path.exists(repo_dir):
+        return "Journal directory not found (subprocess)."
+
+    try:
+        # Check if it's a git repo
+        if not os.path.exists(os.path.join(repo_dir, ".git")):
+            return "Not a git repository."
+
+        # Runs off the terminal: never wait on a credential prompt
+        env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+
+        def run_git_cmd(args):
+            result = subprocess.run(
+                args,
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=False, # We handle return code manually
+                env=env,
+                timeout=timeout,
+            )
+            if result.returncode != 0:
+                return False, result.stderr.strip() or result.stdout.strip()
+            return True, result.stdout.strip()
+
+        def timed(phase, args):
+            start = time.perf_counter()
+            outcome = run_git_cmd(args)
+            timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+            return outcome
+
+        # 0. Local state in one call: uncommitted changes, upstream and commits ahead of it
+        ok, status = timed("status", ["git", "status", "--porcelain=v2", "--branch"])
+        if not ok:
+            return f"Git Status Error: {status}"
+        dirty, upstream, ahead = False, None, 0
+        for line in status.splitlines():
+            if line.startswith("# branch.upstream "):
+                upstream = line.split(" ", 2)[2]
+            elif line.startswith("# branch.ab "):
+                ahead = int(line.split()[2].lstrip("+"))
+            elif not line.startswith("#"):
+                dirty = True
+
+        # 1. Pull. A clean tree pulls only when the remote branch moved past our tracking ref
+        # (a dirty one will push anyway, and the pull costs the same round trip as the check)
+        pull = True
+        if upstream and not dirty and "/" in upstream:
+            remote, branch = upstream.split("/", 1)
+            ok, remote_ref = timed("remote_check", ["git", "ls-remote", remote, f"refs/heads/{branch}"])
+            if not ok:
+                return f"Git Remote Error: {remote_ref}"
+            ok, tracked = timed("remote_check", ["git", "rev-parse", "@{u}"])
+            remote_sha = remote_ref.split()[0] if remote_ref else ""
+            pull = not (ok and remote_sha == tracked)
+        if pull:
+            ok, msg = timed("pull", ["git", "pull", "--no-rebase"])
+            if not ok:
+                return f"Git Pull Error: {msg}"
+        else:
+            timings["pull"] = "skipped"
+
+        # 2. Add + commit only a dirty tree
+        if dirty:
+            ok, msg = timed("commit", ["git", "add", "."])
+            if not ok: return f"Git Add Error: {msg}"
+
+            # Format: [evove dd/mm/yyyy - hh:mm:ss ]
+            timestamp = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
+            commit_msg = f"[evove {timestamp} ]"
+            ok, msg = timed("commit", ["git", "commit", "-m", commit_msg])
+            if not ok:
+                return f"Git Commit Error: {msg}"
+        else:
+            timings["commit"] = "skipped"
+
+        # 3. Push only when there are local commits the remote doesn't have
+        if dirty or ahead or not upstream:
+            ok, msg = timed("push", ["git", "push"])
+            if not ok:
+                return f"Git Push Error: {msg}"
+        else:
+            timings["push"] = "skipped"
+
+        return True
+    except Exception as e:
+        return f"Git Exception: {str(e)}"
+
+
+class GitSyncWorker:
+    """Runs journal git syncs on a background thread.
+
+    There is at most one pending job: a sync pushes the whole tree, so requests made
+    while one is waiting are merged into it. The job (with the log ids it will promote)
+    is kept in `state_path`, so a sync requested before a crash or exit is retried on
+    the next start. Failures are retried with exponential backoff.
+
+    The CLI and the web server each run a worker on the same state file: every change
+    re-reads and rewrites it under an exclusive lock, and a push in flight is claimed
+    by one process at a time.
+    """
+
+    DEBOUNCE_SECONDS = 1.0
+    RETRY_BASE_SECONDS = 5.0
+    RETRY_MAX_SECONDS = 15 * 60.0
+    BUSY_POLL_SECONDS = 1.0  # while the other process is pushing
+    INFLIGHT_STALE_SECONDS = 15 * 60.0  # a push claimed longer ago than this was abandoned
+
+    def __init__(self, repo_dir, state_path, debounce=None, sync=None, on_confirmed=None):
+        self.repo_dir = repo_dir
+        self.state_path = state_path
+        self.debounce = self.DEBOUNCE_SECONDS if debounce is None else debounce
+        self._sync = sync or git_sync
+        self.on_confirmed = on_confirmed  # called (on the worker thread) after a push confirms ids
+        self._cond = threading.Condition()
+        self._thread = None
+        self._busy = False
+        self.synced = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.last_result = None
+        self.last_timings = {}  # phase -> seconds (or "skipped") of the last attempt
+        self.state_error = None  # last failure to read/write the state file
+        self._state = {"pending": None, "inflight": None, "confirmed": []}  # as of our last update
+        with self._cond:
+            self._update(self._restart)
+            if self._state["pending"]:
+                self._ensure_thread()
+
+    # ---------- requests ----------
+    def submit(self, reason, promote=()):
+        """Queues a sync; `promote` are log ids to confirm once a push succeeds."""
+        now = time.time()
+
+        def merge(state):
+            job = state["pending"]
+            if job:
+                self.coalesced += 1
+                if reason not in job["reasons"]:
+                    job["reasons"].append(reason)
+                job["promote"] = sorted(set(job["promote"]) | set(promote))
+                # A job in backoff keeps its retry time; a fresh one waits for the burst to end
+                if not job["attempts"]:
+                    job["due"] = min(now + self.debounce, job["requested"] + self.debounce * 5)
+            else:
+                state["pending"] = {
+                    "reasons": [reason],
+                    "promote": sorted(set(promote)),
+                    "requested": now,
+                    "due": now + self.debounce,
+                    "attempts": 0,
+                    "last_error": None,
+                }
+
+        with self._cond:
+            self._update(merge)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def confirmed(self):
+        """Log ids covered by a successful push and not yet acknowledged (as of the last update)."""
+        with self._cond:
+            return list(self._state["confirmed"])
+
+    def ack(self, ids):
+        ids = set(ids)
+        if not ids:
+            return
+
+        def drop(state):
+            state["confirmed"] = [i for i in state["confirmed"] if i not in ids]
+
+        with self._cond:
+            self._update(drop)
+
+    def flush(self, timeout=30.0):
+        """Runs the pending job now and waits for one attempt. Returns True if nothing is left pending."""
+        deadline = time.monotonic() + timeout
+
+        def due_now(state):
+            if state["pending"]:
+                state["pending"]["due"] = 0
+
+        with self._cond:
+            self._update(due_now)
+            job = self._state["pending"]
+            if not job and not self._busy:
+                return True
+            attempts = job["attempts"] if job else 0
+            if job:
+                self._ensure_thread()
+                self._cond.notify()
+            while self._busy or (self._state["pending"] and self._state["pending"]["attempts"] == attempts):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._state["pending"] is None
+
+    def stats(self):
+        with self._cond:
+            job = self._state["pending"]
+            return {
+                "pending": bool(job),
+                "attempts": job["attempts"] if job else 0,
+                "retry_in_seconds": round(max(job["due"] - time.time(), 0), 1) if job else 0.0,
+                "last_error": job["last_error"] if job else None,
+                "state_error": self.state_error,
+                "unconfirmed": len(self._state["confirmed"]),
+                "synced": self.synced,
+                "failed": self.failed,
+                "coalesced": self.coalesced,
+                "last_timings": {
+                    phase: value if isinstance(value, str) else round(value, 3)
+                    for phase, value in self.last_timings.items()
+                },
+            }
+
+    # ---------- worker ----------
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="evove-git-sync", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    # Re-read: the other process may have merged, taken or finished the job
+                    job = self._update(self._claim)
+                    if job:
+                        break
+                    pending = self._state["pending"]
+                    if not pending:
+                        self._thread = None
+                        self._cond.notify_all()
+                        return
+                    if self.state_error or self._state["inflight"]:
+                        wait = self.BUSY_POLL_SECONDS
+                    else:
+                        wait = max(pending["due"] - time.time(), 0)
+                    self._cond.wait(wait)
+                self._busy = True
+            timings = {}
+            try:
+                from src.components.services.backup_service import backup_worker
+                backup_worker.flush()
+                result = self._sync(self.repo_dir, timings=timings)
+            except Exception as e:
+                result = f"Git Exception: {e}"
+
+            def finish(state):
+                state["inflight"] = None
+                if result is True:
+                    state["confirmed"] = sorted(set(state["confirmed"]) | set(job["promote"]))
+                    return
+                job["attempts"] += 1
+                job["last_error"] = str(result)
+                delay = min(self.RETRY_BASE_SECONDS * 2 ** (job["attempts"] - 1), self.RETRY_MAX_SECONDS)
+                job["due"] = time.time() + delay
+                job.pop("claimed", None)
+                job.pop("pid", None)
+                merged = state["pending"]
+                if merged:
+                    # Fold requests made during the failed attempt back into the retry
+                    job["reasons"] += [r for r in merged["reasons"] if r not in job["reasons"]]
+                    job["promote"] = sorted(set(job["promote"]) | set(merged["promote"]))
+                state["pending"] = job
+
+            with self._cond:
+                self._busy = False
+                self.last_timings = timings
+                self.last_result = result
+                if result is True:
+                    self.synced += 1
+                else:
+                    self.failed += 1
+                self._update(finish)
+                self._cond.notify_all()
+            if result is True and job["promote"] and self.on_confirmed is not None:
+                self.on_confirmed()
+
+    # ---------- state file ----------
+    def _claim(self, state):
+        """Moves a due pending job to inflight (ours) unless a push is already running."""
+        self._reclaim(state)
+        job = state["pending"]
+        if not job or state["inflight"] or job["due"] > time.time():
+            return None
+        job["claimed"] = time.time()
+        job["pid"] = os.getpid()
+        state["inflight"] = job
+        state["pending"] = None
+        return job
+
+    def _restart(self, state):
+        self._reclaim(state)
+        if state["pending"]:
+            # Retry soon after a restart instead of honoring an old backoff
+            state["pending"]["due"] = min(state["pending"].get("due", 0), time.time() + self.debounce)
+
+    def _reclaim(self, state):
+        """Puts back a push whose process died mid-flight, merged with anything queued since."""
+        job = state["inflight"]
+        if not job or not self._abandoned(job):
+            return
+        job.pop("claimed", None)
+        job.pop("pid", None)
+        job["due"] = time.time()
+        queued = state["pending"]
+        if queued:
+            job["reasons"] += [r for r in queued["reasons"] if r not in job["reasons"]]
+            job["promote"] = sorted(set(job["promote"]) | set(queued["promote"]))
+        state["pending"] = job
+        state["inflight"] = None
+
+    def _abandoned(self, job):
+        if time.time() - job.get("claimed", 0) > self.INFLIGHT_STALE_SECONDS:
+            return True
+        pid = job.get("pid")
+        if fcntl is None or not pid or pid == os.getpid():
+            # Without POSIX there is no safe liveness probe: wait for the stale timeout
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False
+        return False
+
+    def _update(self, change=None):
+        """Applies `change(state)` to the state file under an exclusive lock; returns its result.
+
+        Refreshes self._state. On an I/O error the change is dropped and reported in
+        state_error (and stats()).
+        """
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            with open(f"{self.state_path}.lock", "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                state = self._read_state()
+                result = change(state) if change else None
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.state_error = f"Error saving git sync queue: {e}"
+            return None
+        self.state_error = None
+        self._state = state
+        return result
+
+    def _read_state(self):
+        state = {"pending": None, "inflight": None, "confirmed": []}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                state["pending"] = data.get("pending") or None
+                state["inflight"] = data.get("inflight") or None
+                state["confirmed"] = list(data.get("confirmed") or [])
+        except (OSError, json.JSONDecodeError, TypeError):
+            pass
+        return state
@@ -0,0 +1,215 @@
+import os
+import json
+from datetime import datetime
+
+
+def is_date_header(line):
+    """True for a "[dd/mm/yyyy]" line (str or bytes)."""
+    if isinstance(line, bytes):
+        try:
+            line = line.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+    line = line.strip()
+    if line.startswith("[") and line.endswith("]") and len(line) == 12:
+        try:
+            datetime.strptime(line, "[%d/%m/%Y]")
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def reverse_lines(path, block_size=64 * 1024):
+    """Yields (offset, line bytes without newline) from the end of `path` backwards.
+
+    Reads fixed-size blocks from the end, so stopping early costs only the bytes visited.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        carry = b""
+        first = True
+        while pos > 0:
+            read = min(block_size, pos)
+            pos -= read
+            f.seek(pos)
+            chunk = f.read(read) + carry
+            parts = chunk.split(b"\n")
+            carry = parts[0]
+            cursor = pos + len(chunk)
+            if first:
+                first = False
+                if parts[-1] == b"" and len(parts) > 1:
+                    # Trailing newline: there is no empty line after it
+                    parts.pop()
+                    cursor -= 1
+            for part in reversed(parts[1:]):
+                start = cursor - len(part)
+                yield start, part
+                cursor = start - 1
+        if carry or not first:
+            yield 0, carry
+
+
+class JournalDayIndex:
+    """Byte offset and first line of every date header in the journal file.
+
+    Persisted in a sidecar and validated against the journal's size/mtime. When the
+    journal only grew, just the appended bytes are scanned; anything else rebuilds it.
+    """
+
+    TAIL_CHECK = 64  # bytes before the indexed end used to detect in-place edits
+
+    def __init__(self, journal_file, sidecar_path):
+        self.journal_file = journal_file
+        self.sidecar_path = sidecar_path
+        self.days = []       # [header, byte offset, line number]
+        self._first = {}     # header -> position of its first occurrence in days
+        self.size = 0
+        self.lines = 0
+        self.mtime_ns = None
+        self.tail = ""
+        self._loaded = False
+
+    # ---------- queries ----------
+    def days_since(self, header):
+        """How many days (counting `header` itself) from the first `header` to the end, or None."""
+        self.validate()
+        position = self._first.get(header)
+        return None if position is None else len(self.days) - position
+
+    def tail_start(self, days_back):
+        """(byte offset, whole file?) of the window holding the last `days_back` days."""
+        self.validate()
+        if days_back >= len(self.days) or days_back <= 0:
+            # Lines before the first header belong to the window too
+            return 0, True
+        return self.days[-days_back][1], False
+
+    # ---------- maintenance ----------
+    def validate(self):
+        self._ensure_loaded()
+        try:
+            st = os.stat(self.journal_file)
+        except OSError:
+            if self.days or self.size:
+                self._reset()
+                self._save()
+            return
+        if st.st_size == self.size and st.st_mtime_ns == self.mtime_ns:
+            return
+        if st.st_size > self.size and self._prefix_unchanged():
+            # Appended since we last looked: index only the new bytes
+            grew = self._scan(self.size, self.lines)
+        else:
+            self._reset()
+            grew = self._scan(0, 0)
+        self.mtime_ns = st.st_mtime_ns
+        if grew or not os.path.exists(self.sidecar_path):
+            self._save()
+
+    def rewrote(self, offset):
+        """Call after the journal was rewritten from `offset` (the start of a line) to the end.
+
+        The index must have been validated before the rewrite.
+        """
+        self._ensure_loaded()
+        keep = [day for day in self.days if day[1] < offset]
+        # Bytes before `offset` are untouched: count lines from the last kept header
+        base_offset, line = (keep[-1][1], keep[-1][2]) if keep else (0, 0)
+        with open(self.journal_file, "rb") as f:
+            f.seek(base_offset)
+            line += f.read(offset - base_offset).count(b"\n")
+        self.days = keep
+        self._first = {}
+        for position, day in enumerate(self.days):
+            self._first.setdefault(day[0], position)
+        self._scan(offset, line)
+        try:
+            self.mtime_ns = os.stat(self.journal_file).st_mtime_ns
+        except OSError:
+            self.mtime_ns = None
+        self._save()
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._load_sidecar()
+            self._loaded = True
+
+    def _scan(self, offset, line_number):
+        """Indexes headers from `offset` to EOF. Returns True if a header was found."""
+        found = False
+        with open(self.journal_file, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if raw.startswith(b"[") and is_date_header(raw):
+                    header = raw.decode("utf-8").strip()
+                    self._first.setdefault(header, len(self.days))
+                    self.days.append([header, offset, line_number])
+                    found = True
+                offset += len(raw)
+                line_number += 1
+        self.size = offset
+        self.lines = line_number
+        self.tail = self._read_tail()
+        return found
+
+    def _prefix_unchanged(self):
+        if not self.size:
+            return True
+        return self._read_tail() == self.tail
+
+    def _read_tail(self):
+        start = max(0, self.size - self.TAIL_CHECK)
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(start)
+                return f.read(self.size - start).hex()
+        except OSError:
+            return ""
+
+    def _reset(self):
+        self.days = []
+        self._first = {}
+        self.size = 0
+        self.lines = 0
+        self.mtime_ns = None
+        self.tail = ""
+
+    def _load_sidecar(self):
+        try:
+            with open(self.sidecar_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("journal") != self.journal_file:
+            return
+        self.days = data.get("days", [])
+        self.size = data.get("size", 0)
+        self.lines = data.get("lines", 0)
+        self.mtime_ns = data.get("mtime_ns")
+        self.tail = data.get("tail", "")
+        self._first = {}
+        for position, day in enumerate(self.days):
+            self._first.setdefault(day[0], position)
+
+    def _save(self):
+        data = {
+            "journal": self.journal_file,
+            "size": self.size,
+            "lines": self.lines,
+            "mtime_ns": self.mtime_ns,
+            "tail": self.tail,
+            "days": self.days,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.sidecar_path), exist_ok=True)
+            tmp_path = f"{self.sidecar_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                # dumps() uses the C encoder; dump() to a file streams through the Python one
+                f.write(json.dumps(data))
+            os.replace(tmp_path, self.sidecar_path)
+        except OSError:
+            # The index is a cache: it is rebuilt from the journal if missing
+            pass
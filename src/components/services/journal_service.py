@@ -1,108 +1,253 @@
 import os
-import json
-import subprocess
+import heapq
+import bisect
 from datetime import datetime, timedelta
 from src.components.services.sleep_service import sleep_service
 from src.components.services.sequence_service import sequence_service
+from src.components.services.storage_service import storage as default_storage
+from src.components.services.journal_index_service import JournalDayIndex, is_date_header, reverse_lines
+from src.components.services.archive_service import LogArchive
+from src.components.services.git_sync_service import GitSyncWorker
+from src.components.services.suggestion_service import SuggestionIndex, log_time
 
 class JournalService:
-    def __init__(self):
+    # Hot statuses stay in the logs table; the rest is archived once older than this
+    ARCHIVE_AFTER_DAYS = 7
+
+    def __init__(self, storage=None):
+        self._storage = storage or default_storage
+        self._archive = LogArchive(os.path.join(self._storage.data_dir, "archive"))
         self.log_id_prefix = 73
         self.log_id_width = 4
-        # Paths
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.logs_data_path = os.path.join(base_dir, "data", "logs.json")
-        
         # User journal directory (Git Repo)
         self.journal_dir = os.path.expanduser("~/journal")
         self.journal_file = os.path.join(self.journal_dir, "evove26")
+        # Header offsets are a cache: kept outside the journal repo so they are never committed
+        self._day_index = JournalDayIndex(
+            self.journal_file, os.path.expanduser("~/.cache/evove/evove26.idx.json")
+        )
+        # Pushes run in the background; the queue survives restarts
+        self._git_sync = GitSyncWorker(
+            self.journal_dir, os.path.expanduser("~/.cache/evove/git-sync.json"), on_confirmed=self._pushed
+        )
+        self._scheduler = None
         
         self.logs = []
+        self._log_index = {}  # int id -> position in self.logs
+        self._max_log_id = 0  # High-water mark for id allocation
+        self._status_index = {}  # status -> sorted positions in self.logs
+        self._logs_fingerprint = None
+        self._suggestions = None  # autocomplete; built on first use, then kept in step with add_log
         self._load_logs_data()
 
     def _next_log_id(self):
         """Returns the next sequential log id (e.g. 470001)."""
-        max_id = 0
-        for log in self.logs:
-            log_id = log.get("id")
-            try:
-                val = int(log_id)
-            except (TypeError, ValueError):
-                continue
-            if val > max_id:
-                max_id = val
-        if max_id <= 0:
+        if self._max_log_id <= 0:
             return int(f"{self.log_id_prefix}{1:0{self.log_id_width}d}")
-        return max_id + 1
+        return self._max_log_id + 1
+
+    def _index_log(self, position):
+        bisect.insort(self._status_index.setdefault(self.logs[position].get("status"), []), position)
+        self._index_log_id(position)
+
+    def _index_log_id(self, position):
+        try:
+            log_id = int(self.logs[position].get("id"))
+        except (TypeError, ValueError):
+            return
+        self._log_index[log_id] = position
+        if log_id > self._max_log_id:
+            self._max_log_id = log_id
+
+    def _rebuild_log_index(self):
+        self._log_index = {}
+        self._max_log_id = 0
+        self._status_index = {}
+        for position in range(len(self.logs)):
+            self._index_log(position)
+        # Archived ids are never handed out again
+        self._max_log_id = max(self._max_log_id, self._archive.max_id())
+
+    def _suggestion_index(self):
+        if self._suggestions is None:
+            self._suggestions = SuggestionIndex()
+            self._suggestions.add_many(
+                (log.get("content"), log_time(log.get("timestamp")) or 0) for log in self.logs
+            )
+        return self._suggestions
+
+    def log_suggestions(self, prefix="", limit=SuggestionIndex.TOP_K):
+        """Top log contents for `prefix` plus today's first entry.
+
+        Only a stat of the logs file when nothing changed; logs written by the other
+        process (CLI/web) reload them and the index is rebuilt.
+        """
+        self._load_logs_data()
+        index = self._suggestion_index()
+        today = datetime.now().date()
+        return {
+            "suggestions": index.top(prefix, limit),
+            "base": index.base if index.base_day == today else "",
+        }
+
+    def _find_log_position(self, log_id):
+        try:
+            return self._log_index.get(int(log_id))
+        except (TypeError, ValueError):
+            return None
+
+    def _find_log(self, log_id):
+        position = self._find_log_position(log_id)
+        return self.logs[position] if position is not None else None
+
+    def _find_archived(self, log_id):
+        found = self._archive.find(log_id)
+        return found[1] if found else None
+
+    def _logs_with_status(self, predicate):
+        """Sorted positions of every log whose status matches `predicate` (checked once per status)."""
+        buckets = [
+            positions for status, positions in self._status_index.items()
+            if positions and predicate(str(status or "").upper())
+        ]
+        return list(heapq.merge(*buckets))
+
+    def _set_log_status(self, position, status):
+        """Moves a log between status buckets; returns the change record for _save_statuses."""
+        log = self.logs[position]
+        old = log.get("status")
+        if old != status:
+            positions = self._status_index.get(old, [])
+            i = bisect.bisect_left(positions, position)
+            if i < len(positions) and positions[i] == position:
+                del positions[i]
+            bisect.insort(self._status_index.setdefault(status, []), position)
+            log["status"] = status
+        return {log.get("id"): {"status": status}}
 
     def _load_logs_data(self):
-        """Loads structured log data."""
-        if os.path.exists(self.logs_data_path):
-            try:
-                with open(self.logs_data_path, 'r', encoding='utf-8') as f:
-                    self.logs = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.logs = []
-        else:
-            self.logs = []
+        """Loads structured log data (skipped when storage has not changed since the last load/save)."""
+        try:
+            self._reload_logs()
+        except Exception as e:
+            # Keeps what is in memory; the fingerprint is left stale so the next call retries
+            print(f"Error loading logs data: {e}")
+
+    def _reload_logs(self):
+        """_load_logs_data without the error handling, for the scheduler job to report failures."""
+        fingerprint = self._storage.rows_fingerprint("logs")
+        if fingerprint is not None and fingerprint == self._logs_fingerprint:
+            self._apply_synced()
+            return
+        self.logs = self._storage.read_rows("logs")
+        self._logs_fingerprint = None
+        self._rebuild_log_index()
+        self._suggestions = None
+
+        # Legacy entries without an id can't receive status patches: number them once
+        if any(log.get("id") is None for log in self.logs):
+            for position, log in enumerate(self.logs):
+                if log.get("id") is None:
+                    log["id"] = self._next_log_id()
+                    # Already in its status bucket from the rebuild above
+                    self._index_log_id(position)
+            self._storage.replace_rows("logs", self.logs)
 
         # Normalize legacy statuses
-        normalized = False
-        for log in self.logs:
-            status = log.get("status")
-            if isinstance(status, str) and "TO PROCESS" in status and status != "[TO PROCESS]":
-                log["status"] = "[TO PROCESS]"
-                normalized = True
+        normalized = {}
+        legacy = self._logs_with_status(lambda s: "TO PROCESS" in s and s != "[TO PROCESS]")
+        for position in legacy:
+            normalized.update(self._set_log_status(position, "[TO PROCESS]"))
         if normalized:
-            self._save_logs_data()
+            self._storage.update_rows("logs", normalized)
+        self._logs_fingerprint = self._storage.rows_fingerprint("logs")
+        self._apply_synced()
 
-    def _save_logs_data(self):
-        """Saves structured log data."""
+    def _save_new_logs(self, entries, changes=None):
+        """Persists freshly appended entries plus optional status changes in one write."""
         try:
-            os.makedirs(os.path.dirname(self.logs_data_path), exist_ok=True)
-            with open(self.logs_data_path, 'w', encoding='utf-8') as f:
-                json.dump(self.logs, f, indent=4)
-            from src.components.services.backup_service import backup_json
-            backup_json(self.logs_data_path)
-        except IOError as e:
+            self._storage.append_rows("logs", entries, changes)
+            self._logs_fingerprint = self._storage.rows_fingerprint("logs")
+        except Exception as e:
+            print(f"Error saving logs data: {e}")
+
+    def _save_statuses(self, changes):
+        """Persists status flips; `changes` maps log id -> changed fields."""
+        try:
+            self._storage.update_rows("logs", changes)
+            self._logs_fingerprint = self._storage.rows_fingerprint("logs")
+        except Exception as e:
             print(f"Error saving logs data: {e}")
 
     def _get_last_file_date_header(self):
         """Reads the journal file backwards to find the last date header."""
+        found = self._tail_seek(lambda line: self._is_date_header_line(line))
+        return found[1] if found else None
+
+    def _tail_seek(self, match):
+        """Reverse block read of evove26: (offset, stripped line) of the last line where match(line), or None."""
         if not os.path.exists(self.journal_file):
             return None
-        
         try:
-            with open(self.journal_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for line in reversed(lines):
-                    line = line.strip()
-                    # Check for date format "[dd/mm/yyyy]"
-                    # Basic check: starts with [ and ends with ] and has 10 chars inside
-                    if line.startswith("[") and line.endswith("]") and len(line) == 12:
-                         try:
-                             datetime.strptime(line, "[%d/%m/%Y]")
-                             return line
-                         except ValueError:
-                             continue
+            for offset, raw in reverse_lines(self.journal_file):
+                line = raw.decode("utf-8").strip()
+                if line and match(line):
+                    return offset, line
         except Exception:
             return None
         return None
 
+    def _edit_journal(self, edit, days_back=1):
+        """Runs edit(lines, whole) on the last days of evove26 and rewrites only that tail.
+
+        edit returns None to ask for a wider window (never when whole is True),
+        or (new_lines, result) where new_lines None means nothing to write.
+        """
+        while True:
+            offset, whole = self._day_index.tail_start(days_back)
+            with open(self.journal_file, "rb") as f:
+                f.seek(offset)
+                lines = f.read().decode("utf-8").splitlines(keepends=True)
+            outcome = edit(lines, whole)
+            if outcome is None and not whole:
+                days_back *= 2
+                continue
+            new_lines, result = outcome
+            if new_lines is not None:
+                with open(self.journal_file, "r+b") as f:
+                    f.seek(offset)
+                    f.write("".join(new_lines).encode("utf-8"))
+                    f.truncate()
+                self._day_index.rewrote(offset)
+            return result
+
+    def _remove_journal_line(self, offset):
+        """Cuts the line starting at `offset` by shifting only the bytes after it."""
+        # Index everything before the cut while it still matches the file
+        self._day_index.validate()
+        with open(self.journal_file, "r+b") as f:
+            f.seek(offset)
+            f.readline()
+            rest = f.read()
+            f.seek(offset)
+            f.write(rest)
+            f.truncate()
+        self._day_index.rewrote(offset)
+
     def _is_date_header_line(self, line):
-        line = line.strip()
-        if line.startswith("[") and line.endswith("]") and len(line) == 12:
-            try:
-                datetime.strptime(line, "[%d/%m/%Y]")
-                return True
-            except ValueError:
-                return False
-        return False
+        return is_date_header(line)
 
     def add_log(self, text, manual_date=None, auto_confirm=False, custom_status=None):
         """Adds a log entry to both evove26 and logs.json."""
         if not text.strip():
             return False
+        return self.add_logs_bulk([text], manual_date, auto_confirm, custom_status)
+
+    def add_logs_bulk(self, texts, manual_date=None, auto_confirm=False, custom_status=None, status_changes=None):
+        """Adds several entries sharing date/status, flips `status_changes` (id -> status) and persists once."""
+        texts = [text.strip() for text in texts if text and text.strip()]
+        if not texts and not status_changes:
+            return False
 
         now = datetime.now()
         
@@ -128,7 +273,7 @@ class JournalService:
             status = "[TO PROCESS]"
         
         # 1. Append to evove26 (Skip if it's a "TO PROCESS" system log)
-        if status != "[TO PROCESS]":
+        if texts and status != "[TO PROCESS]":
             try:
                 os.makedirs(self.journal_dir, exist_ok=True)
                 
@@ -139,19 +284,33 @@ class JournalService:
                     if last_header != current_date_header:
                         f.write(f"\n{current_date_header}\n")
                     
-                    f.write(f"{text.strip()}\n")
+                    f.write("".join(f"{text}\n" for text in texts))
             except IOError as e:
                 return f"Error writing to file: {e}"
 
-        # 2. Add to logs.json
-        entry = {
-            "id": self._next_log_id(),
-            "timestamp": timestamp_str,
-            "content": text.strip(),
-            "status": status
-        }
-        self.logs.append(entry)
-        self._save_logs_data()
+        # 2. Add to logs.json: one block of ids, status flips and a single write
+        first_id = self._next_log_id()
+        entries = []
+        when = target_date.timestamp()
+        for offset, text in enumerate(texts):
+            if self._suggestions is not None:
+                self._suggestions.add(text, when)
+            entries.append({
+                "id": first_id + offset,
+                "timestamp": timestamp_str,
+                "content": text,
+                "status": status
+            })
+            self.logs.append(entries[-1])
+            self._index_log(len(self.logs) - 1)
+
+        changes = {}
+        for log_id, new_status in (status_changes or {}).items():
+            position = self._find_log_position(log_id)
+            if position is not None:
+                changes.update(self._set_log_status(position, new_status))
+
+        self._save_new_logs(entries, changes)
         
         return True
 
@@ -160,7 +319,7 @@ class JournalService:
         if not self.logs:
             return "No logs to process."
 
-        to_process_indices = [i for i, log in enumerate(self.logs) if log.get("status") == "[TO PROCESS]"]
+        to_process_indices = list(self._status_index.get("[TO PROCESS]", []))
         
         if not to_process_indices:
             return "No pending system logs."
@@ -191,18 +350,13 @@ class JournalService:
                 # Or maybe just leave it? Let's assume strict format from User/Shop.
                 pass
 
-        # Create new aggregated logs
-        for name, value in actions_agg.items():
-            self.add_log(f"{value} {name}", auto_confirm=True, custom_status="[IN WAIT]")
-            
-        for name, qtd in purchases_agg.items():
-            self.add_log(f"{qtd} x {name}", auto_confirm=True, custom_status="[IN WAIT]")
-
-        # Mark originals as PROCESSED
-        for idx in to_process_indices:
-            self.logs[idx]["status"] = "[PROCESSED]"
-            
-        self._save_logs_data()
+        # New aggregated logs + originals marked PROCESSED, persisted in one write
+        texts = [f"{value} {name}" for name, value in actions_agg.items()]
+        texts += [f"{qtd} x {name}" for name, qtd in purchases_agg.items()]
+        processed = {self.logs[idx].get("id"): "[PROCESSED]" for idx in to_process_indices}
+        result = self.add_logs_bulk(texts, auto_confirm=True, custom_status="[IN WAIT]", status_changes=processed)
+        if isinstance(result, str):
+            return result
         return f"Processed {len(to_process_indices)} entries."
 
     def list_logs(self):
@@ -211,18 +365,21 @@ class JournalService:
         if not self.logs:
             return ["No logs available."]
         
-        # Filter active logs only (ignore DELETED and PROCESSED)
-        active_logs = []
-        for log in self.logs:
-            status = str(log.get("status", "")).upper()
-            if "DELETED" in status or "PROCESSED" in status:
-                continue
-            active_logs.append(log)
-        
-        if not active_logs:
+        # Active logs only (ignore DELETED and PROCESSED): newest 15 across the active buckets
+        buckets = [
+            reversed(positions) for status, positions in self._status_index.items()
+            if "DELETED" not in str(status or "").upper() and "PROCESSED" not in str(status or "").upper()
+        ]
+        newest = []
+        for position in heapq.merge(*buckets, reverse=True):
+            newest.append(position)
+            if len(newest) == 15:
+                break
+
+        if not newest:
             return ["No active logs available."]
 
-        recent = active_logs[-15:]
+        recent = [self.logs[position] for position in reversed(newest)]
         formatted = []
         for log in recent:
             # Format: [dd mm yy : hh:mm:ss ] log 1 [STATUS]
@@ -250,12 +407,11 @@ class JournalService:
         if not self.logs:
             return "Log list is empty."
             
-        # Find last non-deleted log
-        target_index = -1
-        for i in range(len(self.logs) - 1, -1, -1):
-            if self.logs[i]["status"] != "[DELETED]":
-                target_index = i
-                break
+        # Find last non-deleted log (newest entry of every other bucket)
+        target_index = max(
+            (positions[-1] for status, positions in self._status_index.items() if positions and status != "[DELETED]"),
+            default=-1,
+        )
         
         if target_index == -1:
             return "No active logs to delete."
@@ -265,35 +421,22 @@ class JournalService:
         content_to_match = target_log["content"]
         
         # 1. Update status
-        self.logs[target_index]["status"] = "[DELETED]"
-        self._save_logs_data()
+        self._save_statuses(self._set_log_status(target_index, "[DELETED]"))
         
         # 2. Remove from evove26
         file_msg = ""
         try:
             if os.path.exists(self.journal_file):
-                with open(self.journal_file, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                
-                # Find index of last matching line
-                idx_to_remove = -1
-                for i in range(len(lines) -1, -1, -1):
-                    line = lines[i].strip()
-                    if not line: continue
-                    # Skip headers
-                    if line.startswith("[") and line.endswith("]") and len(line) == 12:
-                        continue
-                    
-                    if line == content_to_match:
-                        idx_to_remove = i
-                        break
-                
-                if idx_to_remove != -1:
-                    lines.pop(idx_to_remove)
+                # Last matching line, skipping headers ([dd/mm/yyyy] is 12 chars)
+                found = self._tail_seek(
+                    lambda line: line == content_to_match and not (
+                        line.startswith("[") and line.endswith("]") and len(line) == 12
+                    )
+                )
+
+                if found:
+                    self._remove_journal_line(found[0])
                     file_msg = "Removed from file."
-                    
-                    with open(self.journal_file, "w", encoding="utf-8") as f:
-                        f.writelines(lines)
                 else:
                      file_msg = "Log not found in file (desync?)."
 
@@ -303,11 +446,8 @@ class JournalService:
         # 3. Auto-push if [CLOUD] (or [SYSTEM - CLOUD])
         git_msg = ""
         if "CLOUD" in original_status and "DELETED" not in original_status:
-             res = self._git_push()
-             if res is True:
-                 git_msg = " | Cloud sync (DELETE) success."
-             else:
-                 git_msg = f" | Cloud sync failed: {res}"
+             self.request_sync("delete")
+             git_msg = " | Cloud sync (DELETE) queued."
         
         return f"Smart Delete: '{content_to_match}' -> [DELETED]. {file_msg}{git_msg}"
 
@@ -318,14 +458,13 @@ class JournalService:
     def delete_log_by_id(self, log_id):
         """Soft deletes a log by id and removes it from evove26."""
         self._load_logs_data()
-        target = None
-        for log in self.logs:
+        target = self._find_log(log_id)
+        archived = target is None
+        if archived:
             try:
-                if int(log.get("id")) == int(log_id):
-                    target = log
-                    break
-            except (TypeError, ValueError):
-                continue
+                target = self._find_archived(log_id)
+            except (OSError, EOFError, ValueError) as e:
+                return f"Error reading log archive: {e}"
 
         if not target:
             return f"Log id {log_id} not found."
@@ -334,8 +473,13 @@ class JournalService:
         if "DELETED" in status:
             return f"Log {log_id} already deleted."
 
-        target["status"] = "[DELETED]"
-        self._save_logs_data()
+        if archived:
+            try:
+                self._archive.update(log_id, {"status": "[DELETED]"})
+            except (OSError, EOFError, ValueError) as e:
+                return f"Error updating log archive: {e}"
+        else:
+            self._save_statuses(self._set_log_status(self._find_log_position(log_id), "[DELETED]"))
 
         if not os.path.exists(self.journal_file):
             return f"Log {log_id} deleted in logs.json. Journal file not found."
@@ -348,15 +492,16 @@ class JournalService:
         if status == "[TO PROCESS]":
             return f"Log {log_id} deleted."
 
+        header = None
         try:
-            with open(self.journal_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            dt = datetime.strptime(target["timestamp"], "%d %m %Y : %H:%M:%S")
+            header = dt.strftime("[%d/%m/%Y]")
+        except Exception:
+            pass
 
-            removed = False
+        def remove_entry(lines, whole):
             # Try remove within its date section if timestamp is valid
-            try:
-                dt = datetime.strptime(target["timestamp"], "%d %m %Y : %H:%M:%S")
-                header = dt.strftime("[%d/%m/%Y]")
+            if header:
                 header_indices = [i for i, line in enumerate(lines) if self._is_date_header_line(line)]
                 hidx = next((i for i in header_indices if lines[i].strip() == header), None)
                 if hidx is not None:
@@ -364,23 +509,19 @@ class JournalService:
                     for i in range(next_header_idx - 1, hidx, -1):
                         if lines[i].strip() == content:
                             lines.pop(i)
-                            removed = True
-                            break
-            except Exception:
-                pass
+                            return lines, True
 
-            if not removed:
-                # Fallback: remove last matching line anywhere
-                for i in range(len(lines) - 1, -1, -1):
-                    if lines[i].strip() == content:
-                        lines.pop(i)
-                        removed = True
-                        break
-
-            if removed:
-                with open(self.journal_file, "w", encoding="utf-8") as f:
-                    f.writelines(lines)
-            else:
+            # Fallback: remove last matching line anywhere
+            for i in range(len(lines) - 1, -1, -1):
+                if lines[i].strip() == content:
+                    lines.pop(i)
+                    return lines, True
+            return (None, False) if whole else None
+
+        try:
+            # Start at the entry's own day when the index knows it
+            days_back = (self._day_index.days_since(header) if header else None) or 1
+            if not self._edit_journal(remove_entry, days_back):
                 return f"Log {log_id} deleted in logs.json. Entry not found in evove26."
 
         except Exception as e:
@@ -391,14 +532,10 @@ class JournalService:
     def up_log_day(self, log_id):
         """Moves a log entry to the previous day (logs.json + evove26)."""
         self._load_logs_data()
-        target = None
-        for log in self.logs:
-            try:
-                if int(log.get("id")) == int(log_id):
-                    target = log
-                    break
-            except (TypeError, ValueError):
-                continue
+        try:
+            target = self._find_log(log_id) or self._find_archived(log_id)
+        except (OSError, EOFError, ValueError) as e:
+            return f"Error reading log archive: {e}"
 
         if not target:
             return f"Log id {log_id} not found."
@@ -418,10 +555,7 @@ class JournalService:
         if not content:
             return f"Log {log_id} not moved. Empty content in journal."
 
-        try:
-            with open(self.journal_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
+        def move_entry(lines, whole):
             # Remove last matching line and capture its header position
             header_indices = [i for i, line in enumerate(lines) if self._is_date_header_line(line)]
             removed = False
@@ -440,7 +574,7 @@ class JournalService:
                     break
 
             if not removed or old_header_idx is None or not old_header_line:
-                return f"Log {log_id} not moved. Entry not found in evove26."
+                return None if not whole else (None, f"Log {log_id} not moved. Entry not found in evove26.")
 
             # Find previous day header (nearest header above the old one)
             prev_header_idx = None
@@ -450,7 +584,7 @@ class JournalService:
                     break
 
             if prev_header_idx is None:
-                return f"Log {log_id} not moved. No previous day header."
+                return None if not whole else (None, f"Log {log_id} not moved. No previous day header.")
 
             # Insert under the last day log (before first blank line in that day, if any)
             header_indices = [i for i, line in enumerate(lines) if self._is_date_header_line(line)]
@@ -461,9 +595,13 @@ class JournalService:
                     insert_idx = i
                     break
             lines.insert(insert_idx, f"{content}\n")
+            return lines, None
 
-            with open(self.journal_file, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+        try:
+            # Entry's day plus the one above it
+            failed = self._edit_journal(move_entry, days_back=2)
+            if failed:
+                return failed
 
         except Exception as e:
             return f"Log {log_id} not moved. Journal update failed: {e}"
@@ -475,10 +613,8 @@ class JournalService:
         self._load_logs_data()
         today_str = datetime.now().strftime("%d %m %Y")
         candidates = {}
-        for log in self.logs:
-            status = str(log.get("status", "")).upper()
-            if "CLOUD" not in status:
-                continue
+        for position in self._logs_with_status(lambda s: "CLOUD" in s):
+            log = self.logs[position]
             ts = str(log.get("timestamp", ""))
             if not ts.startswith(today_str):
                 continue
@@ -495,14 +631,11 @@ class JournalService:
 
         today_header = datetime.now().strftime("[%d/%m/%Y]")
 
-        try:
-            with open(self.journal_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
+        def move_today(lines, whole):
             header_indices = [i for i, line in enumerate(lines) if self._is_date_header_line(line)]
             today_idx = next((i for i in header_indices if lines[i].strip() == today_header), None)
             if today_idx is None:
-                return "Today's header not found in evove26."
+                return (None, "Today's header not found in evove26.") if whole else None
 
             prev_header_idx = None
             for h in reversed(header_indices):
@@ -510,7 +643,7 @@ class JournalService:
                     prev_header_idx = h
                     break
             if prev_header_idx is None:
-                return "No previous day header."
+                return (None, "No previous day header.") if whole else None
 
             next_header_idx = next((i for i in header_indices if i > today_idx), len(lines))
 
@@ -526,7 +659,7 @@ class JournalService:
                     candidates[line] -= 1
 
             if not moved_lines:
-                return "No matching [CLOUD] logs found in evove26."
+                return None, "No matching [CLOUD] logs found in evove26."
 
             for i in reversed(remove_indices):
                 lines.pop(i)
@@ -542,87 +675,105 @@ class JournalService:
 
             for offset, line in enumerate(moved_lines):
                 lines.insert(insert_idx + offset, line)
+            return lines, f"Moved {len(moved_lines)} logs to previous day."
 
-            with open(self.journal_file, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+        try:
+            days_back = self._day_index.days_since(today_header)
+            if days_back is None:
+                return "Today's header not found in evove26."
+            # Today's section plus the day above it
+            return self._edit_journal(move_today, days_back + 1)
 
         except Exception as e:
             return f"Failed to move logs: {e}"
 
-        return f"Moved {len(moved_lines)} logs to previous day."
 
-    def _git_push(self):
-        """Commits and pushes changes to Git with enhanced error handling."""
-        if not os.path.exists(self.journal_dir):
-            return "Journal directory not found (subprocess)."
-            
+    def archive_cold_logs(self, now=None):
+        """Moves old [PROCESSED]/[DELETED]/[CLOUD] logs to the monthly archive; returns how many."""
+        self._load_logs_data()
+        cutoff = (now or datetime.now()) - timedelta(days=self.ARCHIVE_AFTER_DAYS)
+        candidates = set(self._logs_with_status(
+            lambda s: "PROCESSED" in s or "DELETED" in s or "CLOUD" in s
+        ))
+        hot, cold = [], []
+        for position, log in enumerate(self.logs):
+            try:
+                old = position in candidates and datetime.strptime(log["timestamp"], "%d %m %Y : %H:%M:%S") < cutoff
+            except (KeyError, TypeError, ValueError):
+                old = False
+            (cold if old else hot).append(log)
+        if not cold:
+            return 0
+
         try:
-            # Check if it's a git repo
-            if not os.path.exists(os.path.join(self.journal_dir, ".git")):
-                return "Not a git repository."
-
-            def run_git_cmd(args):
-                result = subprocess.run(
-                    args, 
-                    cwd=self.journal_dir, 
-                    capture_output=True, 
-                    text=True, 
-                    check=False # We handle return code manually
-                )
-                if result.returncode != 0:
-                    return False, result.stderr.strip() or result.stdout.strip()
-                return True, result.stdout.strip()
-
-            # 0. Pull (to avoid conflicts)
-            ok, msg = run_git_cmd(["git", "pull", "--no-rebase"])
-            if not ok: 
-                return f"Git Pull Error: {msg}"
-
-            # 1. Add
-            ok, msg = run_git_cmd(["git", "add", "."])
-            if not ok: return f"Git Add Error: {msg}"
-
-            # 2. Commit
-            # Format: [evove dd/mm/yyyy - hh:mm:ss ]
-            timestamp = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
-            commit_msg = f"[evove {timestamp} ]"
-            ok, msg = run_git_cmd(["git", "commit", "-m", commit_msg])
-            
-            # Allow "nothing to commit" as success
-            if not ok:
-                if "nothing to commit" in msg or "clean" in msg:
-                    pass 
-                else:
-                    return f"Git Commit Error: {msg}"
-            
-            # 3. Push
-            ok, msg = run_git_cmd(["git", "push"])
-            if not ok:
-                return f"Git Push Error: {msg}"
-            
-            return True
+            # Archive first: a crash in between leaves duplicates, never lost rows
+            self._archive.archive(cold)
+            self._storage.replace_rows("logs", hot)
         except Exception as e:
-            return f"Git Exception: {str(e)}"
+            print(f"Error archiving logs: {e}")
+            return 0
+        self.logs = hot
+        self._rebuild_log_index()
+        self._logs_fingerprint = self._storage.rows_fingerprint("logs")
+        return len(cold)
+
+    def request_sync(self, reason, promote=()):
+        """Queues a background git sync; `promote` are [IN WAIT] ids to flip to [CLOUD] once it lands."""
+        self._git_sync.submit(reason, promote)
+
+    def sync_stats(self):
+        return self._git_sync.stats()
+
+    def register_jobs(self, scheduler):
+        """[CLOUD] promotion runs as a job, under the lock the front-end holds while touching logs."""
+        self._scheduler = scheduler
+        scheduler.register("journal_synced", self._synced_job)
+
+    def _pushed(self):
+        # Worker thread: a push confirmed ids. Without a scheduler the next load promotes them
+        if self._scheduler is not None:
+            self._scheduler.wake("journal_synced")
+
+    def _synced_job(self, now):
+        # Reload first if the other process wrote logs; promotion happens at the end of the load.
+        # Failures propagate: the scheduler tells the user and retries
+        self._reload_logs()
+        return None
+
+    def _apply_synced(self):
+        """Promotes logs covered by a confirmed push to [CLOUD]; returns how many changed."""
+        ids = self._git_sync.confirmed()
+        if not ids:
+            return 0
+        changes = {}
+        for log_id in ids:
+            position = self._find_log_position(log_id)
+            if position is not None and self.logs[position].get("status") == "[IN WAIT]":
+                changes.update(self._set_log_status(position, "[CLOUD]"))
+        if changes:
+            try:
+                self._storage.update_rows("logs", changes)
+            except Exception:
+                # Memory already says [CLOUD]: reread so the retry finds [IN WAIT] again
+                self._logs_fingerprint = None
+                raise
+            self._logs_fingerprint = self._storage.rows_fingerprint("logs")
+        # Only acknowledged once persisted, so a failed save is promoted again later
+        self._git_sync.ack(ids)
+        return len(changes)
 
     def sleep(self):
-        """Sleeps, pushes to git, updates status."""
-        # 1. Push to Git
-        git_res = self._git_push()
-        
-        msg = ""
-        if git_res is True:
-            msg = "Git push successful."
-            # Update [IN WAIT] to [CLOUD]
-            updated_count = 0
-            for log in self.logs:
-                if log["status"] == "[IN WAIT]":
-                    log["status"] = "[CLOUD]"
-                    updated_count += 1
-            self._save_logs_data()
-            if updated_count > 0:
-                msg += f" Marked {updated_count} logs as [CLOUD]."
-        else:
-            msg = f"Git failed: {git_res}"
+        """Sleeps and queues the git sync; [IN WAIT] logs become [CLOUD] once the push lands."""
+        # 1. Queue the push (the worker refreshes the ~/journal/evove mirror first)
+        archived = self.archive_cold_logs()
+        self._storage.checkpoint()
+        waiting = [self.logs[position].get("id") for position in self._status_index.get("[IN WAIT]", [])]
+        self.request_sync("sleep", promote=waiting)
+        msg = "Git sync queued."
+        if waiting:
+            msg += f" {len(waiting)} logs will be marked [CLOUD] after the push."
+        if archived:
+            msg += f" Archived {archived} old logs."
             
         # 2. Log sleep time (service)
         sleep_time = sleep_service.log_sleep()
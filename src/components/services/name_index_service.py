@@ -0,0 +1,95 @@
+import os
+import json
+
+
+def collect_names(obj, into=None):
+    """Every non-blank string under a "name" key, at any depth."""
+    names = set() if into is None else into
+    if isinstance(obj, dict):
+        name = obj.get("name")
+        if isinstance(name, str) and name.strip():
+            names.add(name.strip())
+        for value in obj.values():
+            collect_names(value, names)
+    elif isinstance(obj, list):
+        for value in obj:
+            collect_names(value, names)
+    return names
+
+
+class NameIndex:
+    """Entity names for autocomplete, kept per source so updates stay incremental.
+
+    Sources are either JSON files under `data_dir` (re-parsed only when their mtime/size
+    changes) or live objects fed through set_source() (e.g. one per user entity).
+    """
+
+    def __init__(self, data_dir, exclude=()):
+        self.data_dir = data_dir
+        self.exclude = set(exclude)  # file names whose content is fed as live sources
+        self._sources = {}  # source -> set of names
+        self._counts = {}   # name -> number of sources holding it
+        self._files = {}    # path -> (mtime_ns, size)
+        self._sorted = None
+
+    def names(self):
+        """Sorted names of every source (changed files are re-read first)."""
+        self._refresh_files()
+        if self._sorted is None:
+            self._sorted = sorted(self._counts)
+        return self._sorted
+
+    def set_source(self, source, names):
+        names = set(names)
+        old = self._sources.get(source, set())
+        if names == old:
+            return
+        for name in old - names:
+            self._counts[name] -= 1
+            if not self._counts[name]:
+                del self._counts[name]
+                self._sorted = None
+        for name in names - old:
+            if name not in self._counts:
+                self._counts[name] = 0
+                self._sorted = None
+            self._counts[name] += 1
+        if names:
+            self._sources[source] = names
+        else:
+            self._sources.pop(source, None)
+
+    def drop_source(self, source):
+        self.set_source(source, ())
+
+    def drop_group(self, group):
+        """Drops every tuple source whose first item is `group`."""
+        for source in [s for s in self._sources if isinstance(s, tuple) and s and s[0] == group]:
+            self.drop_source(source)
+
+    def _refresh_files(self):
+        seen = set()
+        for root, _, files in os.walk(self.data_dir):
+            for fname in files:
+                if not fname.endswith(".json") or fname in self.exclude:
+                    continue
+                path = os.path.join(root, fname)
+                seen.add(path)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self._files.get(path) == stamp:
+                    continue
+                self._files[path] = stamp
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except Exception:
+                    self.drop_source(("file", path))
+                    continue
+                self.set_source(("file", path), collect_names(data))
+        for path in [p for p in self._files if p not in seen]:
+            del self._files[path]
+            self.drop_source(("file", path))
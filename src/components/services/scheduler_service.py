@@ -0,0 +1,132 @@
+import heapq
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+
+def next_midnight(now):
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
+
+class Scheduler:
+    """Time-driven jobs kept in a min-heap by next due time, run from one timer thread.
+
+    A job is `fn(now) -> next due datetime or None`; None leaves it idle until someone
+    calls schedule()/wake() for it (e.g. when the state it watches changes). Jobs run
+    holding `lock`; front-ends hold it while they touch the same state.
+    """
+
+    MIN_INTERVAL = timedelta(seconds=1)  # a job can't ask to run again sooner than this
+    RETRY_AFTER = timedelta(minutes=1)   # after a job raises
+    MAX_SLEEP = 60  # seconds; re-checks the clock even if nothing is due (suspend, clock jumps)
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._cond = threading.Condition()
+        self._jobs = {}  # name -> fn
+        self._due = {}   # name -> armed due time
+        self._heap = []  # (due, seq, name); entries that don't match _due are stale
+        self._seq = 0
+        self._thread = None
+        self.runs = {}   # name -> times run
+        self.errors = {}  # name -> last failure, cleared when the job next succeeds
+        self.on_error = None  # fn(name, exc), called holding `lock`; front-ends route it to the user
+
+    def register(self, name, fn, due=None):
+        with self._cond:
+            self._jobs[name] = fn
+        if due is not None:
+            self.schedule(name, due)
+
+    def schedule(self, name, due):
+        """Arms `name` at `due`, unless it is already armed earlier."""
+        with self._cond:
+            current = self._due.get(name)
+            if current is not None and current <= due:
+                return
+            self._due[name] = due
+            self._seq += 1
+            heapq.heappush(self._heap, (due, self._seq, name))
+            self._cond.notify()
+
+    def wake(self, name):
+        self.schedule(name, datetime.now())
+
+    def next_due(self):
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pending(self):
+        """{name: due} of armed jobs, soonest first."""
+        with self._cond:
+            return dict(sorted(self._due.items(), key=lambda item: item[1]))
+
+    def tick(self, now=None):
+        """Runs every job due by `now`; returns how many ran."""
+        now = now or datetime.now()
+        due_jobs = []
+        with self._cond:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, name = heapq.heappop(self._heap)
+                del self._due[name]
+                due_jobs.append(name)
+                self._drop_stale()
+        for name in due_jobs:
+            fn = self._jobs.get(name)
+            if fn is None:
+                continue
+            with self.lock:
+                try:
+                    next_due = fn(now)
+                    self.errors.pop(name, None)
+                except Exception as e:
+                    # Reported once per failure streak, not on every retry
+                    if name not in self.errors and self.on_error is not None:
+                        self.on_error(name, e)
+                    self.errors[name] = str(e)
+                    next_due = now + self.RETRY_AFTER
+            self.runs[name] = self.runs.get(name, 0) + 1
+            if next_due is not None:
+                self.schedule(name, max(next_due, now + self.MIN_INTERVAL))
+        return len(due_jobs)
+
+    def start(self):
+        """Starts the timer thread (once)."""
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="evove-scheduler", daemon=True)
+                self._thread.start()
+
+    @contextmanager
+    def idle(self):
+        """Lets due jobs run while the caller blocks (e.g. on a key read); a no-op unless it holds `lock`."""
+        try:
+            self.lock.release()
+        except RuntimeError:
+            yield
+            return
+        try:
+            yield
+        finally:
+            self.lock.acquire()
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                due = self.next_due()
+                timeout = self.MAX_SLEEP
+                if due is not None:
+                    timeout = min(timeout, max((due - datetime.now()).total_seconds(), 0))
+                if timeout > 0:
+                    self._cond.wait(timeout)
+            self.tick()
+
+
+scheduler = Scheduler()
@@ -0,0 +1,115 @@
+try:
+    import numpy as np
+except ImportError:  # optional: the engine falls back to plain Python sums
+    np = None
+
+
+class ScoreEngine:
+    """Columnar snapshot of the action table for whole-tree score math.
+
+    Mirrors every action as three columns (value, type factor, difficulty multiplier)
+    and every attribute as a row of a membership matrix: how many times each action is
+    summed into its total_score (its own related actions, or those of its children for a
+    parent). Totals, per-attribute sums and "what-if" projections are then one
+    expression over the arrays. Without NumPy the same API runs on lists.
+
+    Built from the live objects by build(). refresh() re-reads the columns after value,
+    type or difficulty edits; added/removed actions or changed links need a new build().
+    """
+
+    def __init__(self, action_ids, values, factors, multipliers, attribute_ids, members):
+        self.action_ids = list(action_ids)
+        self.attribute_ids = list(attribute_ids)
+        self._column = {aid: i for i, aid in enumerate(self.action_ids)}
+        self._set_columns(values, factors, multipliers)
+        if np is not None:
+            shape = (len(self.attribute_ids), len(self.action_ids))
+            rows = np.repeat(np.arange(len(members)), [len(columns) for columns in members])
+            columns = np.fromiter((c for cs in members for c in cs), dtype=np.intp, count=len(rows))
+            # Counting flat (row, column) cells keeps repeated actions summed twice, like sum()
+            counts = np.bincount(rows * shape[1] + columns, minlength=shape[0] * shape[1])
+            self.members = counts.reshape(shape).astype(float)
+        else:
+            self.members = members  # per attribute: list of action columns (with repeats)
+
+    def _set_columns(self, values, factors, multipliers):
+        if np is not None:
+            self.values = np.asarray(values, dtype=float)
+            self.weights = np.asarray(factors, dtype=float) * np.asarray(multipliers, dtype=float)
+        else:
+            self.values = [float(v) for v in values]
+            self.weights = [float(f) * float(m) for f, m in zip(factors, multipliers)]
+
+    @staticmethod
+    def _read_columns(actions):
+        values, factors, multipliers = [], [], []
+        for action in actions.values():
+            values.append(action._value)
+            factors.append(action._TYPE_MAP[action._tipo]["factor"])
+            multipliers.append(action._diff_multiplier)
+        return values, factors, multipliers
+
+    @classmethod
+    def build(cls, actions, attributes):
+        """From the user's action/attribute dicts (deleted actions still count, as in score)."""
+        action_ids = list(actions)
+        column = {aid: i for i, aid in enumerate(action_ids)}
+        values, factors, multipliers = cls._read_columns(actions)
+
+        def related(attr):
+            return [column[a._id] for a in attr._related_actions if a._id in column]
+
+        members = []
+        for attr in attributes.values():
+            if attr._children:
+                members.append([c for child in attr._children for c in related(child)])
+            else:
+                members.append(related(attr))
+        return cls(action_ids, values, factors, multipliers, list(attributes), members)
+
+    def refresh(self, actions):
+        """Re-reads value/type/difficulty columns; the action set and layout must be unchanged."""
+        self._set_columns(*self._read_columns(actions))
+
+    @property
+    def vectorized(self):
+        return np is not None
+
+    def action_scores(self, values=None):
+        values = self.values if values is None else values
+        if np is not None:
+            return values * self.weights
+        return [v * w for v, w in zip(values, self.weights)]
+
+    def attribute_totals(self, values=None, scores=None):
+        scores = self.action_scores(values) if scores is None else scores
+        if np is not None:
+            return self.members @ scores
+        return [sum(scores[c] for c in columns) for columns in self.members]
+
+    def totals(self, values=None, default_score=0):
+        """{score, total_points, attributes: {id: total_score}} for the given value column."""
+        scores = self.action_scores(values)
+        attrs = self.attribute_totals(scores=scores)
+        if np is not None:
+            total_points = float(scores.sum())
+            attrs = attrs.tolist()
+        else:
+            total_points = float(sum(scores))
+        return {
+            "score": sum(attrs) / len(attrs) if attrs else default_score,
+            "total_points": total_points,
+            "attributes": dict(zip(self.attribute_ids, attrs)),
+        }
+
+    def project(self, increments, default_score=0):
+        """Totals as if each action in `increments` ({action_id: amount}) had that much more value."""
+        if np is not None:
+            values = self.values.copy()
+        else:
+            values = list(self.values)
+        for aid, amount in increments.items():
+            column = self._column.get(aid)
+            if column is not None:
+                values[column] += float(amount)
+        return self.totals(values, default_score)
@@ -1,30 +1,23 @@
-import os
-import json
 from datetime import datetime
+from src.components.services.storage_service import storage, CorruptDocument
+from src.components.services.scheduler_service import next_midnight
 
 class SequenceService:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_path = os.path.join(base_dir, "data", "sequences.json")
         self.sequences = self._load_data()
+        self._unsaved = False  # day counts advanced in memory but not yet written
 
     def _load_data(self):
-        if os.path.exists(self.data_path):
-            try:
-                with open(self.data_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {"sequences": []}
-        return {"sequences": []}
+        try:
+            data = storage.read_document("sequences")
+        except CorruptDocument:
+            data = None
+        return data or {"sequences": []}
 
     def _save_data(self):
         try:
-            os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
-            with open(self.data_path, 'w', encoding='utf-8') as f:
-                json.dump(self.sequences, f, indent=4)
-            from src.components.services.backup_service import backup_json
-            backup_json(self.data_path)
-        except IOError as e:
+            storage.write_document("sequences", self.sequences)
+        except Exception as e:
             print(f"Error saving sequences: {e}")
 
     def create_sequence(self, label, start_value):
@@ -41,7 +34,10 @@ class SequenceService:
         return f"Sequence '{label}' created starting at {start_value} on {date_str}."
 
     def update_sequences(self):
-        """Called during sleep to increment day counts based on date difference."""
+        """Increments day counts based on date difference (the scheduler runs it at midnight).
+
+        A failed save raises, so the scheduler reports it and the retry writes again.
+        """
         now = datetime.now()
         updated_count = 0
         for seq in self.sequences["sequences"]:
@@ -52,10 +48,20 @@ class SequenceService:
                 seq["current_value"] = new_current
                 updated_count += 1
         
-        if updated_count > 0:
-            self._save_data()
+        if updated_count > 0 or self._unsaved:
+            self._unsaved = True
+            storage.write_document("sequences", self.sequences)
+            self._unsaved = False
         return updated_count
 
+    def register_jobs(self, scheduler):
+        """Day counts only change at midnight."""
+        scheduler.register("sequences", self._sequences_job, due=datetime.now())
+
+    def _sequences_job(self, now):
+        self.update_sequences()
+        return next_midnight(now)
+
     def get_current_sequences_str(self):
         if not self.sequences["sequences"]:
             return "No sequences found."
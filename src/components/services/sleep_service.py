@@ -1,30 +1,21 @@
-import os
-import json
 from datetime import datetime
+from src.components.services.storage_service import storage
 
 class SleepService:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_path = os.path.join(base_dir, "data", "sleep_data.json")
         self.data = self._load_data()
 
     def _load_data(self):
-        if os.path.exists(self.data_path):
-            try:
-                with open(self.data_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {"logs": []}
-        return {"logs": []}
+        try:
+            return {"logs": storage.read_rows("sleep")}
+        except Exception:
+            return {"logs": []}
 
-    def _save_data(self):
+    def _save_entry(self, entry):
+        self.data["logs"].append(entry)
         try:
-            os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
-            with open(self.data_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4)
-            from src.components.services.backup_service import backup_json
-            backup_json(self.data_path)
-        except IOError as e:
+            storage.append_rows("sleep", [entry])
+        except Exception as e:
             print(f"Error saving sleep data: {e}")
 
     def log_sleep(self):
@@ -34,8 +25,7 @@ class SleepService:
             "timestamp": now.isoformat(),
             "date": now.strftime("%d %m %Y")
         }
-        self.data["logs"].append(entry)
-        self._save_data()
+        self._save_entry(entry)
         return now
 
     def log_wake(self):
@@ -62,8 +52,7 @@ class SleepService:
             "date": now.strftime("%d %m %Y"),
             "duration": duration_str
         }
-        self.data["logs"].append(entry)
-        self._save_data()
+        self._save_entry(entry)
         return now, duration_str
 
 sleep_service = SleepService()
@@ -0,0 +1,467 @@
+import os
+import sys
+import json
+import sqlite3
+import threading
+
+from src.components.services.wal_service import WriteAheadLog, JsonlTable
+
+
+def _data_dir():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, "data")
+
+
+class CorruptDocument(Exception):
+    pass
+
+
+class JsonStorage:
+    """Whole-file JSON stores in data/ (the original layout).
+
+    Documents: user, sequences, agenda, fountain -> <name>.json (user also keeps a delta log).
+    Row tables: logs -> logs.jsonl (append-only, migrated from logs.json),
+    sleep -> sleep_data.json {"logs": [...]}.
+    """
+
+    ROW_FILES = {
+        "sleep": ("sleep_data.json", "logs"),
+    }
+    # table -> (segment file, legacy whole-file JSON, legacy wrapper key)
+    JSONL_TABLES = {
+        "logs": ("logs.jsonl", "logs.json", None),
+    }
+
+    def __init__(self, data_dir=None):
+        self.data_dir = data_dir or _data_dir()
+        self._wals = {}
+        self._rows = {}
+        self._tables = {}
+
+    # ---------- documents ----------
+    def _document_path(self, name):
+        return os.path.join(self.data_dir, f"{name}.json")
+
+    def _wal(self, name):
+        if name not in self._wals:
+            self._wals[name] = WriteAheadLog(self._document_path(name))
+        return self._wals[name]
+
+    def document_exists(self, name):
+        return os.path.exists(self._document_path(name))
+
+    def read_document(self, name):
+        """Returns the stored dict (snapshot + delta log), None if missing."""
+        path = self._document_path(name)
+        if not os.path.exists(path):
+            return None
+        if os.path.getsize(path) == 0:
+            raise CorruptDocument("empty save file.")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            raise CorruptDocument("corrupted save file.")
+        return self._wal(name).replay(data)
+
+    def write_document(self, name, data):
+        os.makedirs(self.data_dir, exist_ok=True)
+        wal = self._wal(name)
+        wal.compact(data)
+        self._backup(wal.snapshot_path)
+        self._backup(wal.log_path)
+
+    def patch_document(self, name, delta, snapshot=None):
+        """Appends a delta record; `snapshot()` gives the full state when it is time to compact."""
+        wal = self._wal(name)
+        wal.append(delta)
+        if snapshot is not None and wal.should_compact():
+            wal.compact(snapshot())
+            self._backup(wal.snapshot_path)
+        self._backup(wal.log_path)
+
+    def document_fingerprint(self, name):
+        parts = []
+        wal = self._wal(name)
+        for path in (wal.snapshot_path, wal.log_path):
+            try:
+                st = os.stat(path)
+                parts.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                parts.append(None)
+        return tuple(parts)
+
+    # ---------- row tables ----------
+    def _rows_path(self, table):
+        return os.path.join(self.data_dir, self.ROW_FILES[table][0])
+
+    def _table(self, table):
+        if table not in self._tables:
+            segment, legacy, wrapper = self.JSONL_TABLES[table]
+            self._tables[table] = JsonlTable(
+                os.path.join(self.data_dir, segment), os.path.join(self.data_dir, legacy), wrapper
+            )
+        return self._tables[table]
+
+    def read_rows(self, table, status=None):
+        if table in self.JSONL_TABLES:
+            # Copies, as SqliteStorage returns: callers edit their rows before persisting them,
+            # and the table cache must keep matching the file until the write succeeds
+            rows = self._table(table).load()
+            if status is not None:
+                return [dict(r) for r in rows if r.get("status") == status]
+            return [dict(r) for r in rows]
+        path = self._rows_path(table)
+        rows = []
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                wrapper = self.ROW_FILES[table][1]
+                rows = data.get(wrapper, []) if wrapper else data
+            except (json.JSONDecodeError, IOError, AttributeError):
+                rows = []
+        if not isinstance(rows, list):
+            rows = []
+        self._rows[table] = rows
+        if status is not None:
+            return [r for r in rows if r.get("status") == status]
+        return list(rows)
+
+    def _cached_rows(self, table):
+        if table not in self._rows:
+            self.read_rows(table)
+        return self._rows[table]
+
+    def _write_rows(self, table):
+        path = self._rows_path(table)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        wrapper = self.ROW_FILES[table][1]
+        rows = self._rows[table]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({wrapper: rows} if wrapper else rows, f, indent=4)
+        self._backup(path)
+
+    def append_rows(self, table, rows, changes=None):
+        """Appends `rows`; `changes` (as in update_rows) is applied in the same write."""
+        if table in self.JSONL_TABLES:
+            segment = self._table(table)
+            segment.append(rows, changes)
+            if segment.should_compact():
+                segment.compact()
+            self._backup(segment.path)
+            return
+        self._cached_rows(table).extend(rows)
+        self._apply_changes(table, changes or {})
+        self._write_rows(table)
+
+    def rows_fingerprint(self, table):
+        """Changes whenever the table's file changes on disk."""
+        path = self._table(table).path if table in self.JSONL_TABLES else self._rows_path(table)
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+
+    def replace_rows(self, table, rows):
+        """Rewrites a whole table (one-off fixes, not the normal write path)."""
+        if table in self.JSONL_TABLES:
+            segment = self._table(table)
+            segment.replace(rows)
+            self._backup(segment.path)
+            return
+        self._rows[table] = list(rows)
+        self._write_rows(table)
+
+    def update_rows(self, table, changes):
+        """`changes` maps row id -> fields to overwrite."""
+        if not changes:
+            return
+        if table in self.JSONL_TABLES:
+            segment = self._table(table)
+            segment.update(changes)
+            if segment.should_compact():
+                segment.compact()
+            self._backup(segment.path)
+            return
+        self._apply_changes(table, changes)
+        self._write_rows(table)
+
+    def _apply_changes(self, table, changes):
+        if not changes:
+            return
+        for row in self._cached_rows(table):
+            # Legacy rows without an id can't be addressed (their dicts are shared with callers)
+            fields = changes.get(row.get("id")) if row.get("id") is not None else None
+            if fields:
+                row.update(fields)
+
+    def checkpoint(self):
+        """Folds pending patch records back into the row segments."""
+        for table in self.JSONL_TABLES:
+            segment = self._table(table)
+            segment.load()
+            if segment.patches:
+                segment.compact()
+                self._backup(segment.path)
+
+    def _backup(self, path):
+        from src.components.services.backup_service import backup_json
+        backup_json(path)
+
+
+class SqliteStorage:
+    """Single SQLite database (WAL mode) with row-level writes and indexed reads."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS document_rows (
+            document TEXT NOT NULL,
+            section TEXT NOT NULL,
+            key TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            body TEXT NOT NULL,
+            PRIMARY KEY (document, section, key)
+        );
+        CREATE TABLE IF NOT EXISTS logs (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER UNIQUE,
+            timestamp TEXT,
+            status TEXT,
+            body TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_logs_status ON logs (status, seq);
+        CREATE TABLE IF NOT EXISTS sleep (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT,
+            timestamp TEXT,
+            body TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sleep_type ON sleep (type, seq);
+    """
+    ROW_COLUMNS = {
+        "logs": ("id", "timestamp", "status"),
+        "sleep": ("type", "timestamp"),
+    }
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(_data_dir(), "evove.db")
+        self.data_dir = os.path.dirname(self.db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # Web server handlers run on worker threads; one connection guarded by a lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    # ---------- documents ----------
+    def document_exists(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM documents WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    def read_document(self, name):
+        with self._lock:
+            if not self.document_exists(name):
+                return None
+            rows = self._conn.execute(
+                "SELECT section, key, kind, body FROM document_rows WHERE document = ?", (name,)
+            ).fetchall()
+        data = {}
+        for section, key, kind, body in rows:
+            if kind == "dict":
+                data.setdefault(section, {})
+            elif kind == "item":
+                data.setdefault(section, {})[key] = json.loads(body)
+            else:
+                data[section] = json.loads(body)
+        return data
+
+    def _bump(self, name):
+        self._conn.execute(
+            "INSERT INTO documents (name, version) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET version = version + 1",
+            (name,),
+        )
+
+    def _put_section(self, name, section, value):
+        self._conn.execute("DELETE FROM document_rows WHERE document = ? AND section = ?", (name, section))
+        if isinstance(value, dict):
+            # Marker row keeps empty dict sections around
+            self._conn.execute(
+                "INSERT INTO document_rows (document, section, key, kind, body) VALUES (?, ?, '', 'dict', '{}')",
+                (name, section),
+            )
+            self._conn.executemany(
+                "INSERT INTO document_rows (document, section, key, kind, body) VALUES (?, ?, ?, 'item', ?)",
+                [(name, section, k, json.dumps(v)) for k, v in value.items()],
+            )
+        else:
+            self._conn.execute(
+                "INSERT INTO document_rows (document, section, key, kind, body) VALUES (?, ?, '', 'value', ?)",
+                (name, section, json.dumps(value)),
+            )
+
+    def write_document(self, name, data):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM document_rows WHERE document = ?", (name,))
+            for section, value in data.items():
+                self._put_section(name, section, value)
+            self._bump(name)
+
+    def patch_document(self, name, delta, snapshot=None):
+        """Row-level upserts/deletes; `snapshot` is unused (no compaction needed)."""
+        with self._lock, self._conn:
+            for section, changed in (delta.get("set") or {}).items():
+                self._conn.execute(
+                    "DELETE FROM document_rows WHERE document = ? AND section = ? AND kind = 'value'",
+                    (name, section),
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO document_rows (document, section, key, kind, body) "
+                    "VALUES (?, ?, '', 'dict', '{}')",
+                    (name, section),
+                )
+                self._conn.executemany(
+                    "INSERT INTO document_rows (document, section, key, kind, body) VALUES (?, ?, ?, 'item', ?) "
+                    "ON CONFLICT(document, section, key) DO UPDATE SET body = excluded.body",
+                    [(name, section, k, json.dumps(v)) for k, v in changed.items()],
+                )
+            for section, value in (delta.get("put") or {}).items():
+                self._put_section(name, section, value)
+            for section, keys in (delta.get("del") or {}).items():
+                self._conn.executemany(
+                    "DELETE FROM document_rows WHERE document = ? AND section = ? AND key = ?",
+                    [(name, section, k) for k in keys],
+                )
+            self._bump(name)
+
+    def document_fingerprint(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM documents WHERE name = ?", (name,)).fetchone()
+        return ("sqlite", row[0] if row else None)
+
+    # ---------- row tables ----------
+    def read_rows(self, table, status=None):
+        with self._lock:
+            if status is not None and table == "logs":
+                cur = self._conn.execute("SELECT body FROM logs WHERE status = ? ORDER BY seq", (status,))
+            elif table in self.ROW_COLUMNS:
+                cur = self._conn.execute(f"SELECT body FROM {table} ORDER BY seq")
+            else:
+                raise KeyError(table)
+            return [json.loads(body) for (body,) in cur.fetchall()]
+
+    def append_rows(self, table, rows, changes=None):
+        with self._lock, self._conn:
+            self._insert_rows(table, rows)
+            if changes:
+                self._apply_changes(table, changes)
+
+    def rows_fingerprint(self, table):
+        # data_version only moves when another connection commits
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            count = self._conn.execute(f"SELECT MAX(seq) FROM {table}").fetchone()[0]
+        return ("sqlite", version, count)
+
+    def replace_rows(self, table, rows):
+        if table not in self.ROW_COLUMNS:
+            raise KeyError(table)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {table}")
+            self._insert_rows(table, rows)
+
+    def update_rows(self, table, changes):
+        if not changes:
+            return
+        with self._lock, self._conn:
+            self._apply_changes(table, changes)
+
+    def _insert_rows(self, table, rows):
+        """Runs inside the caller's transaction."""
+        columns = self.ROW_COLUMNS[table]
+        placeholders = ", ".join("?" for _ in columns)
+        self._conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}, body) VALUES ({placeholders}, ?)",
+            [tuple(row.get(c) for c in columns) + (json.dumps(row),) for row in rows],
+        )
+
+    def _apply_changes(self, table, changes):
+        """Runs inside the caller's transaction."""
+        columns = self.ROW_COLUMNS[table]
+        assignments = ", ".join(f"{c} = ?" for c in columns if c != "id")
+        for row_id, fields in changes.items():
+            found = self._conn.execute(f"SELECT body FROM {table} WHERE id = ?", (row_id,)).fetchone()
+            if not found:
+                continue
+            row = json.loads(found[0])
+            row.update(fields)
+            values = [row.get(c) for c in columns if c != "id"]
+            self._conn.execute(
+                f"UPDATE {table} SET {assignments}, body = ? WHERE id = ?",
+                values + [json.dumps(row), row_id],
+            )
+
+    def checkpoint(self):
+        """Mirrors the database into the backup dir (before a git sync)."""
+        from src.components.services.backup_service import backup_sqlite
+        with self._lock:
+            backup_sqlite(self._conn)
+
+
+def migrate_json_to_sqlite(source=None, target=None, force=False):
+    """One-shot copy of every JSON store into the SQLite database."""
+    source = source or JsonStorage()
+    target = target or SqliteStorage()
+    report = {}
+    for name in ("user", "sequences", "agenda", "fountain"):
+        if target.document_exists(name) and not force:
+            report[name] = "skipped (already in database)"
+            continue
+        try:
+            data = source.read_document(name)
+        except CorruptDocument as e:
+            report[name] = f"skipped ({e})"
+            continue
+        if data is None:
+            report[name] = "missing"
+            continue
+        target.write_document(name, data)
+        report[name] = "migrated"
+    for table in ("logs", "sleep"):
+        if target.read_rows(table) and not force:
+            report[table] = "skipped (already in database)"
+            continue
+        rows = source.read_rows(table)
+        if rows:
+            # Replaces what --force found there instead of duplicating or colliding on ids
+            target.replace_rows(table, rows)
+        report[table] = f"migrated {len(rows)} rows"
+    return report
+
+
+def _create_storage():
+    # EVOVE_STORAGE=sqlite switches every service to data/evove.db
+    backend = os.environ.get("EVOVE_STORAGE", "json").strip().lower()
+    if backend == "sqlite":
+        return SqliteStorage()
+    return JsonStorage()
+
+
+storage = _create_storage()
+
+
+if __name__ == "__main__":
+    # python -m src.components.services.storage_service migrate [--force]
+    if len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        result = migrate_json_to_sqlite(force="--force" in sys.argv)
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    else:
+        print("usage: python -m src.components.services.storage_service migrate [--force]")
@@ -0,0 +1,125 @@
+import math
+import time
+import heapq
+import bisect
+from datetime import datetime
+
+
+def log_time(timestamp):
+    """Epoch seconds of a log timestamp ("dd mm yyyy : HH:MM:SS"), or None."""
+    try:
+        return datetime(
+            int(timestamp[6:10]), int(timestamp[3:5]), int(timestamp[0:2]),
+            int(timestamp[13:15]), int(timestamp[16:18]), int(timestamp[19:21]),
+        ).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _Node:
+    __slots__ = ("children", "keys", "ranks")
+
+    def __init__(self):
+        self.children = {}
+        self.keys = []   # best keys in this subtree, highest rank first
+        self.ranks = []  # their ranks, negated so the list is ascending for bisect
+
+
+class SuggestionIndex:
+    """Prefix trie over log contents ranked by exponentially decayed usage.
+
+    Every use adds 1 to a score that halves every HALF_LIFE_DAYS, so frequent and recent
+    entries win. A score s last bumped at t0 is worth s * 2^-((now - t0) / half_life) later;
+    ranking by log2(s) + t0 / half_life orders entries the same way at any `now`, and that
+    rank only grows on use, so each node can keep an exact top-k of its subtree.
+    """
+
+    HALF_LIFE_DAYS = 14
+    TOP_K = 60
+
+    def __init__(self):
+        self.half_life = self.HALF_LIFE_DAYS * 86400
+        self._root = _Node()
+        self._entries = {}  # folded key -> [display text, score, stamp, rank]
+        self.base = None      # first entry of the latest day seen
+        self.base_day = None
+        self._base_when = None
+
+    def add(self, text, when=None):
+        key = self._record(text, when)
+        if key is not None:
+            self._promote(key)
+
+    def add_many(self, items):
+        """Bulk load of (text, when) pairs: scores first, then every node's top-k once."""
+        for text, when in items:
+            self._record(text, when)
+        self._root = _Node()
+        for key, entry in self._entries.items():
+            rank = -entry[3]
+            node = self._root
+            node.keys.append((rank, key))
+            for char in key:
+                node = node.children.get(char) or node.children.setdefault(char, _Node())
+                node.keys.append((rank, key))
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            best = heapq.nsmallest(self.TOP_K, node.keys)
+            node.ranks = [rank for rank, _ in best]
+            node.keys = [key for _, key in best]
+            pending.extend(node.children.values())
+
+    def top(self, prefix="", limit=TOP_K):
+        """Best `limit` entries (display text) starting with `prefix`, case-insensitive."""
+        node = self._root
+        for char in str(prefix or "").lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self._entries[key][0] for key in node.keys[:limit]]
+
+    def _record(self, text, when):
+        """Updates the entry's decayed score; returns its key (None for blank text)."""
+        text = str(text or "").strip()
+        if not text:
+            return None
+        when = time.time() if when is None else when
+        day = datetime.fromtimestamp(when).date()
+        if self.base_day is None or day > self.base_day or (day == self.base_day and when < self._base_when):
+            self.base_day, self.base, self._base_when = day, text, when
+
+        key = text.lower()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = [text, 0.0, when, -math.inf]
+            self._entries[key] = entry
+        elapsed = max(when - entry[2], 0.0)
+        entry[0] = text
+        entry[1] = entry[1] * 2 ** (-elapsed / self.half_life) + 1
+        entry[2] = max(entry[2], when)
+        entry[3] = math.log2(entry[1]) + entry[2] / self.half_life
+        return key
+
+    def _promote(self, key):
+        rank = -self._entries[key][3]
+        node = self._root
+        self._place(node, key, rank)
+        for char in key:
+            node = node.children.get(char) or node.children.setdefault(char, _Node())
+            self._place(node, key, rank)
+
+    def _place(self, node, key, rank):
+        keys, ranks = node.keys, node.ranks
+        try:
+            position = keys.index(key)
+            del keys[position], ranks[position]
+        except ValueError:
+            if len(keys) >= self.TOP_K and ranks[-1] <= rank:
+                return
+        position = bisect.bisect_left(ranks, rank)
+        keys.insert(position, key)
+        ranks.insert(position, rank)
+        if len(keys) > self.TOP_K:
+            keys.pop()
+            ranks.pop()
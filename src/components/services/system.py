@@ -7,6 +7,7 @@ from src.components.services.UI.interface import ui
 from src.components.services.dial_interaction.dial_digest import dial
 from src.components.entitys.entity_manager import EntityManager
 from src.components.services.challenge_service import ChallengeManager
+from src.components.services.scheduler_service import scheduler
 
 from src.components.data.constants import (
     user,
@@ -17,28 +18,31 @@ from src.components.data.constants import (
 )
 
 def _prompt_cli_input(message, autocomplete=None):
+    completer = None
     if autocomplete:
         try:
             import readline
-            matches = sorted(set(autocomplete))
-            def completer(text, state):
-                options = [m for m in matches if m.lower().startswith(text.lower())]
-                if state < len(options):
-                    return options[state]
-                return None
-            readline.set_completer(completer)
+            from src.components.services.completion_service import NameCompleter, completion_usage
+            completer = NameCompleter(autocomplete, completion_usage.counts)
+            readline.set_completer(completer.complete)
             readline.parse_and_bind("tab: complete")
         except Exception:
             pass
     ui.clear_screen()
     print(message)
-    value = input("> ")
+    # The prompt can stay open indefinitely; due jobs must not wait for it
+    with scheduler.idle():
+        value = input("> ")
     if autocomplete:
         try:
             import readline
             readline.set_completer(None)
         except Exception:
             pass
+        if completer is not None and value.strip() in completer:
+            # Picked names rank first next time
+            from src.components.services.completion_service import completion_usage
+            completion_usage.record(value.strip())
     ui.clear_screen()
     return value
 
@@ -46,9 +50,19 @@ def dial_start():
     user.load_user()
     em = EntityManager()
     cm = ChallengeManager(user, em)
+
+    # Time-driven state (refills, spawns, deadlines, expiries) runs on the scheduler timer
+    from src.components.services.sequence_service import sequence_service
+    from src.components.services.journal_service import journal_service
+    for subsystem in (user, em, cm, sequence_service, journal_service):
+        subsystem.register_jobs(scheduler)
+    scheduler.on_error = lambda name, e: user.add_message(f"[scheduler] {name} failed: {e}")
+    scheduler.start()
     
     try:
         buffer = ""
+        # Held while handling input; released only while waiting for a key
+        scheduler.lock.acquire()
         while True:
             # Process any existing messages from entities BEFORE waiting for input
             current_him = em.get_entity()
@@ -63,22 +77,23 @@ def dial_start():
             # Render interface
             ui.render(buffer)
             
-            # Background checks (will run after each user interaction)
-            em.check_and_spawn()
+            # Challenge roll is per keystroke; everything time-based is a scheduler job
             cm.update()
 
             # Blocking key read - much better for performance
-            key = readchar.readkey()
+            with scheduler.idle():
+                key = readchar.readkey()
             
             if key in (readchar.key.BACKSPACE, '\x7f', '\x08'):
                 buffer = buffer[:-1]
             elif key == readchar.key.ENTER or key == '\r' or key == '\n':
                 # If Enter is pressed, process buffer
                 try:
-                    completed, result = dial.process(buffer, force=True)
-                    if completed:
-                        buffer = ""
-                        _handle_result(result, em, ui)
+                    with user.transaction():
+                        completed, result = dial.process(buffer, force=True)
+                        if completed:
+                            buffer = ""
+                            _handle_result(result, em, ui)
                 except Exception as e:
                     # In case of WebInputInterrupt, we need to import it inside to avoid circular imports if possible
                     # or assume it's the one. Common pattern: check class name or import.
@@ -94,134 +109,135 @@ def dial_start():
                         cli_input = _prompt_cli_input(guide, autocomplete=autocomplete)
                         
 
-                        if e.prompt == "log message":
-                             user.add_log_entry(cli_input)
-                             buffer = ""
-                        elif e.prompt == "status name":
-                             user.create_status(e.options.get("buffer", ""), name=cli_input)
-                             buffer = ""
-                        elif e.prompt == "tag name":
-                             user.create_tag(name=cli_input)
-                             buffer = ""
-                        elif e.prompt in ("unit type", "difficulty (1-5)", "action name"):
-                             current = e
-                             current_input = cli_input
-                             while True:
-                                 step = current.options.get("create_step") if current.options else None
-                                 data = current.options if current.options else {}
-                                 try:
-                                     user.create_action(step=step, data=data, value=current_input)
-                                     buffer = ""
-                                     break
-                                 except WebInputInterrupt as next_e:
-                                     prompt = next_e.prompt
-                                     autocomplete = None
-                                     if next_e.options and next_e.options.get("autocomplete") == "names":
-                                         autocomplete = user._collect_autocomplete_names()
-                                     current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
-                                     current = next_e
-                        elif e.prompt in ("parameter type (1 mark, 2 percentage)", "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)", "parameter name"):
-                             current = e
-                             current_input = cli_input
-                             while True:
-                                 step = current.options.get("create_step") if current.options else None
-                                 data = current.options if current.options else {}
-                                 try:
-                                     user.create_parameter(step=step, data=data, value=current_input)
-                                     buffer = ""
-                                     break
-                                 except WebInputInterrupt as next_e:
-                                     prompt = next_e.prompt
-                                     autocomplete = None
-                                     if next_e.options and next_e.options.get("autocomplete") == "names":
-                                         autocomplete = user._collect_autocomplete_names()
-                                     current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
-                                     current = next_e
-                        elif e.prompt.startswith("parameter value"):
-                             user._attach_status_to_param(
-                                 e.options.get("param_id"),
-                                 e.options.get("status_id"),
-                                 cli_input,
-                             )
-                             buffer = ""
-                        elif e.prompt.startswith("parameter regen") or e.prompt.startswith("parameter start value"):
-                             step = e.options.get("param_step") if e.options else None
-                             data = e.options if e.options else {}
-                             next_step = user.parameter_init_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("param_step")
-                                 data = next_step.get("options", {})
+                        with user.transaction():
+                            if e.prompt == "log message":
+                                 user.add_log_entry(cli_input)
+                                 buffer = ""
+                            elif e.prompt == "status name":
+                                 user.create_status(e.options.get("buffer", ""), name=cli_input)
+                                 buffer = ""
+                            elif e.prompt == "tag name":
+                                 user.create_tag(name=cli_input)
+                                 buffer = ""
+                            elif e.prompt in ("unit type", "difficulty (1-5)", "action name"):
+                                 current = e
+                                 current_input = cli_input
+                                 while True:
+                                     step = current.options.get("create_step") if current.options else None
+                                     data = current.options if current.options else {}
+                                     try:
+                                         user.create_action(step=step, data=data, value=current_input)
+                                         buffer = ""
+                                         break
+                                     except WebInputInterrupt as next_e:
+                                         prompt = next_e.prompt
+                                         autocomplete = None
+                                         if next_e.options and next_e.options.get("autocomplete") == "names":
+                                             autocomplete = user._collect_autocomplete_names()
+                                         current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
+                                         current = next_e
+                            elif e.prompt in ("parameter type (1 mark, 2 percentage)", "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)", "parameter name"):
+                                 current = e
+                                 current_input = cli_input
+                                 while True:
+                                     step = current.options.get("create_step") if current.options else None
+                                     data = current.options if current.options else {}
+                                     try:
+                                         user.create_parameter(step=step, data=data, value=current_input)
+                                         buffer = ""
+                                         break
+                                     except WebInputInterrupt as next_e:
+                                         prompt = next_e.prompt
+                                         autocomplete = None
+                                         if next_e.options and next_e.options.get("autocomplete") == "names":
+                                             autocomplete = user._collect_autocomplete_names()
+                                         current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
+                                         current = next_e
+                            elif e.prompt.startswith("parameter value"):
+                                 user._attach_status_to_param(
+                                     e.options.get("param_id"),
+                                     e.options.get("status_id"),
+                                     cli_input,
+                                 )
+                                 buffer = ""
+                            elif e.prompt.startswith("parameter regen") or e.prompt.startswith("parameter start value"):
+                                 step = e.options.get("param_step") if e.options else None
+                                 data = e.options if e.options else {}
                                  next_step = user.parameter_init_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt.startswith("tag weight"):
-                             step = e.options.get("tag_step") if e.options else None
-                             data = e.options if e.options else {}
-                             next_step = user.tag_link_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("tag_step")
-                                 data = next_step.get("options", {})
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("param_step")
+                                     data = next_step.get("options", {})
+                                     next_step = user.parameter_init_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt.startswith("tag weight"):
+                                 step = e.options.get("tag_step") if e.options else None
+                                 data = e.options if e.options else {}
                                  next_step = user.tag_link_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt.startswith("edit action") or e.prompt.startswith("edit attribute") or e.prompt.startswith("edit parameter") or e.prompt.startswith("edit status"):
-                             step = e.options.get("edit_step") if e.options else None
-                             data = e.options if e.options else {}
-                             if step and step.startswith("action_"):
-                                 next_step = user.action_edit_next(step, data, cli_input)
-                             else:
-                                 next_step = user.misc_edit_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 autocomplete = None
-                                 if next_step.get("options", {}).get("autocomplete") == "names":
-                                     autocomplete = user._collect_autocomplete_names()
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
-                                 step = next_step.get("options", {}).get("edit_step")
-                                 data = next_step.get("options", {})
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("tag_step")
+                                     data = next_step.get("options", {})
+                                     next_step = user.tag_link_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt.startswith("edit action") or e.prompt.startswith("edit attribute") or e.prompt.startswith("edit parameter") or e.prompt.startswith("edit status"):
+                                 step = e.options.get("edit_step") if e.options else None
+                                 data = e.options if e.options else {}
                                  if step and step.startswith("action_"):
                                      next_step = user.action_edit_next(step, data, cli_input)
                                  else:
                                      next_step = user.misc_edit_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt.startswith("agenda "):
-                             step = e.options.get("agenda_step") if e.options else None
-                             data = e.options.get("agenda_data") if e.options else {}
-                             next_step = user.agenda_wizard_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("agenda_step")
-                                 data = next_step.get("options", {}).get("agenda_data", {})
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     autocomplete = None
+                                     if next_step.get("options", {}).get("autocomplete") == "names":
+                                         autocomplete = user._collect_autocomplete_names()
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
+                                     step = next_step.get("options", {}).get("edit_step")
+                                     data = next_step.get("options", {})
+                                     if step and step.startswith("action_"):
+                                         next_step = user.action_edit_next(step, data, cli_input)
+                                     else:
+                                         next_step = user.misc_edit_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt.startswith("agenda "):
+                                 step = e.options.get("agenda_step") if e.options else None
+                                 data = e.options.get("agenda_data") if e.options else {}
                                  next_step = user.agenda_wizard_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt == "sequence label":
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("agenda_step")
+                                     data = next_step.get("options", {}).get("agenda_data", {})
+                                     next_step = user.agenda_wizard_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt == "sequence label":
 
-                             print("Complex input incomplete. (Not fully supported in CLI for multi-step yet)")
-                             buffer = ""
-                        elif e.prompt == "sequence start value (integer)":
-                             # This implies label was somehow passed? unlikely via dial.
-                             pass
-                        elif "value" in e.prompt:
-                             # action value
-                             action_id = e.options.get("action_id")
-                             if action_id:
-                                 payload = action_id[1:]
-                                 action = user._actions.get(action_id)
-                                 if action:
-                                     lt = getattr(action, "_logic_type", None)
-                                     st = getattr(action, "_sub_logic_type", None)
-                                     if lt is not None:
-                                         lt = str(lt).zfill(2) if str(lt).isdigit() else str(lt)
-                                         if st is not None:
-                                             st = str(st).zfill(2) if str(st).isdigit() else str(st)
-                                             payload = f"{lt}{st}{payload}"
-                                         else:
-                                             payload = f"{lt}{payload}"
-                                 user.act([payload], cli_input)
+                                 print("Complex input incomplete. (Not fully supported in CLI for multi-step yet)")
                                  buffer = ""
+                            elif e.prompt == "sequence start value (integer)":
+                                 # This implies label was somehow passed? unlikely via dial.
+                                 pass
+                            elif "value" in e.prompt:
+                                 # action value
+                                 action_id = e.options.get("action_id")
+                                 if action_id:
+                                     payload = action_id[1:]
+                                     action = user._actions.get(action_id)
+                                     if action:
+                                         lt = getattr(action, "_logic_type", None)
+                                         st = getattr(action, "_sub_logic_type", None)
+                                         if lt is not None:
+                                             lt = str(lt).zfill(2) if str(lt).isdigit() else str(lt)
+                                             if st is not None:
+                                                 st = str(st).zfill(2) if str(st).isdigit() else str(st)
+                                                 payload = f"{lt}{st}{payload}"
+                                             else:
+                                                 payload = f"{lt}{payload}"
+                                     user.act([payload], cli_input)
+                                     buffer = ""
                              
                     else:
                         raise e
@@ -234,11 +250,12 @@ def dial_start():
 
             if not buffer.startswith(':') and not buffer.startswith('/'):
                 try:
-                    completed, result = dial.process(buffer, force=False)
+                    with user.transaction():
+                        completed, result = dial.process(buffer, force=False)
                     
-                    if completed:
-                        buffer = ""
-                        _handle_result(result, em, ui)
+                        if completed:
+                            buffer = ""
+                            _handle_result(result, em, ui)
                 except Exception as e:
                      from src.components.services.UI.interface import WebInputInterrupt
                      if isinstance(e, WebInputInterrupt):
@@ -251,98 +268,99 @@ def dial_start():
                              autocomplete = user._collect_autocomplete_names()
                         cli_input = _prompt_cli_input(guide, autocomplete=autocomplete)
                         
-                        if e.prompt == "log message":
-                             user.add_log_entry(cli_input)
-                             buffer = ""
-                        elif e.prompt == "status name":
-                             user.create_status(e.options.get("buffer", ""), name=cli_input)
-                             buffer = ""
-                        elif e.prompt == "tag name":
-                             user.create_tag(name=cli_input)
-                             buffer = ""
-                        elif e.prompt in ("unit type", "difficulty (1-5)", "action name"):
-                             current = e
-                             current_input = cli_input
-                             while True:
-                                 step = current.options.get("create_step") if current.options else None
-                                 data = current.options if current.options else {}
-                                 try:
-                                     user.create_action(step=step, data=data, value=current_input)
-                                     buffer = ""
-                                     break
-                                 except WebInputInterrupt as next_e:
-                                     prompt = next_e.prompt
-                                     autocomplete = None
-                                     if next_e.options and next_e.options.get("autocomplete") == "names":
-                                         autocomplete = user._collect_autocomplete_names()
-                                     current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
-                                     current = next_e
-                        elif e.prompt in ("parameter type (1 mark, 2 percentage)", "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)", "parameter name"):
-                             current = e
-                             current_input = cli_input
-                             while True:
-                                 step = current.options.get("create_step") if current.options else None
-                                 data = current.options if current.options else {}
-                                 try:
-                                     user.create_parameter(step=step, data=data, value=current_input)
-                                     buffer = ""
-                                     break
-                                 except WebInputInterrupt as next_e:
-                                     prompt = next_e.prompt
-                                     autocomplete = None
-                                     if next_e.options and next_e.options.get("autocomplete") == "names":
-                                         autocomplete = user._collect_autocomplete_names()
-                                     current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
-                                     current = next_e
-                        elif e.prompt.startswith("parameter value"):
-                             user._attach_status_to_param(
-                                 e.options.get("param_id"),
-                                 e.options.get("status_id"),
-                                 cli_input,
-                             )
-                             buffer = ""
-                        elif e.prompt.startswith("parameter regen") or e.prompt.startswith("parameter start value"):
-                             step = e.options.get("param_step") if e.options else None
-                             data = e.options if e.options else {}
-                             next_step = user.parameter_init_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("param_step")
-                                 data = next_step.get("options", {})
+                        with user.transaction():
+                            if e.prompt == "log message":
+                                 user.add_log_entry(cli_input)
+                                 buffer = ""
+                            elif e.prompt == "status name":
+                                 user.create_status(e.options.get("buffer", ""), name=cli_input)
+                                 buffer = ""
+                            elif e.prompt == "tag name":
+                                 user.create_tag(name=cli_input)
+                                 buffer = ""
+                            elif e.prompt in ("unit type", "difficulty (1-5)", "action name"):
+                                 current = e
+                                 current_input = cli_input
+                                 while True:
+                                     step = current.options.get("create_step") if current.options else None
+                                     data = current.options if current.options else {}
+                                     try:
+                                         user.create_action(step=step, data=data, value=current_input)
+                                         buffer = ""
+                                         break
+                                     except WebInputInterrupt as next_e:
+                                         prompt = next_e.prompt
+                                         autocomplete = None
+                                         if next_e.options and next_e.options.get("autocomplete") == "names":
+                                             autocomplete = user._collect_autocomplete_names()
+                                         current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
+                                         current = next_e
+                            elif e.prompt in ("parameter type (1 mark, 2 percentage)", "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)", "parameter name"):
+                                 current = e
+                                 current_input = cli_input
+                                 while True:
+                                     step = current.options.get("create_step") if current.options else None
+                                     data = current.options if current.options else {}
+                                     try:
+                                         user.create_parameter(step=step, data=data, value=current_input)
+                                         buffer = ""
+                                         break
+                                     except WebInputInterrupt as next_e:
+                                         prompt = next_e.prompt
+                                         autocomplete = None
+                                         if next_e.options and next_e.options.get("autocomplete") == "names":
+                                             autocomplete = user._collect_autocomplete_names()
+                                         current_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}", autocomplete=autocomplete)
+                                         current = next_e
+                            elif e.prompt.startswith("parameter value"):
+                                 user._attach_status_to_param(
+                                     e.options.get("param_id"),
+                                     e.options.get("status_id"),
+                                     cli_input,
+                                 )
+                                 buffer = ""
+                            elif e.prompt.startswith("parameter regen") or e.prompt.startswith("parameter start value"):
+                                 step = e.options.get("param_step") if e.options else None
+                                 data = e.options if e.options else {}
                                  next_step = user.parameter_init_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt.startswith("tag weight"):
-                             step = e.options.get("tag_step") if e.options else None
-                             data = e.options if e.options else {}
-                             next_step = user.tag_link_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("tag_step")
-                                 data = next_step.get("options", {})
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("param_step")
+                                     data = next_step.get("options", {})
+                                     next_step = user.parameter_init_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt.startswith("tag weight"):
+                                 step = e.options.get("tag_step") if e.options else None
+                                 data = e.options if e.options else {}
                                  next_step = user.tag_link_next(step, data, cli_input)
-                             buffer = ""
-                        elif e.prompt.startswith("agenda "):
-                             step = e.options.get("agenda_step") if e.options else None
-                             data = e.options.get("agenda_data") if e.options else {}
-                             next_step = user.agenda_wizard_next(step, data, cli_input)
-                             while next_step:
-                                 prompt = next_step["prompt"]
-                                 cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
-                                 step = next_step.get("options", {}).get("agenda_step")
-                                 data = next_step.get("options", {}).get("agenda_data", {})
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("tag_step")
+                                     data = next_step.get("options", {})
+                                     next_step = user.tag_link_next(step, data, cli_input)
+                                 buffer = ""
+                            elif e.prompt.startswith("agenda "):
+                                 step = e.options.get("agenda_step") if e.options else None
+                                 data = e.options.get("agenda_data") if e.options else {}
                                  next_step = user.agenda_wizard_next(step, data, cli_input)
-                             buffer = ""
-                        elif "numeric value" in e.prompt or "value" in e.prompt:
-                             action_id = e.options.get("action_id")
-                             if action_id:
-
-                                 user.act(list(action_id), cli_input)
+                                 while next_step:
+                                     prompt = next_step["prompt"]
+                                     cli_input = _prompt_cli_input(f"[ INPUT REQUIRED ] {prompt}")
+                                     step = next_step.get("options", {}).get("agenda_step")
+                                     data = next_step.get("options", {}).get("agenda_data", {})
+                                     next_step = user.agenda_wizard_next(step, data, cli_input)
                                  buffer = ""
-                        elif e.prompt == "sequence index to delete":
-                            user.delete_sequence(cli_input)
-                            buffer = ""
+                            elif "numeric value" in e.prompt or "value" in e.prompt:
+                                 action_id = e.options.get("action_id")
+                                 if action_id:
+
+                                     user.act(list(action_id), cli_input)
+                                     buffer = ""
+                            elif e.prompt == "sequence index to delete":
+                                user.delete_sequence(cli_input)
+                                buffer = ""
                 
     except KeyboardInterrupt:
         print("\nBYE")
@@ -350,6 +368,8 @@ def dial_start():
 
 def _handle_result(result, em, ui):
     from src.components.data.constants import user
+    # A command can change satisfaction (abandonment) or the agent setting
+    scheduler.wake("entity_spawn")
     # Handle result and messages immediately after command completion
     current_him = em.get_entity()
     if current_him and current_him.messages:
@@ -0,0 +1,306 @@
+import os
+import json
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends go unlocked
+    fcntl = None
+
+
+def encode_state(data):
+    """Keeps a canonical string per key so diffs are cheap comparisons."""
+    encoded = {}
+    for section, value in data.items():
+        if isinstance(value, dict):
+            encoded[section] = {k: json.dumps(v, sort_keys=True) for k, v in value.items()}
+        else:
+            encoded[section] = json.dumps(value, sort_keys=True)
+    return encoded
+
+
+def decode_state(encoded):
+    decoded = {}
+    for section, value in encoded.items():
+        if isinstance(value, dict):
+            decoded[section] = {k: json.loads(v) for k, v in value.items()}
+        else:
+            decoded[section] = json.loads(value)
+    return decoded
+
+
+def diff_state(persisted, data):
+    """Returns (delta, encoded) where delta only carries changed keys.
+
+    delta = {"set": {section: {key: value}}, "put": {section: value}, "del": {section: [key]}}
+    """
+    encoded = encode_state(data)
+    sets, puts, dels = {}, {}, {}
+    for section, value in encoded.items():
+        old = persisted.get(section)
+        if isinstance(value, dict) and isinstance(old, dict):
+            changed = {k: data[section][k] for k, v in value.items() if old.get(k) != v}
+            removed = [k for k in old if k not in value]
+            if changed:
+                sets[section] = changed
+            if removed:
+                dels[section] = removed
+        elif old != value:
+            puts[section] = data[section]
+
+    delta = {}
+    if sets:
+        delta["set"] = sets
+    if puts:
+        delta["put"] = puts
+    if dels:
+        delta["del"] = dels
+    return delta, encoded
+
+
+def apply_delta(data, delta):
+    for section, changed in (delta.get("set") or {}).items():
+        target = data.get(section)
+        if not isinstance(target, dict):
+            target = {}
+            data[section] = target
+        target.update(changed)
+    for section, value in (delta.get("put") or {}).items():
+        data[section] = value
+    for section, keys in (delta.get("del") or {}).items():
+        target = data.get(section)
+        if isinstance(target, dict):
+            for k in keys:
+                target.pop(k, None)
+    return data
+
+
+def read_records(path):
+    """Parsed JSON lines of an append-only file; unparsable lines (a torn tail) are skipped.
+
+    Reading never touches the file: another process may be mid-append. The tail is
+    repaired by the next writer (see append_lines).
+    """
+    records = []
+    with open(path, "rb") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def append_lines(path, lines):
+    """Appends `lines` (each ending in a newline) after putting the file on a line boundary.
+
+    A torn last line (crash mid-append) is cut off and a complete one missing its newline
+    gets it, so the new records never glue onto it. Check and write hold an exclusive
+    lock where fcntl exists, so two writers can't mistake each other's append for a tear.
+    """
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                start = _last_line_start(f, size)
+                f.seek(start)
+                try:
+                    json.loads(f.read())
+                except ValueError:
+                    f.truncate(start)
+                else:
+                    f.write(b"\n")
+        f.write(lines.encode("utf-8"))
+
+
+def _last_line_start(f, size, block_size=4096):
+    position = size
+    while position > 0:
+        step = min(block_size, position)
+        position -= step
+        f.seek(position)
+        newline = f.read(step).rfind(b"\n")
+        if newline >= 0:
+            return position + newline + 1
+    return 0
+
+
+class WriteAheadLog:
+    """Append-only delta log next to a JSON snapshot, folded back on compaction."""
+
+    COMPACT_EVERY = 200
+    COMPACT_BYTES = 256 * 1024
+
+    def __init__(self, snapshot_path):
+        self.snapshot_path = snapshot_path
+        self.log_path = f"{snapshot_path}.wal"
+        self.pending = 0
+
+    def append(self, delta):
+        record = dict(delta)
+        record["ts"] = datetime.now().isoformat()
+        append_lines(self.log_path, json.dumps(record) + "\n")
+        self.pending += 1
+
+    def should_compact(self):
+        if self.pending >= self.COMPACT_EVERY:
+            return True
+        try:
+            return os.path.getsize(self.log_path) >= self.COMPACT_BYTES
+        except OSError:
+            return False
+
+    def replay(self, data):
+        """Applies every logged delta on top of the snapshot dict in place."""
+        self.pending = 0
+        if not os.path.exists(self.log_path):
+            return data
+        for record in read_records(self.log_path):
+            apply_delta(data, record)
+            self.pending += 1
+        return data
+
+    def compact(self, data):
+        """Writes a full snapshot atomically and truncates the log."""
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, self.snapshot_path)
+        # Snapshot already holds every delta: drop them so they are not replayed twice
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "w", encoding="utf-8"):
+                pass
+        self.pending = 0
+
+
+class JsonlTable:
+    """Append-only JSONL segment for a list of rows.
+
+    Lines are {"row": {...}} for new rows and {"patch": position, "set": {...}} for field
+    changes; compact() folds the patches back into a file of plain row records.
+    """
+
+    COMPACT_MIN_PATCHES = 500
+
+    def __init__(self, path, legacy_path=None, legacy_wrapper=None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.legacy_wrapper = legacy_wrapper
+        self.rows = None
+        self.index = {}  # row id -> position
+        self.patches = 0
+        self._stat = None
+
+    def load(self):
+        """Rows as of the file on disk; reparsed only when another writer changed it."""
+        if self.rows is not None and self._stat == self._file_stat():
+            return self.rows
+        if not os.path.exists(self.path) and self.legacy_path and os.path.exists(self.legacy_path):
+            self._migrate_legacy()
+        rows, patches = [], 0
+        if os.path.exists(self.path):
+            for record in read_records(self.path):
+                if "row" in record:
+                    rows.append(record["row"])
+                elif "patch" in record and 0 <= record["patch"] < len(rows):
+                    rows[record["patch"]].update(record.get("set") or {})
+                    patches += 1
+        self.rows = rows
+        self.patches = patches
+        self.index = {row.get("id"): i for i, row in enumerate(rows) if row.get("id") is not None}
+        self._stat = self._file_stat()
+        return rows
+
+    def append(self, rows, changes=None):
+        """Appends `rows` and, in the same write, the patches for `changes` (see update)."""
+        self.load()
+        start = len(self.rows)
+        for offset, row in enumerate(rows):
+            self.rows.append(dict(row))
+            if row.get("id") is not None:
+                self.index[row.get("id")] = start + offset
+        records = [{"row": row} for row in rows]
+        patches = self._patch_records(changes or {})
+        if records or patches:
+            self._write_lines(records + patches)
+            self.patches += len(patches)
+
+    def update(self, changes):
+        """`changes` maps row id -> fields; unknown ids are ignored."""
+        self.load()
+        records = self._patch_records(changes)
+        if records:
+            self._write_lines(records)
+            self.patches += len(records)
+
+    def _patch_records(self, changes):
+        records = []
+        for row_id, fields in changes.items():
+            position = self.index.get(row_id)
+            if position is None or not fields:
+                continue
+            self.rows[position].update(fields)
+            records.append({"patch": position, "set": fields})
+        return records
+
+    def replace(self, rows):
+        self.rows = [dict(row) for row in rows]
+        self.index = {row.get("id"): i for i, row in enumerate(self.rows) if row.get("id") is not None}
+        self.compact()
+
+    def should_compact(self):
+        # Rewrite cost is O(rows), so waiting for that many patches keeps it O(1) amortized
+        return self.patches >= max(self.COMPACT_MIN_PATCHES, len(self.rows or ()))
+
+    def compact(self):
+        if self.rows is None:
+            self.load()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for row in self.rows:
+                    f.write(json.dumps({"row": row}) + "\n")
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError):
+            self.rows = None
+            raise
+        self.patches = 0
+        self._stat = self._file_stat()
+
+    def _write_lines(self, records):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            append_lines(self.path, "".join(json.dumps(record) + "\n" for record in records))
+        except (OSError, TypeError, ValueError):
+            # rows/index already carry the change: reparse the file on the next load
+            self.rows = None
+            raise
+        self._stat = self._file_stat()
+
+    def _migrate_legacy(self):
+        """One-shot conversion of the old whole-file JSON list; the old file is kept aside."""
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rows = data.get(self.legacy_wrapper, []) if self.legacy_wrapper else data
+        except (json.JSONDecodeError, IOError, AttributeError):
+            return
+        if not isinstance(rows, list):
+            return
+        self.rows = rows
+        self.compact()
+        os.replace(self.legacy_path, f"{self.legacy_path}.migrated")
+
+    def _file_stat(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
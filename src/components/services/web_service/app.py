@@ -1,6 +1,7 @@
 from flask import Flask, render_template, jsonify
 import sys
 import os
+from functools import wraps
 
 # Add project root to path to import components
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../")))
@@ -18,6 +19,8 @@ from src.components.services.web_service.web_menu_service import (
     import_package,
 )
 from src.components.services.fountain_service import fountain_service
+from src.components.services.scheduler_service import scheduler
+from src.components.services.sequence_service import sequence_service
 from flask import request, send_from_directory
 
 app = Flask(__name__)
@@ -54,6 +57,21 @@ class SessionManager:
 
 session = SessionManager()
 
+# Time-driven user state (daily refill, status/entitlement expiry, regen crossings,
+# sequences, journal [CLOUD] promotion) runs on the scheduler timer
+for subsystem in (user, sequence_service, journal_service):
+    subsystem.register_jobs(scheduler)
+scheduler.on_error = lambda name, e: user.add_message(f"[scheduler] {name} failed: {e}")
+scheduler.start()
+
+def _holds_user_state(handler):
+    """Runs the handler under the scheduler lock (jobs touch the same user/journal state)."""
+    @wraps(handler)
+    def locked(*args, **kwargs):
+        with scheduler.lock:
+            return handler(*args, **kwargs)
+    return locked
+
 def _handle_result(result):
     if result is None: return
     
@@ -71,6 +89,7 @@ def _handle_result(result):
                 current_him.clear_messages()
 
 @app.route('/')
+@_holds_user_state
 def index():
     user.load_user()
     current_entity = em.get_entity()
@@ -82,10 +101,9 @@ def index():
     return render_template('index.html', user=user, entity=entity_info)
 
 @app.route('/api/status')
+@_holds_user_state
 def status():
     user.load_user()
-    # Ensure daily refill also applies in web view
-    user.refill_daily_tokens()
     current_entity = em.get_entity()
     
     # Add web buffer messages
@@ -94,19 +112,20 @@ def status():
     ui.web_buffer = []
     user.clear_messages()
     
+    scores = user.score_tree()
     resp = {
         "user": {
-            "score": user.score,
+            "score": scores["score"],
             "value": user._value,
-            "total_points": user.total_points,  # ← ADICIONADO
-            "attributes": {k: {"name": v._name, "score": v.total_score} for k, v in user._attributes.items()},
+            "total_points": scores["total_points"],  # ← ADICIONADO
+            "attributes": {k: {"name": v["name"], "score": v["score"]} for k, v in scores["attributes"].items()},
             "actions": {k: {"name": v._name} for k, v in user._actions.items() if not getattr(v, "_deleted", False)},
             "parameters": {
                 k: {
                     "name": v._name,
                     "value_type": v._value_type,
                     "logic_type": v._logic_type,
-                    "value": v._value,
+                    "value": v.value,
                 }
                 for k, v in user._parameters.items()
             },
@@ -125,6 +144,7 @@ def status():
     return jsonify(resp)
 
 @app.route('/api/boot')
+@_holds_user_state
 def boot():
     try:
         user.load_user()
@@ -142,6 +162,7 @@ def boot():
         return jsonify({ "progress": 0, "message": f"Backend error: {e}", "ready": False })
 
 @app.route('/api/command', methods=['POST'])
+@_holds_user_state
 def command():
     data = request.json or {}
     buffer = data.get('buffer', '')
@@ -154,177 +175,179 @@ def command():
         session.pending_input = None
 
         try:
-            p = pi.get("prompt", "")
-            t = pi.get("type", "")
-            options = pi.get("options") or {}
-
-            # 1. Attribute/Action Creation
-            if p == "attribute name":
-                if "payloads" in options:
-                    user.create_attribute_by_id(options.get("payloads"), name=buffer)
-                else:
-                    user.create_attribute(name=buffer)
+            # Each command commits once (or rolls back if it raises)
+            with user.transaction():
+                p = pi.get("prompt", "")
+                t = pi.get("type", "")
+                options = pi.get("options") or {}
+
+                # 1. Attribute/Action Creation
+                if p == "attribute name":
+                    if "payloads" in options:
+                        user.create_attribute_by_id(options.get("payloads"), name=buffer)
+                    else:
+                        user.create_attribute(name=buffer)
             
-            elif p in ("unit type", "difficulty (1-5)", "action name"):
-                step = options.get("create_step") if options else None
-                data = options if options else {}
-                try:
-                    user.create_action(step=step, data=data, value=buffer)
-                except WebInputInterrupt as e:
-                    session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
-                    user.save_user()
-                    return jsonify({"completed": True, "clear": True})
-
-            elif p == "status name":
-                user.create_status(options.get("buffer", ""), name=buffer)
-
-            elif p == "tag name":
-                user.create_tag(name=buffer)
-
-            elif p.startswith("parameter value"):
-                param_id = options.get("param_id")
-                status_id = options.get("status_id")
-                user._attach_status_to_param(param_id, status_id, buffer)
-
-            elif p.startswith("parameter regen") or p.startswith("parameter start value"):
-                step = options.get("param_step")
-                data = options or {}
-                next_step = user.parameter_init_next(step, data, buffer)
-                if next_step:
-                    session.pending_input = next_step
-                    return jsonify({"completed": True, "clear": True})
-            elif p.startswith("edit action") or p.startswith("edit attribute") or p.startswith("edit parameter") or p.startswith("edit status") or p.startswith("edit tag"):
-                step = options.get("edit_step")
-                data = options or {}
-                if step and step.startswith("action_"):
-                    next_step = user.action_edit_next(step, data, buffer)
-                else:
-                    next_step = user.misc_edit_next(step, data, buffer)
-                if next_step:
-                    session.pending_input = next_step
-                    return jsonify({"completed": True, "clear": True})
-            elif p.startswith("tag weight"):
-                step = options.get("tag_step")
-                data = options or {}
-                next_step = user.tag_link_next(step, data, buffer)
-                if next_step:
-                    session.pending_input = next_step
-                    return jsonify({"completed": True, "clear": True})
-
-            elif p == "parameter name":
-                step = options.get("create_step") if options else None
-                data = options if options else {}
-                try:
-                    user.create_parameter(step=step, data=data, value=buffer)
-                except WebInputInterrupt as e:
-                    session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
-                    user.save_user()
-                    return jsonify({"completed": True, "clear": True})
-            elif p in (
-                "parameter type (1 mark, 2 percentage)",
-                "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)",
-            ):
-                step = options.get("create_step") if options else None
-                data = options if options else {}
-                try:
-                    user.create_parameter(step=step, data=data, value=buffer)
-                except WebInputInterrupt as e:
-                    session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
-                    user.save_user()
-                    return jsonify({"completed": True, "clear": True})
+                elif p in ("unit type", "difficulty (1-5)", "action name"):
+                    step = options.get("create_step") if options else None
+                    data = options if options else {}
+                    try:
+                        user.create_action(step=step, data=data, value=buffer)
+                    except WebInputInterrupt as e:
+                        session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
+                        user.save_user()
+                        return jsonify({"completed": True, "clear": True})
+
+                elif p == "status name":
+                    user.create_status(options.get("buffer", ""), name=buffer)
+
+                elif p == "tag name":
+                    user.create_tag(name=buffer)
+
+                elif p.startswith("parameter value"):
+                    param_id = options.get("param_id")
+                    status_id = options.get("status_id")
+                    user._attach_status_to_param(param_id, status_id, buffer)
+
+                elif p.startswith("parameter regen") or p.startswith("parameter start value"):
+                    step = options.get("param_step")
+                    data = options or {}
+                    next_step = user.parameter_init_next(step, data, buffer)
+                    if next_step:
+                        session.pending_input = next_step
+                        return jsonify({"completed": True, "clear": True})
+                elif p.startswith("edit action") or p.startswith("edit attribute") or p.startswith("edit parameter") or p.startswith("edit status") or p.startswith("edit tag"):
+                    step = options.get("edit_step")
+                    data = options or {}
+                    if step and step.startswith("action_"):
+                        next_step = user.action_edit_next(step, data, buffer)
+                    else:
+                        next_step = user.misc_edit_next(step, data, buffer)
+                    if next_step:
+                        session.pending_input = next_step
+                        return jsonify({"completed": True, "clear": True})
+                elif p.startswith("tag weight"):
+                    step = options.get("tag_step")
+                    data = options or {}
+                    next_step = user.tag_link_next(step, data, buffer)
+                    if next_step:
+                        session.pending_input = next_step
+                        return jsonify({"completed": True, "clear": True})
+
+                elif p == "parameter name":
+                    step = options.get("create_step") if options else None
+                    data = options if options else {}
+                    try:
+                        user.create_parameter(step=step, data=data, value=buffer)
+                    except WebInputInterrupt as e:
+                        session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
+                        user.save_user()
+                        return jsonify({"completed": True, "clear": True})
+                elif p in (
+                    "parameter type (1 mark, 2 percentage)",
+                    "parameter logic (1 Emotional, 2 Ambiental, 3 Fisiologic)",
+                ):
+                    step = options.get("create_step") if options else None
+                    data = options if options else {}
+                    try:
+                        user.create_parameter(step=step, data=data, value=buffer)
+                    except WebInputInterrupt as e:
+                        session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
+                        user.save_user()
+                        return jsonify({"completed": True, "clear": True})
             
-            elif p == "log message":
-                user.log(buffer)
-
-            elif p.startswith("agenda ") or "agenda_step" in options:
-                step = options.get("agenda_step")
-                data = options.get("agenda_data", {})
-                next_step = user.agenda_wizard_next(step, data, buffer)
-                if next_step:
-                    session.pending_input = next_step
+                elif p == "log message":
+                    user.log(buffer)
+
+                elif p.startswith("agenda ") or "agenda_step" in options:
+                    step = options.get("agenda_step")
+                    data = options.get("agenda_data", {})
+                    next_step = user.agenda_wizard_next(step, data, buffer)
+                    if next_step:
+                        session.pending_input = next_step
+                        return jsonify({"completed": True, "clear": True})
+
+                elif p == "sequence label":
+                    # This is first step of new_sequence
+                    session.pending_input = {
+                        "prompt": "start value (integer)",
+                        "type": "numeric",
+                        "options": {"label": buffer}
+                    }
                     return jsonify({"completed": True, "clear": True})
 
-            elif p == "sequence label":
-                # This is first step of new_sequence
-                session.pending_input = {
-                    "prompt": "start value (integer)",
-                    "type": "numeric",
-                    "options": {"label": buffer}
-                }
-                return jsonify({"completed": True, "clear": True})
-
-            elif p == "start value (integer)":
-                label = options.get("label")
-                user.new_sequence(label, buffer)
+                elif p == "start value (integer)":
+                    label = options.get("label")
+                    user.new_sequence(label, buffer)
             
-            elif p == "sequence index to delete":
-                user.delete_sequence(buffer)
-
-            # 2. General Confirmation
-            elif t == "confirm":
-                 if buffer == options.get("code"):
-                     action_type = options.get("action")
-                     payloads = options.get("payloads")
+                elif p == "sequence index to delete":
+                    user.delete_sequence(buffer)
+
+                # 2. General Confirmation
+                elif t == "confirm":
+                     if buffer == options.get("code"):
+                         action_type = options.get("action")
+                         payloads = options.get("payloads")
                      
-                     if action_type == "delete_attribute":
-                         user.delete_attribute(payloads, confirmed=True)
-                     elif action_type == "delete_action":
-                         user.delete_action(payloads, confirmed=True)
-                     elif action_type == "delete_status":
-                         user.delete_status(payloads, confirmed=True)
-                     elif action_type == "delete_parameter":
-                         user.delete_parameter(payloads, confirmed=True)
-                     elif action_type == "delete_tag":
-                         user.delete_tag(payloads, confirmed=True)
-                     elif action_type == "journal_drop":
-                         from src.components.services.journal_service import journal_service
-                         result = journal_service.drop_last_day()
-                         user.add_message(result)
+                         if action_type == "delete_attribute":
+                             user.delete_attribute(payloads, confirmed=True)
+                         elif action_type == "delete_action":
+                             user.delete_action(payloads, confirmed=True)
+                         elif action_type == "delete_status":
+                             user.delete_status(payloads, confirmed=True)
+                         elif action_type == "delete_parameter":
+                             user.delete_parameter(payloads, confirmed=True)
+                         elif action_type == "delete_tag":
+                             user.delete_tag(payloads, confirmed=True)
+                         elif action_type == "journal_drop":
+                             from src.components.services.journal_service import journal_service
+                             result = journal_service.drop_last_day()
+                             user.add_message(result)
+                         else:
+                             user.add_message("Confirmed.")
                      else:
-                         user.add_message("Confirmed.")
-                 else:
-                     user.add_message("Cancelled.")
+                         user.add_message("Cancelled.")
             
-            elif t == "confirm_day":
-                log_text = options.get("text")
-                from src.components.services.journal_service import journal_service
-                if buffer == "1":
-                    journal_service.add_log(log_text, auto_confirm=True)
-                else:
-                    # If 0, we could prompt for custom day, but let's simplify or handle it
-                    # For now, if not 1, assume current day or handle as custom day input if it was a number > 1
-                    try:
-                        if int(buffer) > 1:
-                            journal_service.add_log(log_text, manual_date=buffer)
-                        else:
-                            journal_service.add_log(log_text, auto_confirm=True)
-                    except:
+                elif t == "confirm_day":
+                    log_text = options.get("text")
+                    from src.components.services.journal_service import journal_service
+                    if buffer == "1":
                         journal_service.add_log(log_text, auto_confirm=True)
-
-            elif t == "numeric" and "action_id" in options:
-                try:
-                    val = int(buffer)
-                    action_id = options["action_id"]
-                    payload = action_id[1:]
-                    action = user._actions.get(action_id)
-                    if action:
-                        lt = getattr(action, "_logic_type", None)
-                        st = getattr(action, "_sub_logic_type", None)
-                        if lt is not None:
-                            lt = str(lt).zfill(2) if str(lt).isdigit() else str(lt)
-                            if st is not None:
-                                st = str(st).zfill(2) if str(st).isdigit() else str(st)
-                                payload = f"{lt}{st}{payload}"
+                    else:
+                        # If 0, we could prompt for custom day, but let's simplify or handle it
+                        # For now, if not 1, assume current day or handle as custom day input if it was a number > 1
+                        try:
+                            if int(buffer) > 1:
+                                journal_service.add_log(log_text, manual_date=buffer)
                             else:
-                                payload = f"{lt}{payload}"
-                    payloads = [payload]
-                    result = user.act(payloads, value=val)
-                    _handle_result(result)
-                except ValueError:
-                    user.add_message("Invalid numeric value.")
+                                journal_service.add_log(log_text, auto_confirm=True)
+                        except:
+                            journal_service.add_log(log_text, auto_confirm=True)
 
-            user.save_user()
-            return jsonify({"completed": True, "clear": True})
+                elif t == "numeric" and "action_id" in options:
+                    try:
+                        val = int(buffer)
+                        action_id = options["action_id"]
+                        payload = action_id[1:]
+                        action = user._actions.get(action_id)
+                        if action:
+                            lt = getattr(action, "_logic_type", None)
+                            st = getattr(action, "_sub_logic_type", None)
+                            if lt is not None:
+                                lt = str(lt).zfill(2) if str(lt).isdigit() else str(lt)
+                                if st is not None:
+                                    st = str(st).zfill(2) if str(st).isdigit() else str(st)
+                                    payload = f"{lt}{st}{payload}"
+                                else:
+                                    payload = f"{lt}{payload}"
+                        payloads = [payload]
+                        result = user.act(payloads, value=val)
+                        _handle_result(result)
+                    except ValueError:
+                        user.add_message("Invalid numeric value.")
+
+                user.save_user()
+                return jsonify({"completed": True, "clear": True})
         except Exception as e:
             user.add_message(f"[ ERROR ] {str(e)}")
             user.save_user()
@@ -333,11 +356,12 @@ def command():
     # Process Command
     try:
         # Standard Dial Processing (Prefixes like : or / are no longer special-cased here)
-        completed, result = dial.process(buffer, force=True)
-        if completed:
-            _handle_result(result)
-            user.save_user()
-            return jsonify({"completed": True, "clear": True})
+        with user.transaction():
+            completed, result = dial.process(buffer, force=True)
+            if completed:
+                _handle_result(result)
+                user.save_user()
+                return jsonify({"completed": True, "clear": True})
 
     except WebInputInterrupt as e:
         session.pending_input = {"prompt": e.prompt, "type": e.type, "options": e.options, "context": {"buffer": buffer}}
@@ -351,6 +375,7 @@ def command():
     return jsonify({"completed": False, "clear": False})
 
 @app.route('/api/cancel', methods=['POST'])
+@_holds_user_state
 def cancel():
     session.pending_input = None
     user.add_message("Cancelled.")
@@ -358,6 +383,7 @@ def cancel():
     return jsonify({"ok": True})
 
 @app.route('/api/preview', methods=['GET'])
+@_holds_user_state
 def preview():
     """
     Retorna estado do parsing em tempo real sem executar.
@@ -459,45 +485,29 @@ def _resolve_name(prefix_char, id_value):
     return None
 
 @app.route('/api/log_suggestions', methods=['GET'])
+@_holds_user_state
 def log_suggestions():
-    """Return recent log contents for autocomplete."""
+    """Return ranked log contents for autocomplete (optionally filtered by ?prefix=)."""
     try:
-        journal_service._load_logs_data()
-        suggestions = []
-        base = ""
-        today = None
-        try:
-            from datetime import datetime
-            today = datetime.now().strftime("%d %m %Y")
-        except Exception:
-            today = None
-
-        if today:
-            for entry in journal_service.logs:
-                if not isinstance(entry, dict):
-                    continue
-                ts = entry.get("timestamp", "")
-                content = entry.get("content")
-                if not ts or not content:
-                    continue
-                if ts.startswith(today):
-                    base = str(content).strip()
-                    break
-
-        for entry in reversed(journal_service.logs):
-            content = entry.get("content") if isinstance(entry, dict) else None
-            if not content:
-                continue
-            content = str(content).strip()
-            if content and content not in suggestions:
-                suggestions.append(content)
-            if len(suggestions) >= 60:
-                break
-        return jsonify({ "suggestions": suggestions, "base": base })
+        prefix = request.args.get("prefix", "")
+        limit = min(max(int(request.args.get("limit", 60)), 1), 60)
+        return jsonify(journal_service.log_suggestions(prefix, limit))
     except Exception:
         return jsonify({ "suggestions": [], "base": "" })
 
+@app.route('/api/score_projection', methods=['POST'])
+@_holds_user_state
+def score_projection():
+    """What-if scores: POST { "increments": { "501": 50 } } -> totals without executing anything."""
+    data = request.json or {}
+    try:
+        increments = {str(k): float(v) for k, v in (data.get("increments") or {}).items()}
+        return jsonify(user.project_scores(increments))
+    except Exception as e:
+        return jsonify({ "error": str(e) })
+
 @app.route('/api/menu/settings', methods=['GET', 'POST'])
+@_holds_user_state
 def menu_settings():
     if request.method == 'GET':
         return jsonify(get_settings())
@@ -514,12 +524,14 @@ def menu_packages():
     return jsonify({ "packages": list_packages() })
 
 @app.route('/api/menu/packages/import', methods=['POST'])
+@_holds_user_state
 def menu_packages_import():
     data = request.json or {}
     key = data.get("key")
     return jsonify(import_package(key))
 
 @app.route('/api/fountain/offer', methods=['POST'])
+@_holds_user_state
 def fountain_offer():
     data = request.json or {}
     try:
@@ -1,7 +1,9 @@
 # ==================== ACTION.PY ====================
+import weakref
 from abc import ABC, abstractmethod
+from src.components.user.tracking import DirtyTracked
 
-class Action:
+class Action(DirtyTracked):
     # Progressão linear: 2.1 + (diff - 1) * 1.1
     _DIFFICULTY_MULTIPLIER_MAP = {
         0: 1,
@@ -21,7 +23,15 @@ class Action:
         6: {"label": "lines", "factor": 2}, 
     }
     
+    # Fields that feed score: assigning any of them drops the cached score
+    _SCORE_INPUTS = ("_value", "_tipo", "_diff", "_diff_multiplier")
+    # Bumped whenever any action's score inputs change (snapshots compare it)
+    score_version = 0
+
     def __init__(self, action_id, name: str, tipo: int, diff: int, value: float, deleted=False, logic_type=None, sub_logic_type=None):
+        # Cache bookkeeping bypasses DirtyTracked: it is not persisted state
+        object.__setattr__(self, "_score_cache", None)
+        object.__setattr__(self, "_score_listeners", weakref.WeakSet())
         if not (0 <= diff <= 5):
             raise ValueError("Difficulty 'diff' must be an integer between 0 and 5.")
         if tipo not in self._TYPE_MAP:
@@ -69,11 +79,31 @@ class Action:
     
     @property
     def score(self) -> float: 
+        if self._score_cache is not None:
+            return self._score_cache
         action = self._TYPE_MAP[self.type] 
         type_factor = action["factor"]
         diff_factor = self.diff_multiplier
         score = self.value * type_factor * diff_factor
+        object.__setattr__(self, "_score_cache", score)
         return score 
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._SCORE_INPUTS:
+            self._invalidate_score()
+
+    def _invalidate_score(self):
+        """Drops the cached score and tells the attributes that summed it."""
+        Action.score_version += 1
+        if self._score_cache is None:
+            # Nobody has read it since the last invalidation
+            return
+        object.__setattr__(self, "_score_cache", None)
+        listeners = list(self._score_listeners)
+        self._score_listeners.clear()
+        for attribute in listeners:
+            attribute._invalidate_score()
     
     def execution(self, manual_value=None):
         """Executa a ação e retorna (score_difference, messages)"""
@@ -89,16 +119,15 @@ class Action:
         # Timer support for time-based actions (2: seconds, 3: minutes, 4: hours)
         if self.type in [2, 3, 4] and not ui.web_mode:
             import time
-            import readchar
             
             print(f"\n[ TIMER MODE ] Action: {self.name.upper()}")
             print(f"Press any key to START timer, or 'm' for Manual input.")
-            key = readchar.readkey()
+            key = ui.read_key()
             
             if key.lower() != 'm':
                 start_time = time.time()
                 print(f"Timer started. Press any key to STOP...")
-                readchar.readkey()
+                ui.read_key()
                 duration = time.time() - start_time
                 
                 if self.type == 2: # seconds
@@ -1,7 +1,17 @@
-class Attribute:
+import weakref
+from src.components.user.tracking import DirtyTracked
+
+
+class Attribute(DirtyTracked):
     SCORE_POWER_FACTOR = 12
+    # Bumped whenever any attribute's related actions/children change (snapshots compare it)
+    layout_version = 0
     # construtor do Atributo
     def __init__(self, aid, name, related_actions=None, children=None, parent=None):
+        # Score caches (not persisted state, so they bypass DirtyTracked)
+        object.__setattr__(self, "_power_cache", None)
+        object.__setattr__(self, "_total_cache", None)
+        object.__setattr__(self, "_power_listeners", weakref.WeakSet())  # parents that summed our power
         self._id = aid
         self._name = name
         self._parent = []
@@ -16,18 +26,55 @@ class Attribute:
     
     @property
     def power(self):
+        if self._power_cache is not None:
+            return self._power_cache
         if self._related_actions:
-            return sum(action.score for action in self._related_actions)
+            for action in self._related_actions:
+                action._score_listeners.add(self)
+            power = sum(action.score for action in self._related_actions)
         else:
-            return 0
+            power = 0
+        object.__setattr__(self, "_power_cache", power)
+        return power
 
     # getter de score = soma dos scores das ações - Verifica casos de parent e child
     @property
     def total_score(self) -> float: 
+        if self._total_cache is not None:
+            return self._total_cache
         if self._children:                         
-            return sum(child.power for child in self._children)
+            for child in self._children:
+                child._power_listeners.add(self)
+            total = sum(child.power for child in self._children)
         else:         
-            return self.power
+            total = self.power
+        object.__setattr__(self, "_total_cache", total)
+        return total
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("_related_actions", "_children") and hasattr(self, "_power_listeners"):
+            self._layout_changed()
+
+    def _layout_changed(self):
+        Attribute.layout_version += 1
+        self._invalidate_score()
+
+    def _invalidate_score(self):
+        """Drops cached power/total_score; parents that summed our power drop their total.
+
+        Called when a related action's score changes and when related actions or
+        children are replaced/appended. Everything is recomputed on the next read.
+        """
+        object.__setattr__(self, "_total_cache", None)
+        if self._power_cache is None:
+            # Not read since the last invalidation, so no parent cached it
+            return
+        object.__setattr__(self, "_power_cache", None)
+        parents = list(self._power_listeners)
+        self._power_listeners.clear()
+        for parent in parents:
+            object.__setattr__(parent, "_total_cache", None)
 
     # tratamento visual de power
     @property
@@ -38,15 +85,20 @@ class Attribute:
         if self._children:
             raise ValueError("A parent attribute cannot have related actions.")
         self._related_actions.append(action)
+        self._layout_changed()
+        self.mark_dirty()
 
     def set_parent(self, parent):
         if parent not in self._parent:
-            self._parent.append(parent)            
+            self._parent.append(parent)
+            self.mark_dirty()
 
     def add_child(self, child_attribute):
         if child_attribute not in self._children:
             print(child_attribute)
             self._children.append(child_attribute)
+            self._layout_changed()
+            self.mark_dirty()
             child_attribute.set_parent(self) # Ensure child also knows its parent       
 
 
@@ -81,6 +133,7 @@ class Attribute:
             action = actions_dict.get(aid)
             if action:
                 self._related_actions.append(action)
+        self._layout_changed()
         if hasattr(self, "_related_action_ids"):
             del self._related_action_ids
 
@@ -90,6 +143,7 @@ class Attribute:
             child = children_dict.get(cid)
             if child:
                 self._children.append(child)
+        self._layout_changed()
         if hasattr(self, "_children_ids"):
             del self._children_ids
 
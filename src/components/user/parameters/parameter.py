@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.components.user.tracking import DirtyTracked
 
 
-class Parameter:
+class Parameter(DirtyTracked):
     VALUE_TYPES = {
         1: "mark",
         2: "percentage",
@@ -53,6 +54,9 @@ class Parameter:
         self._value = self._clamp_value(value)
         self._regen_type = regen_type
         self._regen_factor = regen_factor
+        # Anchor regen at creation/load so reading the value never writes
+        if last_check is None and self.regen_rate:
+            last_check = datetime.now()
         self._last_check = last_check
 
     def _clamp_value(self, value):
@@ -82,10 +86,48 @@ class Parameter:
 
     @property
     def value(self):
-        return self._value
+        return self.current_value()
 
-    def set_value(self, value):
+    @property
+    def max_value(self):
+        return 3.0 if self._value_type == 1 else 100.0
+
+    @property
+    def regen_rate(self):
+        """Signed change per hour (0 when no regen/decay is set)."""
+        if not self._regen_type or not self._regen_factor:
+            return 0.0
+        if self._value_type == 1:
+            rate = self.MARK_FACTORS_PER_HOUR.get(self._regen_factor, 0)
+        else:
+            rate = self.PERCENT_FACTORS.get(self._regen_factor, 0)
+        return -rate if self._regen_type == 2 else rate
+
+    # _value/_last_check are an anchor: regen/decay is linear from there, clamped once
+    def current_value(self, now=None):
+        rate = self.regen_rate
+        if not rate or self._last_check is None:
+            return self._value
+        now = now or datetime.now()
+        elapsed = (now - self._last_check).total_seconds() / 3600
+        if elapsed <= 0:
+            return self._value
+        return self._clamp_value(self._value + elapsed * rate)
+
+    def crossing_time(self, threshold):
+        """When the value rises to `threshold` through regen, or None if it never does."""
+        rate = self.regen_rate
+        if rate <= 0 or self._last_check is None:
+            return None
+        if threshold <= self._value or threshold > self.max_value:
+            return None
+        return self._last_check + timedelta(hours=(threshold - self._value) / rate)
+
+    def set_value(self, value, now=None):
         self._value = self._clamp_value(value)
+        if self.regen_rate:
+            # Regen continues from the new value
+            self._last_check = now or datetime.now()
 
     def set_regen(self, regen_type, regen_factor, start_value, now=None):
         if regen_type not in self.REGEN_TYPES:
@@ -103,27 +145,14 @@ class Parameter:
         self._last_check = now
 
     def update_value(self, now=None):
-        if not self._regen_type or not self._regen_factor:
+        """Moves the anchor to `now` (reads don't need it; value is computed on access)."""
+        if not self.regen_rate:
             return False
         now = now or datetime.now()
-        last = self._last_check or now
-        elapsed = (now - last).total_seconds() / 3600
-        if elapsed <= 0:
-            self._last_check = now
+        value = self.current_value(now)
+        if self._last_check is not None and now <= self._last_check:
             return False
-
-        if self._value_type == 1:
-            rate = self.MARK_FACTORS_PER_HOUR.get(self._regen_factor, 0)
-            delta = elapsed * rate
-        else:
-            rate = self.PERCENT_FACTORS.get(self._regen_factor, 0)
-            delta = elapsed * rate
-
-        if self._regen_type == 2:
-            delta = -delta
-
-        new_value = self._value + delta
-        self._value = self._clamp_value(new_value)
+        self._value = value
         self._last_check = now
         return True
 
@@ -133,7 +162,7 @@ class Parameter:
             "name": self.name,
             "value_type": self.value_type,
             "logic_type": self.logic_type,
-            "value": self.value,
+            "value": self._value,
             "regen_type": self._regen_type,
             "regen_factor": self._regen_factor,
             "last_check": self._last_check.isoformat() if self._last_check else None,
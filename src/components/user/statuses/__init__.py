@@ -1,3 +1,3 @@
-from .status import Status
+from .status import Status, StatusThresholdIndex
 
-__all__ = ["Status"]
+__all__ = ["Status", "StatusThresholdIndex"]
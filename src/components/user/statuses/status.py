@@ -1,7 +1,10 @@
+import bisect
+import weakref
 from datetime import datetime, timedelta
+from src.components.user.tracking import DirtyTracked
 
 
-class Status:
+class Status(DirtyTracked):
     DURATION_MAP = {
         0: timedelta(minutes=30),
         1: timedelta(hours=3),
@@ -12,6 +15,8 @@ class Status:
     def __init__(self, sid, name, duration_type, param_links=None, active_from=None, active_until=None):
         if duration_type not in self.DURATION_MAP:
             raise ValueError(f"Invalid duration type: {duration_type}")
+        # Indexes to tell about new links (not persisted state, bypasses DirtyTracked)
+        object.__setattr__(self, "_link_listeners", weakref.WeakSet())
         self._id = sid
         self._name = name
         self._duration_type = duration_type
@@ -36,7 +41,11 @@ class Status:
         return self._active_until
 
     def add_param_link(self, param_id, value):
-        self._param_links.append({"param_id": param_id, "value": value})
+        link = {"param_id": param_id, "value": value}
+        self._param_links.append(link)
+        self.mark_dirty()
+        for index in list(self._link_listeners):
+            index.link_added(self, link)
 
     def activate(self, now=None):
         now = now or datetime.now()
@@ -97,3 +106,66 @@ class Status:
             active_from=af,
             active_until=au,
         )
+
+
+class StatusThresholdIndex:
+    """param_id -> linked statuses sorted by threshold, so a value check is one bisect.
+
+    Statuses are registered with add() and dropped with remove(); links added later
+    through Status.add_param_link are picked up automatically.
+    """
+
+    def __init__(self):
+        self._thresholds = {}  # param_id -> ascending thresholds
+        self._statuses = {}    # param_id -> statuses, parallel to _thresholds
+
+    def clear(self):
+        for statuses in self._statuses.values():
+            for status in statuses:
+                status._link_listeners.discard(self)
+        self._thresholds = {}
+        self._statuses = {}
+
+    def add(self, status):
+        status._link_listeners.add(self)
+        for link in status._param_links:
+            self.link_added(status, link)
+
+    def remove(self, status):
+        status._link_listeners.discard(self)
+        for param_id in {link.get("param_id") for link in status._param_links}:
+            statuses = self._statuses.get(param_id, [])
+            keep = [i for i, linked in enumerate(statuses) if linked is not status]
+            if not keep:
+                self._thresholds.pop(param_id, None)
+                self._statuses.pop(param_id, None)
+                continue
+            thresholds = self._thresholds[param_id]
+            self._thresholds[param_id] = [thresholds[i] for i in keep]
+            self._statuses[param_id] = [statuses[i] for i in keep]
+
+    def link_added(self, status, link):
+        try:
+            threshold = float(link.get("value"))
+        except Exception:
+            return
+        param_id = link.get("param_id")
+        thresholds = self._thresholds.setdefault(param_id, [])
+        position = bisect.bisect_right(thresholds, threshold)
+        thresholds.insert(position, threshold)
+        self._statuses.setdefault(param_id, []).insert(position, status)
+
+    def reached(self, param_id, value):
+        """Statuses with a link to param_id whose threshold is <= value."""
+        thresholds = self._thresholds.get(param_id)
+        if not thresholds:
+            return []
+        return self._statuses[param_id][:bisect.bisect_right(thresholds, value)]
+
+    def above(self, param_id, value):
+        """(threshold, status) pairs with threshold > value, lowest first."""
+        thresholds = self._thresholds.get(param_id)
+        if not thresholds:
+            return []
+        start = bisect.bisect_right(thresholds, value)
+        return list(zip(thresholds[start:], self._statuses[param_id][start:]))
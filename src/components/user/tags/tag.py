@@ -1,4 +1,7 @@
-class Tag:
+from src.components.user.tracking import DirtyTracked
+
+
+class Tag(DirtyTracked):
     def __init__(self, tid, name):
         self._id = tid
         self._name = name
@@ -0,0 +1,3 @@
+from .tracking import DirtyTracked
+
+__all__ = ["DirtyTracked"]
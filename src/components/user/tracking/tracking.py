@@ -0,0 +1,18 @@
+class DirtyTracked:
+    """Mixin that flags the object as changed whenever an attribute is reassigned."""
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_dirty":
+            object.__setattr__(self, "_dirty", True)
+
+    @property
+    def dirty(self):
+        return getattr(self, "_dirty", True)
+
+    def mark_dirty(self):
+        """For in-place changes (list appends) that bypass __setattr__."""
+        self._dirty = True
+
+    def mark_clean(self):
+        self._dirty = False
@@ -1,34 +1,61 @@
 # ==================== USER.PY ====================
-import json, os, time
+import json, os, time, heapq
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from src.components.entitys.entity_manager import EntityManager
 from src.components.user.attributes.attribute import Attribute
 from src.components.user.actions.action import Action
 from src.components.user.parameters.parameter import Parameter
-from src.components.user.statuses.status import Status
+from src.components.user.statuses.status import Status, StatusThresholdIndex
 from src.components.user.tags.tag import Tag
 from src.components.services.journal_service import journal_service
 from src.components.services.agenda_service import agenda_service
 from src.components.services.tutorial_service import TutorialService
+from src.components.services.wal_service import encode_state, decode_state, diff_state
+from src.components.services.storage_service import CorruptDocument, storage as default_storage
+from src.components.services.name_index_service import NameIndex, collect_names
+from src.components.services.scheduler_service import next_midnight
 
 class User:
-    def __init__(self):
+    def __init__(self, storage=None):
         him = EntityManager().get_entity()
         self._attributes = {} 
         self._actions = {} 
         self._parameters = {}
         self._statuses = {}
+        self._status_index = StatusThresholdIndex()  # param_id -> statuses by link threshold
+        self._crossings = None  # heap of (when, seq, status) for upcoming regen threshold crossings
+        self._crossings_until = None  # crossings up to here were already applied
+        self._scheduler = None  # set by register_jobs
         self._shop_action_links = {}
         self._shop_entitlements = {}
         self._shop_item_entitlements = {}
         self._tags = {}
         self._action_tags = {}
         self._param_tags = {}
+        self._tag_influence = None  # derived from the two above, see _tag_influence_table
         self.logic_types = {}
         self.sublogic_types = {}
         self._value = 0
         self.messages = []  # Buffer de mensagens para o render
-        self.metadata = {
+        self._storage = storage or default_storage
+        self._persisted = None  # Last state written, encoded per key
+        self._tx_depth = 0
+        self._fingerprint = None  # Storage fingerprint at last load/save
+        self._load_hits = 0
+        self._load_misses = 0
+        self._tx_pending = False
+        # Autocomplete names: other data files by mtime, the user document from memory
+        self._name_index = NameIndex(self._storage.data_dir, exclude=("user.json",))
+        self.metadata = self._default_metadata()
+        self.load_user()
+        self._ensure_tutorial_state()
+        self.tutorial = TutorialService(self)
+        self.tutorial.maybe_show_startup()
+
+    @staticmethod
+    def _default_metadata():
+        return {
             "mode": "progressive",
             "virtual_agent_active": True,
             "unlocked_packages": ["basics"],
@@ -43,10 +70,6 @@ class User:
                 "welcomed": {"status": False, "priority": 11}
             }
         }
-        self.load_user()
-        self._ensure_tutorial_state()
-        self.tutorial = TutorialService(self)
-        self.tutorial.maybe_show_startup()
 
     def refill_daily_tokens(self, now=None):
         """Refill once per day based on date (ignores time)."""
@@ -239,6 +262,51 @@ class User:
             return sum(action.score for action in self._actions.values())
         return 0
 
+    def score_tree(self):
+        """Score, total points and every attribute/action score in one pass.
+
+        Action scores and attribute power/total_score are memoized and dropped only when
+        something they depend on changes, so this is mostly cache reads.
+        """
+        attributes = {
+            aid: {"name": attr._name, "power": attr.power, "score": attr.total_score}
+            for aid, attr in self._attributes.items()
+        }
+        actions = {aid: action.score for aid, action in self._actions.items()}
+        if attributes:
+            score = sum(a["score"] for a in attributes.values()) / len(attributes)
+        else:
+            score = self.metadata.get("score", 0)
+        return {
+            "score": score,
+            "total_points": sum(actions.values()) if actions else 0,
+            "attributes": attributes,
+            "actions": actions,
+        }
+
+    def project_scores(self, increments):
+        """What-if: totals as if each action in `increments` ({action_id: amount}) got that much more value."""
+        return self.score_engine().project(increments, self.metadata.get("score", 0))
+
+    def score_engine(self):
+        """Columnar ScoreEngine of the current tree.
+
+        Rebuilt only when actions/attributes/links change; columns re-read only when some
+        action's score inputs changed since the last access.
+        """
+        from src.components.services.score_engine_service import ScoreEngine
+        key = (tuple(self._actions), tuple(self._attributes), Attribute.layout_version)
+        cached = getattr(self, "_score_engine", None)
+        if cached is not None and cached[0] == key:
+            engine = cached[1]
+            if cached[2] != Action.score_version:
+                engine.refresh(self._actions)
+                self._score_engine = (key, engine, Action.score_version)
+            return engine
+        engine = ScoreEngine.build(self._actions, self._attributes)
+        self._score_engine = (key, engine, Action.score_version)
+        return engine
+
     def sleep(self):
         if self._check_sleep():
             return
@@ -695,80 +763,226 @@ class User:
         except ValueError:
             self.add_message("Invalid start value. Must be an integer.")
     
-    def save_user(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        # Sobe 2 níveis: user/ -> components/ -> src/
-        src_dir = os.path.dirname(os.path.dirname(base_dir))
-        data_dir = os.path.join(src_dir, "data")    
-        data_file = os.path.join(data_dir, "user.json")
-
-        # Cria o diretório se não existir
-        os.makedirs(data_dir, exist_ok=True)
-
-        # Keep score mirrored in metadata for UI consumers
-        self.metadata["score"] = self.score
-            
-        data = {
+    # Secoes do save que guardam objetos de dominio (com dirty-tracking)
+    _ENTITY_SECTIONS = {
+        "attributes": "_attributes",
+        "actions": "_actions",
+        "parameters": "_parameters",
+        "statuses": "_statuses",
+        "tags": "_tags",
+    }
+
+    def _plain_sections(self):
+        return {
             "score": self.score,
             "value": self._value,
-            "attributes": {
-                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self._attributes.items()
-            },
-            "actions": {
-                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self._actions.items()
-            },
-            "parameters": {
-                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self._parameters.items()
-            },
-            "statuses": {
-                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self._statuses.items()
-            },
             "shop_action_links": self._shop_action_links,
             "shop_entitlements": self._shop_entitlements,
             "shop_item_entitlements": self._shop_item_entitlements,
-            "tags": {
-                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self._tags.items()
-            },
             "action_tags": self._action_tags,
             "param_tags": self._param_tags,
             "logic_types": self.logic_types,
             "sublogic_types": self.sublogic_types,
             "metadata": self.metadata
         }
+
+    def _snapshot_data(self):
+        plain = self._plain_sections()
+        entities = {
+            section: {
+                k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in getattr(self, attr).items()
+            }
+            for section, attr in self._ENTITY_SECTIONS.items()
+        }
+        # Same key order as the original user.json layout
+        order = [
+            "score", "value", "attributes", "actions", "parameters", "statuses",
+            "shop_action_links", "shop_entitlements", "shop_item_entitlements",
+            "tags", "action_tags", "param_tags", "logic_types", "sublogic_types", "metadata",
+        ]
+        merged = {**plain, **entities}
+        return {key: merged[key] for key in order}
+
+    def _attribute_is_stale(self, attr, dirty_actions):
+        """total_score is derived from related actions (and children's actions)."""
+        if not dirty_actions:
+            return False
+        if any(a.id in dirty_actions for a in attr._related_actions):
+            return True
+        return any(
+            a.id in dirty_actions
+            for child in attr._children
+            for a in child._related_actions
+        )
+
+    def _entity_delta(self):
+        """Serializes only new or dirty objects. Returns (sets, dels, encoded)."""
+        dirty_actions = {k for k, a in self._actions.items() if getattr(a, "dirty", True)}
+        sets, dels, encoded = {}, {}, {}
+        for section, attr in self._ENTITY_SECTIONS.items():
+            objects = getattr(self, attr)
+            persisted = self._persisted.get(section) or {}
+            changed = {}
+            changed_encoded = {}
+            for key, obj in objects.items():
+                stale = key not in persisted or getattr(obj, "dirty", True)
+                if not stale and section == "attributes":
+                    stale = self._attribute_is_stale(obj, dirty_actions)
+                if not stale:
+                    continue
+                value = obj.to_dict() if hasattr(obj, 'to_dict') else obj
+                enc = json.dumps(value, sort_keys=True)
+                if persisted.get(key) != enc:
+                    changed[key] = value
+                    changed_encoded[key] = enc
+            removed = [k for k in persisted if k not in objects]
+            if changed:
+                sets[section] = changed
+                encoded[section] = changed_encoded
+            if removed:
+                dels[section] = removed
+        return sets, dels, encoded
+
+    def _mark_clean(self):
+        for attr in self._ENTITY_SECTIONS.values():
+            for obj in getattr(self, attr).values():
+                if hasattr(obj, "mark_clean"):
+                    obj.mark_clean()
+
+    @contextmanager
+    def transaction(self):
+        """Defers save_user() calls to one write at commit; rolls back if an exception escapes."""
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._rollback()
+            raise
+        self._tx_depth -= 1
+        if self._tx_depth == 0 and self._tx_pending:
+            self._tx_pending = False
+            self.save_user()
+
+    def _rollback(self):
+        """Restores the in-memory graph to the last persisted state."""
+        self._tx_pending = False
+        if self._persisted is None or not self._has_unsaved_changes():
+            # e.g. a web prompt interrupting before anything was touched
+            return
+        # Same defaults a fresh load starts from, so keys added in the transaction go away
+        self.metadata = self._default_metadata()
+        self._apply_data(decode_state(self._persisted))
+
+    def _has_unsaved_changes(self):
+        """Whether memory differs from _persisted (dirty/added/removed objects or plain sections)."""
+        for section, attr in self._ENTITY_SECTIONS.items():
+            objects = getattr(self, attr)
+            persisted = self._persisted.get(section) or {}
+            if len(objects) != len(persisted) or any(key not in persisted for key in objects):
+                return True
+            if any(getattr(obj, "dirty", True) for obj in objects.values()):
+                return True
+        delta, _ = diff_state(self._persisted, self._plain_sections())
+        return bool(delta)
+
+    def save_user(self):
+        if self._tx_depth:
+            self._tx_pending = True
+            return
+
+        # Keep score mirrored in metadata for UI consumers
+        self.metadata["score"] = self.score
     
         try:
-            with open(data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            from src.components.services.backup_service import backup_json
-            backup_json(data_file)
+            if self._persisted is None or not self._storage.document_exists("user"):
+                # No snapshot yet: write the full state once
+                data = self._snapshot_data()
+                self._storage.write_document("user", data)
+                self._persisted = encode_state(data)
+                self._index_names(data)
+            else:
+                # Only changed keys are written; clean objects are never serialized
+                delta, plain_encoded = diff_state(self._persisted, self._plain_sections())
+                plain_changed = {section for op in delta.values() for section in op}
+                entity_sets, entity_dels, entity_encoded = self._entity_delta()
+                if entity_sets:
+                    delta.setdefault("set", {}).update(entity_sets)
+                if entity_dels:
+                    delta.setdefault("del", {}).update(entity_dels)
+                if delta:
+                    self._storage.patch_document("user", delta, snapshot=self._snapshot_data)
+                    self._persisted.update(plain_encoded)
+                    for section, changed in entity_encoded.items():
+                        self._persisted.setdefault(section, {}).update(changed)
+                    for section, keys in entity_dels.items():
+                        for k in keys:
+                            self._persisted[section].pop(k, None)
+                    self._index_name_changes(plain_changed, entity_sets, entity_dels)
+            self._mark_clean()
+            self._fingerprint = self._storage.document_fingerprint("user")
             # self.add_message(f"file saved.")
-            self.load_user()
         except Exception as e:
             self.add_message(f"Error saving {e}")
 
+    def load_cache_stats(self):
+        return {"hits": self._load_hits, "misses": self._load_misses}
+
     def load_user(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        # Sobe 2 níveis: user/ -> components/ -> src/
-        src_dir = os.path.dirname(os.path.dirname(base_dir))
-        data_dir = os.path.join(src_dir, "data")
-        data_file = os.path.join(data_dir, "user.json")
+        if self._tx_depth:
+            # Inside a transaction the in-memory state is ahead of the file
+            return
 
-        if not os.path.exists(data_file):
+        if not self._storage.document_exists("user"):
             # self.add_message(f"new save file created.")
             self.save_user() 
             return
-        
-        if os.path.getsize(data_file) == 0:
-            self.add_message("empty save file.")
+
+        # Nothing changed in storage since the last load/save: keep the current graph
+        fingerprint = self._storage.document_fingerprint("user")
+        if self._persisted is not None and fingerprint == self._fingerprint:
+            self._load_hits += 1
+            if self._scheduler is None:
+                self._refresh_parameters()
             return
+        self._load_misses += 1
         
         try:
-            with open(data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            self.add_message("corrupted save file.")
-            return
-        
+            data = self._storage.read_document("user")
+        except CorruptDocument as e:
+            self.add_message(str(e))
+            return
+
+        self._persisted = encode_state(data)
+        self._apply_data(data)
+        self._fingerprint = fingerprint
+
+    def _index_names(self, data):
+        """Re-indexes every autocomplete name of a user.json-shaped dict."""
+        self._name_index.drop_group("user")
+        for section, value in data.items():
+            if section in self._ENTITY_SECTIONS and isinstance(value, dict):
+                for key, entity in value.items():
+                    self._name_index.set_source(("user", section, key), collect_names(entity))
+            else:
+                self._name_index.set_source(("user", section), collect_names(value))
+
+    def _index_name_changes(self, plain_changed, entity_sets, entity_dels):
+        """Applies one save_user delta to the name index."""
+        plain = self._plain_sections()
+        for section in plain_changed:
+            self._name_index.set_source(("user", section), collect_names(plain.get(section)))
+        for section, changed in entity_sets.items():
+            for key, entity in changed.items():
+                self._name_index.set_source(("user", section, key), collect_names(entity))
+        for section, keys in entity_dels.items():
+            for key in keys:
+                self._name_index.drop_source(("user", section, key))
+
+    def _apply_data(self, data):
+        """Rebuilds the object graph from a user.json-shaped dict."""
+        self._index_names(data)
         self._value = data.get("value", 0)
         self.metadata.update(data.get("metadata", {}))
         self._ensure_tutorial_state()
@@ -813,9 +1027,15 @@ class User:
         self._shop_item_entitlements = data.get("shop_item_entitlements", {}) or {}
 
         self._statuses.clear()
+        self._status_index.clear()
+        self._crossings = None
+        # Another process (or a rollback over a job that ran mid-prompt) may have changed time-driven state
+        for name in ("daily_refill", "param_crossings", "status_expiry", "shop_entitlements"):
+            self._schedule_job(name)
         for status_id, status_data in data.get("statuses", {}).items():
             new_status = Status.from_dict(status_data)
             self._statuses[status_id] = new_status
+            self._status_index.add(new_status)
 
         self._tags.clear()
         for tag_id, tag_data in data.get("tags", {}).items():
@@ -823,6 +1043,7 @@ class User:
             self._tags[tag_id] = new_tag
         self._action_tags = data.get("action_tags", {}) or {}
         self._param_tags = data.get("param_tags", {}) or {}
+        self._tag_influence = None
         
         for attr in self._attributes.values():
             if hasattr(attr, 'resolve_related_actions'):
@@ -836,12 +1057,119 @@ class User:
             if hasattr(attr, 'resolve_parent'):
                 attr.resolve_parent(self._attributes)
 
-        for param in self._parameters.values():
-            if param.update_value():
-                self._update_statuses_for_param(param)
+        # Freshly loaded objects match the file
+        self._mark_clean()
+
+        if self._scheduler is None:
+            self._refresh_parameters()
         if hasattr(self, "tutorial"):
             self.tutorial.maybe_show_startup()
 
+    def _refresh_parameters(self, now=None):
+        """Activates linked statuses whose regen threshold crossing is due.
+
+        Parameter values regenerate lazily (computed on read), so nothing is updated
+        here: crossing times are precomputed and each status is activated at the
+        moment its threshold was reached, not at the poll that noticed it.
+        """
+        if self._crossings is None:
+            self._crossings = self._schedule_crossings()
+        crossings = self._crossings
+        if not crossings:
+            return
+        now = now or datetime.now()
+        while crossings and crossings[0][0] <= now:
+            when, _, status = heapq.heappop(crossings)
+            if self._statuses.get(status._id) is not status:
+                continue
+            if when + Status.DURATION_MAP[status._duration_type] <= now:
+                # Crossed while nobody was looking and already over
+                continue
+            # Activations only move forward, so a crossing already applied is skipped
+            if not status.is_active(when):
+                status.activate(when)
+                self._schedule_job("status_expiry", status.active_until)
+        self._crossings_until = max(self._crossings_until or now, now)
+
+    def _schedule_crossings(self):
+        crossings = []
+        for param in self._parameters.values():
+            if param.regen_rate <= 0:
+                continue
+            for threshold, status in self._status_index.above(param._id, param._value):
+                when = param.crossing_time(threshold)
+                if when is None:
+                    # Above the clamp: never reached, nor is anything higher
+                    break
+                if self._crossings_until is None or when > self._crossings_until:
+                    crossings.append((when, len(crossings), status))
+        heapq.heapify(crossings)
+        return crossings
+
+    def _invalidate_crossings(self):
+        self._crossings = None
+        self._schedule_job("param_crossings")
+
+    # ---- scheduler jobs: each returns its next due time (None = idle until woken) ----
+
+    def register_jobs(self, scheduler):
+        """Hands the user's time-driven state to the scheduler (all due now)."""
+        self._scheduler = scheduler
+        now = datetime.now()
+        scheduler.register("daily_refill", self._refill_job, due=now)
+        scheduler.register("param_crossings", self._crossings_job, due=now)
+        scheduler.register("status_expiry", self._status_expiry_job, due=now)
+        scheduler.register("shop_entitlements", self._entitlement_job, due=now)
+
+    def _schedule_job(self, name, due=None):
+        if self._scheduler is not None:
+            self._scheduler.schedule(name, due or datetime.now())
+
+    def _refill_job(self, now):
+        self.refill_daily_tokens(now)
+        return next_midnight(now)
+
+    def _crossings_job(self, now):
+        self.load_user()
+        self._refresh_parameters(now)
+        return self._crossings[0][0] if self._crossings else None
+
+    def _status_expiry_job(self, now):
+        self.load_user()
+        expired = [s for s in self._statuses.values() if s.active_until and not s.is_active(now)]
+        for status in expired:
+            status.clean()
+            self.add_message(f"status {status._name} ({status._id}) expired.")
+        if expired:
+            self.save_user()
+        upcoming = [s.active_until for s in self._statuses.values() if s.active_until]
+        return min(upcoming) if upcoming else None
+
+    def _entitlement_job(self, now):
+        """Drops expired shop entitlements (telling the user) and waits for the next expiry."""
+        self.load_user()
+        upcoming = []
+        expired_items = []
+        changed = False
+        for store in (self._shop_item_entitlements, self._shop_entitlements):
+            for key, expiry_str in list(store.items()):
+                try:
+                    expiry = datetime.fromisoformat(expiry_str)
+                except Exception:
+                    continue
+                if now <= expiry:
+                    upcoming.append(expiry)
+                    continue
+                del store[key]
+                changed = True
+                if store is self._shop_item_entitlements:
+                    expired_items.append(key)
+        for item_id in expired_items:
+            self.add_message(f"shop item {item_id} access expired.")
+        if changed:
+            self.save_user()
+        return min(upcoming) if upcoming else None
+
     def _ensure_tutorial_state(self):
         tutorial = self.metadata.get("tutorial")
         if not isinstance(tutorial, dict):
@@ -905,6 +1233,7 @@ class User:
             linked = self._normalize_shop_item_id(linked_item)
             if linked == norm_item_id:
                 self._shop_entitlements[action_id] = expiry_str
+        self._schedule_job("shop_entitlements", expiry)
 
     def _get_item_entitlement_from_actions(self, norm_item_id, now=None):
         """Fallback for legacy data where only action entitlements exist."""
@@ -1110,6 +1439,7 @@ class User:
             new_id = f"40{nextid}" if nextid < 10 else f"4{nextid}"
             status = Status(new_id, name, duration_type)
             self._statuses[new_id] = status
+            self._status_index.add(status)
             self.add_message(f"status '{name}' created with ID {new_id}")
             self.save_user()
         except Exception as e:
@@ -1256,6 +1586,7 @@ class User:
             value = max(0.0, min(100.0, value))
 
         status.add_param_link(param_id, value)
+        self._invalidate_crossings()
         self.add_message(f"{status._name} -> {param._name} ({value})")
         self.save_user()
 
@@ -1357,6 +1688,8 @@ class User:
                 self.add_message("Invalid start value.")
                 return {"prompt": "parameter start value", "type": "numeric", "options": {"param_step": "start_value", "param_id": param_id, "regen_type": data.get("regen_type"), "regen_factor": data.get("regen_factor")}}
             param.set_regen(data.get("regen_type"), data.get("regen_factor"), start_value)
+            self._invalidate_crossings()
+            self._update_statuses_for_param(param)
             self.add_message(f"Parameter {param._name} ({param._id}) initialized.")
             self.save_user()
             return None
@@ -1532,8 +1865,10 @@ class User:
                 try:
                     tval = int(type_raw)
                     if tval in Parameter.VALUE_TYPES:
+                        value = param.value
                         param._value_type = tval
-                        param.set_value(param._value)
+                        param.set_value(value)
+                        self._invalidate_crossings()
                 except Exception:
                     pass
             if logic_raw:
@@ -1669,6 +2004,7 @@ class User:
         tags = [t for t in self._action_tags.get(action_id, []) if t.get("tag_id") != tag_id]
         tags.append({"tag_id": tag_id, "weight": weight})
         self._action_tags[action_id] = tags
+        self._tag_influence = None
         self.add_message(f"Tag {tag_id} linked to Action {action_id} ({weight}).")
         self.save_user()
 
@@ -1676,12 +2012,13 @@ class User:
         tags = [t for t in self._param_tags.get(param_id, []) if t.get("tag_id") != tag_id]
         tags.append({"tag_id": tag_id, "weight": weight})
         self._param_tags[param_id] = tags
+        self._tag_influence = None
         self.add_message(f"Tag {tag_id} linked to Param {param_id} ({weight}).")
         self.save_user()
 
     def _apply_tag_effects(self, action, value_difference):
-        action_tags = self._action_tags.get(action.id, [])
-        if not action_tags:
+        influences = self._tag_influence_table().get(action.id)
+        if not influences:
             return
         unit_map = {
             0: 3.0,  # session
@@ -1696,55 +2033,70 @@ class User:
         base_percent = 3.0
         base_mark = 1.5
 
-        # Preindex action tag weights by tag_id
-        action_tag_map = {}
-        for t in action_tags:
-            tid = t.get("tag_id")
-            try:
-                w = int(t.get("weight"))
-            except Exception:
-                w = 0
-            if tid:
-                action_tag_map[tid] = action_tag_map.get(tid, 0) + w
-
-        for param_id, param in self._parameters.items():
-            param_tags = self._param_tags.get(param_id, [])
-            if not param_tags:
+        # Only the parameters this action's tags reach
+        for param_id, coeff in influences:
+            param = self._parameters.get(param_id)
+            if param is None:
                 continue
-            delta_total = 0.0
-            for pt in param_tags:
-                tid = pt.get("tag_id")
-                if tid not in action_tag_map:
-                    continue
-                try:
-                    pw = int(pt.get("weight"))
-                except Exception:
-                    pw = 0
-                aw = action_tag_map.get(tid, 0)
-                if aw == 0 or pw == 0:
-                    continue
-                base_value = base_mark if param._value_type == 1 else base_percent
-                delta_total += value_difference * unit_factor * aw * pw * base_value
+            base_value = base_mark if param._value_type == 1 else base_percent
+            delta_total = value_difference * unit_factor * coeff * base_value
             if delta_total != 0:
-                param.set_value(param._value + delta_total)
+                param.set_value(param.value + delta_total)
+                self._invalidate_crossings()
                 self._update_statuses_for_param(param)
         self.save_user()
 
-    def _update_statuses_for_param(self, param):
-        from datetime import datetime
-        now = datetime.now()
-        for status in self._statuses.values():
-            links = getattr(status, "_param_links", [])
+    def _tag_influence_table(self):
+        """action_id -> [(param_id, coeff)], coeff = sum of action weight * param weight per shared tag.
+
+        Derived from _action_tags/_param_tags; whoever changes those sets
+        self._tag_influence = None and the table is rebuilt on the next act.
+        """
+        if self._tag_influence is not None:
+            return self._tag_influence
+
+        def weight(link):
+            try:
+                return int(link.get("weight"))
+            except Exception:
+                return 0
+
+        # tag_id -> [(param_id, param weight)]
+        params_by_tag = {}
+        for param_id, links in self._param_tags.items():
             for link in links:
-                if link.get("param_id") != param._id:
-                    continue
-                try:
-                    target = float(link.get("value"))
-                except Exception:
+                pw = weight(link)
+                if link.get("tag_id") and pw:
+                    params_by_tag.setdefault(link.get("tag_id"), []).append((param_id, pw))
+
+        table = {}
+        for action_id, links in self._action_tags.items():
+            action_weights = {}
+            for link in links:
+                tid = link.get("tag_id")
+                if tid:
+                    action_weights[tid] = action_weights.get(tid, 0) + weight(link)
+            coeffs = {}
+            for tid, aw in action_weights.items():
+                if not aw:
                     continue
-                if param._value >= target:
-                    if not status.is_active(now):
-                        status.activate(now)
+                for param_id, pw in params_by_tag.get(tid, ()):
+                    coeffs[param_id] = coeffs.get(param_id, 0) + aw * pw
+            influences = [(param_id, coeff) for param_id, coeff in coeffs.items() if coeff]
+            if influences:
+                table[action_id] = influences
+        self._tag_influence = table
+        return table
+
+    def _update_statuses_for_param(self, param):
+        reached = self._status_index.reached(param._id, param.value)
+        if not reached:
+            return
+        now = datetime.now()
+        for status in reached:
+            if not status.is_active(now):
+                status.activate(now)
+                self._schedule_job("status_expiry", status.active_until)
     
     def list_attributes(self):
         if self._attributes:
@@ -1841,7 +2193,7 @@ class User:
                 name = self._tags.get(tid)._name if tid in self._tags else tid
                 tag_list.append(f"{name}({weight})")
             tags_str = ", ".join(tag_list) if tag_list else "-"
-            val = param._value
+            val = param.value
             items.append(
                 f"({param._id}) {param._name} | "
                 f"{Parameter.VALUE_TYPES.get(param._value_type)} / {Parameter.LOGIC_TYPES.get(param._logic_type)} | "
@@ -1899,7 +2251,10 @@ class User:
 
     def show_user_info(self):
         from src.components.services.UI.interface import ui
+        from src.components.services.backup_service import backup_worker
         meta = self.metadata
+        backup = backup_worker.stats()
+        sync = journal_service.sync_stats()
         items = [
             f"score: {self.score:.2f}",
             f"total_points: {self.total_points:.2f}",
@@ -1913,53 +2268,34 @@ class User:
             f"parameters: {len(self._parameters)}",
             f"statuses: {len(self._statuses)}",
             f"tags: {len(self._tags)}",
+            f"load cache: {self._load_hits} hits / {self._load_misses} misses",
+            f"backups: {backup['queue_depth']} queued, lag {backup['lag_seconds']}s "
+            f"({backup['copied']} copied / {backup['skipped']} unchanged)"
+            + (f", {backup['errors']} errors ({backup['last_error']})" if backup['errors'] else ""),
+            f"git sync: {'pending' if sync['pending'] else 'idle'}, {sync['attempts']} failed attempts"
+            + (f", retry in {sync['retry_in_seconds']}s ({sync['last_error']})" if sync['last_error'] else ""),
+            "last sync: " + (", ".join(
+                f"{phase} {value}" if isinstance(value, str) else f"{phase} {value * 1000:.0f}ms"
+                for phase, value in sync['last_timings'].items()
+            ) or "-"),
+            "scheduled: " + (", ".join(
+                f"{name} {due.strftime('%d/%m %H:%M:%S')}"
+                for name, due in (self._scheduler.pending().items() if self._scheduler else ())
+            ) or "-"),
         ]
         ui.show_list(items, "USER INFO")
 
 
     def _collect_autocomplete_names(self):
-        import json
-        import os
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        src_dir = os.path.dirname(os.path.dirname(base_dir))
-        data_dir = os.path.join(src_dir, "data")
-        results = set()
-
-        for root, _, files in os.walk(data_dir):
-            for fname in files:
-                if not fname.endswith(".json"):
-                    continue
-                path = os.path.join(root, fname)
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                except Exception:
-                    continue
-
-                def _walk(obj):
-                    if isinstance(obj, dict):
-                        name = obj.get("name")
-                        if isinstance(name, str) and name.strip():
-                            results.add(name.strip())
-                        for v in obj.values():
-                            _walk(v)
-                    elif isinstance(obj, list):
-                        for v in obj:
-                            _walk(v)
-
-                _walk(data)
-
-        return sorted(results)
+        return list(self._name_index.names())
 
     def list_parameters(self):
         if self._parameters:
             from src.components.services.UI.interface import ui
-            for param in self._parameters.values():
-                if param.update_value():
-                    self._update_statuses_for_param(param)
+            self._refresh_parameters()
             items = []
             for param in self._parameters.values():
-                val = int(round(param._value))
+                val = int(round(param.value))
                 if param._value_type == 2:
                     items.append(f"({param._id}) - {param._name} = {val}%")
                 else:
@@ -1982,6 +2318,10 @@ class User:
         from src.components.services.UI.interface import ui
         if ui.ask_confirmation("This will PERMANENTLY DELETE ALL ACTIONS."):
             self._actions.clear()
+            # In-memory graph is the source of truth, so drop links to the removed actions
+            for attr in self._attributes.values():
+                if attr._related_actions:
+                    attr._related_actions = []
             self.add_message("actions deleted.")
             self.save_user()
         else:
@@ -1991,6 +2331,7 @@ class User:
         from src.components.services.UI.interface import ui
         if ui.ask_confirmation("This will PERMANENTLY DELETE ALL PARAMETERS."):
             self._parameters.clear()
+            self._invalidate_crossings()
             self.add_message("parameters deleted.")
             self.save_user()
         else:
@@ -2017,6 +2358,11 @@ class User:
             return
 
         self._attributes.pop(payload_id, None)
+        for other in self._attributes.values():
+            if attr in other._children:
+                other._children = [c for c in other._children if c is not attr]
+            if attr in other._parent:
+                other._parent = [p for p in other._parent if p is not attr]
         self.add_message(f"Attribute {attr._name} ({attr._id}) deleted.")
         self.save_user()
 
@@ -2072,6 +2418,8 @@ class User:
             return
 
         self._statuses.pop(payload_id, None)
+        self._status_index.remove(status)
+        self._invalidate_crossings()
         self.add_message(f"Status {status._name} ({status._id}) deleted.")
         self.save_user()
 
@@ -2100,6 +2448,7 @@ class User:
             return
 
         self._parameters.pop(payload_id, None)
+        self._invalidate_crossings()
         self.add_message(f"Parameter {param._name} ({param._id}) deleted.")
         self.save_user()
 
@@ -2140,6 +2489,7 @@ class User:
                 self._param_tags[param_id] = new_links
             else:
                 self._param_tags.pop(param_id, None)
+        self._tag_influence = None
 
         self.add_message(f"Tag {tag._name} ({tag._id}) deleted.")
         self.save_user()